@@ -19,7 +19,7 @@ class Test_audit_virtuals:
 
     # extract all virtual server configurations
     CONFIG_DATA = [
-        conf for conf in bigip_conf.tabular_kv if conf.get("path") == "ltm virtual"
+        conf._asdict() for conf in bigip_conf.by_path("ltm virtual")
     ]
 
     @pytest.mark.parametrize(
@@ -96,7 +96,7 @@ class Test_audit_clientssl:
 
     # extract all clientssl profile configurations
     CONFIG_DATA = [
-        conf for conf in bigip_conf.tabular_kv if conf.get("path") == "ltm profile client-ssl"
+        conf._asdict() for conf in bigip_conf.by_path("ltm profile client-ssl")
     ]
 
     def test_chain_is_set(self):
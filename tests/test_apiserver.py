@@ -6,7 +6,8 @@
 import pytest  # pylint: disable=unused-import
 from fastapi.testclient import TestClient
 
-from tmconfpy.apiserver import app
+from tmconfpy.apiserver import PARSE_CACHE, app
+from tmconfpy.parser import Parser
 
 
 def test_fileparser():
@@ -103,3 +104,74 @@ class Test_Parser:
             response.text
             == r'{"path": "ltm profile imap", "name": "imap", "object": {"activation-mode": "require"}}'
         )
+
+    @staticmethod
+    def test_include_exclude():
+        """Test parser endpoint with include and exclude"""
+        client = TestClient(app)
+        response = client.post(
+            "/parser/",
+            content=open("./example/test.tmconf", "rb").read(),
+            headers={"Content-Type": "text/plain"},
+            params={
+                "include": ["ltm cipher rule", "sys snmp"],
+                "exclude": "*-quic",
+            },
+        )
+        assert response.status_code == 200
+        assert (
+            response.json()
+            == Parser(
+                "./example/test.tmconf",
+                is_filepath=True,
+                include=["ltm cipher rule", "sys snmp"],
+                exclude="*-quic",
+            ).dict
+        )
+        assert "sys snmp" in response.json()
+        assert "ltm cipher rule /Common/f5-quic" not in response.json()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "response_format, expected",
+        [
+            ("object", '{"ltm a /Common/ü":{"description":"€-ü"}}'),
+            ("tabular", '[["ltm a","/Common/ü",{"description":"€-ü"}]]'),
+            (
+                "tabular_kv",
+                '[{"path":"ltm a","name":"/Common/ü","object":{"description":"€-ü"}}]',
+            ),
+            (
+                "jsonl",
+                '{"path": "ltm a", "name": "/Common/\\u00fc", "object": {"description": "\\u20ac-\\u00fc"}}',
+            ),
+        ],
+    )
+    def test_response_body(response_format, expected):
+        """Test the JSON in the response body is compact and doesn't escape non-ASCII characters, like JSONResponse"""
+        client = TestClient(app)
+        response = client.post(
+            "/parser/",
+            content="ltm a /Common/ü {\n    description €-ü\n}\n".encode(),
+            headers={"Content-Type": "text/plain"},
+            params={"response_format": response_format},
+        )
+        assert response.status_code == 200
+        assert response.content == expected.encode()
+
+
+def test_parse_cache():
+    """Test parse results are cached"""
+    PARSE_CACHE.clear()
+    client = TestClient(app)
+    for _ in range(2):
+        response = client.post(
+            "/parser/",
+            content=open("./example/imap.tmconf", "rb").read(),
+            headers={"Content-Type": "text/plain"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "ltm profile imap imap": {"activation-mode": "require"}
+        }
+    assert len(PARSE_CACHE) == 1
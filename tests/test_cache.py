@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Test ParseCache"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import io
+import json
+import os
+import sys
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy import __projectname__
+from tmconfpy.cache import ParseCache
+from tmconfpy.cli import cli
+from tmconfpy.parser import Parser
+
+TMCONF = "ltm profile imap imap {\n    activation-mode require\n    b { z a }\n}\n"
+
+
+class TestParseCache:
+    @staticmethod
+    def test_lru():
+        cache = ParseCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        assert cache.get("a") == "1"
+        cache.put("c", "3")
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    @staticmethod
+    def test_max_bytes():
+        cache = ParseCache(maxsize=10, max_bytes=5)
+        cache.put("a", "123")
+        cache.put("b", "456")
+        assert "a" not in cache
+        assert cache.get("b") == "456"
+        cache.put("c", "123456")
+        assert "c" not in cache
+
+    @staticmethod
+    def test_disk(tmp_path):
+        directory = str(tmp_path / "cache")
+        ParseCache(directory=directory).put("a", '{"ä": 1}')
+        cache = ParseCache(directory=directory)
+        assert len(cache) == 0
+        assert "a" in cache
+        assert cache.get("a") == '{"ä": 1}'
+        assert len(cache) == 1
+        cache.clear()
+        assert "a" not in cache
+        assert os.listdir(directory) == []
+
+    @staticmethod
+    def test_disk_eviction(tmp_path):
+        cache = ParseCache(maxsize=0, directory=str(tmp_path), max_disk_bytes=10)
+        cache.put("a", "12345")
+        os.utime(tmp_path / "a.json", ns=(1, 1))
+        cache.put("b", "12345")
+        os.utime(tmp_path / "b.json", ns=(2, 2))
+        assert cache.get("a") == "12345"
+        cache.put("c", "12345")
+        assert sorted(os.listdir(tmp_path)) == ["a.json", "c.json"]
+
+
+class TestParserCache:
+    @staticmethod
+    def test_hit(mocker):
+        cache = ParseCache()
+        parsed = Parser(TMCONF, cache=cache)
+        assert len(cache) == 1
+        parse = mocker.spy(Parser, "_parse_tmconf_stream")
+        cached = Parser(TMCONF, cache=cache)
+        assert parse.call_count == 0
+        assert cached.dict == parsed.dict
+        assert cached.json == parsed.json
+        cached.dict["ltm profile imap imap"]["activation-mode"] = "changed"
+        assert Parser(TMCONF, cache=cache).dict == parsed.dict
+
+    @staticmethod
+    def test_options():
+        cache = ParseCache()
+        Parser(TMCONF, cache=cache)
+        assert (
+            Parser(TMCONF, cache=cache, sort=True).dict
+            == Parser(TMCONF, sort=True).dict
+        )
+        Parser(TMCONF.encode(), cache=cache)
+        assert len(cache) == 3
+
+    @staticmethod
+    def test_inputs(tmp_path):
+        cache = ParseCache()
+        file_path = tmp_path / "imap.tmconf"
+        file_path.write_text(TMCONF)
+        expected = Parser(TMCONF).dict
+        assert Parser(str(file_path), is_filepath=True, cache=cache).dict == expected
+        assert Parser(TMCONF.encode(), cache=cache).dict == expected
+        file = io.BytesIO(TMCONF.encode())
+        assert Parser(file, cache=cache).dict == expected
+        assert len(cache) == 1
+        file = io.BufferedReader(io.BytesIO(TMCONF.encode()))
+        file.seekable = lambda: False
+        assert Parser(file, cache=ParseCache()).dict == expected
+
+    @staticmethod
+    def test_lazy():
+        with pytest.raises(ValueError, match="can not be combined with a cache"):
+            Parser(TMCONF, lazy=True, cache=ParseCache())
+
+
+def test_cli_cache_dir(monkeypatch, capfd, tmp_path):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [__projectname__, "--cache-dir", str(tmp_path), "./example/imap.tmconf"],
+    )
+    cli()
+    cli_output, _ = capfd.readouterr()
+    assert len(os.listdir(tmp_path)) == 1
+    cli()
+    assert capfd.readouterr()[0] == cli_output
+    assert json.loads(cli_output) == {
+        "ltm profile imap imap": {"activation-mode": "require"}
+    }
@@ -9,6 +9,8 @@ import pytest  # pylint: disable=unused-import
 
 from tmconfpy import __projectname__
 from tmconfpy.cli import cli
+from tmconfpy.diff import compare
+from tmconfpy.parser import Parser
 
 
 class TestCLI:
@@ -128,3 +130,198 @@ class TestCLI:
             cli_output.rstrip()
             == r'{"path": "ltm profile imap", "name": "imap", "object": {"activation-mode": "require"}}'
         )
+
+    @staticmethod
+    def test_format_jsonl_duplicates(monkeypatch, capfd, tmp_path):
+        """Test CLI with jsonl format writes each object name once, regardless of --sort and --cache-dir."""
+        file_path = tmp_path / "duplicates.tmconf"
+        file_path.write_text(
+            "ltm node /Common/n1 {\n    address 10.0.0.1\n}\nltm node /Common/n1 {\n    address 10.0.0.2\n}\n"
+        )
+        expected = '{"path": "ltm node", "name": "/Common/n1", "object": {"address": "10.0.0.2"}}\n'
+        for options in [[], ["--sort"], ["--cache-dir", str(tmp_path / "cache")]]:
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                [__projectname__, str(file_path), "--format", "jsonl", *options],
+            )
+            cli()
+            cli_output, _ = capfd.readouterr()
+            assert cli_output.rstrip("\n") + "\n" == expected
+
+    @staticmethod
+    def test_stream(monkeypatch, capfd, mocker, tmp_path):
+        """Test CLI with --stream writes objects as they are parsed, once per occurrence."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "./example/test.tmconf",
+                "--format",
+                "jsonl",
+                "--stream",
+            ],
+        )
+        stream_jsonl = mocker.spy(Parser, "stream_jsonl")
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert stream_jsonl.call_count == 1
+        assert cli_output == Parser("./example/test.tmconf", is_filepath=True).jsonl
+        file_path = tmp_path / "duplicates.tmconf"
+        file_path.write_text("ltm a a {\n    x 1\n}\nltm a a {\n    x 2\n}\n")
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [__projectname__, str(file_path), "--format", "jsonl", "--stream"],
+        )
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert len(cli_output.splitlines()) == 2
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "options", [[], ["--format", "jsonl", "--sort"], ["--format", "object"]]
+    )
+    def test_stream_invalid(monkeypatch, capfd, options):
+        """Test CLI with --stream and unsupported options."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [__projectname__, "./example/imap.tmconf", "--stream", *options],
+        )
+        with pytest.raises(SystemExit):
+            cli()
+        _, cli_error = capfd.readouterr()
+        assert "--stream requires --format jsonl" in cli_error
+
+    @staticmethod
+    def test_mmap(monkeypatch, capfd):
+        """Test CLI with --mmap."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "--mmap",
+                "./example/imap.tmconf",
+            ],
+        )
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert json.loads(cli_output.rstrip()) == json.loads(
+            open("./example/imap.tmconf.json", "rb").read().decode().rstrip()
+        )
+
+    @staticmethod
+    def test_filepath_blank(monkeypatch, capfd, tmp_path):
+        """Test CLI with a file containing whitespace only."""
+        file_path = tmp_path / "blank.tmconf"
+        file_path.write_bytes(b"\n  \r\n\n")
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                str(file_path),
+            ],
+        )
+        with pytest.raises(SystemExit):
+            cli()
+        _, cli_error = capfd.readouterr()
+        assert (
+            cli_error.rstrip()
+            == "No file_path given or input is empty. Use -h|--help for help."
+        )
+
+    @staticmethod
+    def test_include_exclude(monkeypatch, capfd):
+        """Test CLI with --include and --exclude."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "./example/test.tmconf",
+                "--include",
+                "ltm cipher",
+                "--include",
+                "sys snmp",
+                "--exclude",
+                "ltm cipher group",
+            ],
+        )
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert (
+            json.loads(cli_output)
+            == Parser(
+                "./example/test.tmconf",
+                is_filepath=True,
+                include=["ltm cipher", "sys snmp"],
+                exclude="ltm cipher group",
+            ).dict
+        )
+        assert "sys snmp" in json.loads(cli_output)
+
+
+class TestCLIDiff:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "output_format", ["object", "tabular", "tabular_kv", "jsonl", "patch"]
+    )
+    def test_diff(monkeypatch, capfd, output_format):
+        """Test CLI diff subcommand with each format."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "diff",
+                "./example/imap.tmconf",
+                "./example/pop3.tmconf",
+                "--format",
+                output_format,
+            ],
+        )
+        with pytest.raises(SystemExit) as exit_info:
+            cli()
+        assert exit_info.value.code == 1
+        cli_output, _ = capfd.readouterr()
+        difference = compare(
+            Parser("./example/imap.tmconf", is_filepath=True),
+            Parser("./example/pop3.tmconf", is_filepath=True),
+        )
+        if output_format == "jsonl":
+            assert [json.loads(line) for line in cli_output.split("\n")] == (
+                difference.tabular_kv
+            )
+        else:
+            assert (
+                json.loads(cli_output)
+                == {
+                    "object": difference.to_dict(),
+                    "tabular": [list(entry) for entry in difference.tabular],
+                    "tabular_kv": difference.tabular_kv,
+                    "patch": difference.to_json_patch(),
+                }[output_format]
+            )
+
+    @staticmethod
+    def test_diff_identical(monkeypatch, capfd):
+        """Test CLI diff subcommand exits with 0 if the files don't differ."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "diff",
+                "./example/bigip.conf",
+                "./example/bigip.conf",
+                "--format",
+                "patch",
+            ],
+        )
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert json.loads(cli_output) == []
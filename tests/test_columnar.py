@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Test ColumnarTmconf"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import json
+import sys
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy.parser import ColumnarTmconf, Parser
+
+TMCONF = "ltm pool a {\n    x 1\n}\nltm virtual v {\n    y { 2 }\n}\nltm pool b {\n    x 2\n}\nsys global-settings {\n    z 3\n}\n"
+
+
+class TestColumnarTmconf:
+    @staticmethod
+    def test_columns():
+        columnar = Parser(TMCONF).columnar
+        assert isinstance(columnar, ColumnarTmconf)
+        assert columnar.paths == ["ltm pool", "ltm virtual", "sys"]
+        assert list(columnar.path_codes) == [0, 1, 0, 2]
+        assert columnar.names == ["a", "v", "b", "global-settings"]
+        assert columnar.objects[1] == {"y": ["2"]}
+        assert len(columnar) == 4
+        assert repr(columnar) == "ColumnarTmconf(4 objects, 3 paths)"
+
+    @staticmethod
+    @pytest.mark.parametrize("file_path", ["example/bigip.conf", "example/test.tmconf"])
+    def test_matches_tabular(file_path):
+        parser = Parser(file_path, is_filepath=True)
+        assert list(parser.columnar) == parser.tabular
+        assert parser.columnar[3] == parser.tabular[3]
+        assert parser.columnar.to_pydict() == {
+            "path": [entry.path for entry in parser.tabular],
+            "name": [entry.name for entry in parser.tabular],
+            "object": [entry.object for entry in parser.tabular],
+        }
+
+    @staticmethod
+    def test_count_and_group_by_path():
+        columnar = Parser(TMCONF).columnar
+        assert columnar.count_by_path() == {"ltm pool": 2, "ltm virtual": 1, "sys": 1}
+        assert columnar.group_by_path() == {
+            "ltm pool": [0, 2],
+            "ltm virtual": [1],
+            "sys": [3],
+        }
+
+    @staticmethod
+    def test_filter():
+        columnar = Parser(TMCONF).columnar
+        pools = columnar.filter(path="ltm pool")
+        assert pools.names == ["a", "b"]
+        assert pools.paths is columnar.paths
+        assert pools.count_by_path() == {"ltm pool": 2}
+        assert pools.group_by_path() == {"ltm pool": [0, 1]}
+        assert columnar.filter(path="ltm pool", name="b").objects == [{"x": "2"}]
+        assert columnar.filter(name="v").names == ["v"]
+        assert len(columnar.filter(path="ltm rule")) == 0
+        assert len(columnar.filter()) == 4
+        assert columnar.take([3, 0]).names == ["global-settings", "a"]
+
+    @staticmethod
+    def test_lazy():
+        columnar = Parser(TMCONF, lazy=True).columnar
+        assert list(columnar) == Parser(TMCONF).tabular
+
+    @staticmethod
+    def test_to_arrow(tmp_path):
+        pyarrow = pytest.importorskip("pyarrow")
+        parquet = pytest.importorskip("pyarrow.parquet")
+        columnar = Parser(TMCONF).columnar
+        table = columnar.to_arrow()
+        assert pyarrow.types.is_dictionary(table.schema.field("path").type)
+        assert table.column("path").to_pylist() == columnar.to_pydict()["path"]
+        assert table.column("name").to_pylist() == columnar.names
+        assert [json.loads(obj) for obj in table.column("object").to_pylist()] == (
+            columnar.objects
+        )
+        columnar.to_parquet(tmp_path / "tmconf.parquet")
+        assert parquet.read_table(tmp_path / "tmconf.parquet").equals(table)
+
+    @staticmethod
+    def test_without_pyarrow(monkeypatch, tmp_path):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        columnar = Parser(TMCONF).columnar
+        with pytest.raises(ModuleNotFoundError, match="requires pyarrow"):
+            columnar.to_arrow()
+        with pytest.raises(ModuleNotFoundError, match="requires pyarrow"):
+            columnar.to_parquet(tmp_path / "tmconf.parquet")
+        assert columnar.to_pydict()["path"][:2] == ["ltm pool", "ltm virtual"]
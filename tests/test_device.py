@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Test tmconfpy.device"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import gzip
+import io
+import logging
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy.device import Device
+from tmconfpy.parser import Parser
+
+FILES = {
+    "bigip_base.conf": "net vlan /Common/internal {\n    tag 4094\n}\nnet self /Common/self_internal {\n    vlan /Common/internal\n}\n",
+    "bigip.conf": "ltm pool /Common/pool_app1 {\n    members {\n        /Common/10.0.0.1:80 { }\n    }\n}\nltm virtual /Common/vs_app1 {\n    pool /Common/pool_app1\n}\n",
+    "bigip_gtm.conf": "gtm pool a /Common/gslb_pool {\n    members {\n        /Common/server:/Common/vs_app1 { }\n    }\n}\n",
+    "partitions/Tenant/bigip.conf": "ltm virtual /Tenant/vs_app1 {\n    pool /Common/pool_app1\n}\nltm pool /Common/pool_app1 {\n    description tenant\n}\n",
+    "partitions/Tenant/bigip_base.conf": "net vlan /Tenant/external {\n    tag 100\n}\n",
+    "partitions/Other/bigip.conf": "ltm node /Other/10.0.0.2 {\n    address 10.0.0.2\n}\n",
+}
+
+
+@pytest.fixture(name="config")
+def fixture_config(tmp_path):
+    for file, tmconf in FILES.items():
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(tmconf)
+    # not a tmconf file of the device
+    (tmp_path / "bigip_script.conf").write_text("ltm a a {\n    x 1\n}\n")
+    return tmp_path
+
+
+def test_find_files(config):
+    assert Device.find_files(str(config)) == [
+        "bigip_base.conf",
+        "bigip.conf",
+        "bigip_gtm.conf",
+        "partitions/Other/bigip.conf",
+        "partitions/Tenant/bigip_base.conf",
+        "partitions/Tenant/bigip.conf",
+    ]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"workers": 1}, {"workers": 2}, {"executor": ThreadPoolExecutor(2)}],
+)
+def test_device(config, options):
+    device = Device(str(config), **options)
+    expected: dict = {}
+    for file in device.files:
+        expected.update(Parser(str(config / file), is_filepath=True).dict)
+    assert list(device.dict.items()) == list(expected.items())
+    assert len(device) == 8
+    assert device.sources["net vlan /Tenant/external"] == (
+        "partitions/Tenant/bigip_base.conf"
+    )
+    assert device.sources["ltm virtual /Common/vs_app1"] == "bigip.conf"
+    assert "ltm a a" not in device.dict
+    assert repr(device) == f"Device('{config}', 6 files, 8 objects, 1 duplicates)"
+
+
+def test_duplicates(config, caplog):
+    (config / "bigip.conf").write_text(
+        FILES["bigip.conf"] + "ltm pool /Common/pool_app1 {\n    description again\n}\n"
+    )
+    with caplog.at_level(logging.WARNING):
+        device = Device(str(config))
+    assert device.duplicates == {
+        "ltm pool /Common/pool_app1": [
+            "bigip.conf",
+            "bigip.conf",
+            "partitions/Tenant/bigip.conf",
+        ]
+    }
+    # the last definition is kept
+    assert device.dict["ltm pool /Common/pool_app1"] == {"description": "tenant"}
+    assert device.sources["ltm pool /Common/pool_app1"] == (
+        "partitions/Tenant/bigip.conf"
+    )
+    assert "ltm pool /Common/pool_app1" not in device.by_file("bigip.conf")
+    assert "'ltm pool /Common/pool_app1' is defined more than once" in caplog.text
+
+
+def test_options(config):
+    device = Device(
+        str(config),
+        files=["bigip.conf", "bigip_gtm.conf"],
+        workers=2,
+        sort=True,
+        include="ltm",
+    )
+    assert device.files == ["bigip.conf", "bigip_gtm.conf"]
+    assert (
+        device.dict
+        == Parser(str(config / "bigip.conf"), is_filepath=True, sort=True).dict
+    )
+    assert list(device.dict) == sorted(device.dict)
+    assert device.by_file("bigip_gtm.conf") == {}
+
+
+def test_invalid(tmp_path):
+    with pytest.raises(FileNotFoundError, match="No tmconf files found"):
+        Device(str(tmp_path))
+    with pytest.raises(ValueError, match="workers must be 1 or greater"):
+        Device(str(tmp_path), workers=0)
+
+
+class TestArchives:
+    @staticmethod
+    def create_ucs(config, file, mode="w:gz"):
+        with tarfile.open(fileobj=file, mode=mode) as tar:
+            # members of the UCS which are not tmconf files
+            tar.add(config / "bigip_script.conf", "config/bigip_script.conf")
+            tar.addfile(tarfile.TarInfo("./config/partitions/Tenant"))
+            for name in reversed(list(FILES)):
+                tar.add(config / name, f"./config/{name}")
+            tar.add(config / "bigip.conf", "var/tmp/bigip.conf")
+        file.seek(0)
+        return file
+
+    @pytest.mark.parametrize("mode", ["w:gz", "w"])
+    def test_from_ucs(self, config, mode):
+        ucs = self.create_ucs(config, io.BytesIO(), mode)
+        device = Device.from_ucs(ucs)
+        expected = Device(str(config))
+        assert device.files == expected.files
+        assert list(device.dict.items()) == list(expected.dict.items())
+        assert device.sources == expected.sources
+        assert device.duplicates == expected.duplicates
+        assert device.directory == "<stream>"
+
+    def test_from_ucs_path(self, config, tmp_path):
+        with open(tmp_path / "backup.ucs", "wb") as file:
+            self.create_ucs(config, file)
+        device = Device.from_ucs(str(tmp_path / "backup.ucs"), sort=True, include="net")
+        assert device.dict == Device(str(config), sort=True, include="net").dict
+        assert list(device.dict) == sorted(device.dict)
+        assert device.directory == str(tmp_path / "backup.ucs")
+
+    @staticmethod
+    def test_from_ucs_without_config(tmp_path):
+        ucs = io.BytesIO()
+        with tarfile.open(fileobj=ucs, mode="w:gz"):
+            pass
+        ucs.seek(0)
+        with pytest.raises(FileNotFoundError, match="No tmconf files found"):
+            Device.from_ucs(ucs)
+
+    @staticmethod
+    def test_from_scf(tmp_path):
+        scf = "".join(FILES.values())
+        (tmp_path / "backup.scf").write_text(scf)
+        with gzip.open(tmp_path / "backup.scf.gz", "wt") as file:
+            file.write(scf)
+        expected = Parser(scf).dict
+        device = Device.from_scf(str(tmp_path / "backup.scf"))
+        assert device.dict == expected
+        assert device.files == ["backup.scf"]
+        assert device.sources["net vlan /Tenant/external"] == "backup.scf"
+        assert list(device.duplicates) == ["ltm pool /Common/pool_app1"]
+        assert Device.from_scf(str(tmp_path / "backup.scf.gz")).dict == expected
+        with open(tmp_path / "backup.scf", "rb") as file:
+            assert (
+                Device.from_scf(file, include="ltm").dict
+                == Parser(scf, include="ltm").dict
+            )
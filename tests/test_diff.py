@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Test tmconfpy.diff"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy.diff import TmconfDiff, compare, propertyChange, tmconfChange
+from tmconfpy.parser import Parser
+
+OLD = "ltm pool /Common/a {\n    members { x y }\n    monitor http\n    options {\n        z 1\n    }\n}\nltm pool /Common/b {\n    x 1\n}\nltm virtual /Common/c {\n    y 1\n}\n"
+NEW = "ltm pool /Common/a {\n    members { y x }\n    monitor https\n    options {\n        w 1\n    }\n}\nltm virtual /Common/c {\n    y 1\n}\nltm pool /Common/d {\n    x 1\n}\n"
+
+
+class TestCompare:
+    @staticmethod
+    def test_compare():
+        difference = compare(Parser(OLD), Parser(NEW))
+        assert isinstance(difference, TmconfDiff)
+        assert difference
+        assert repr(difference) == "TmconfDiff(1 added, 1 removed, 1 changed)"
+        assert difference.added == {"ltm pool /Common/d": {"x": "1"}}
+        assert difference.removed == {"ltm pool /Common/b": {"x": "1"}}
+        assert difference.changed == {
+            "ltm pool /Common/a": [
+                propertyChange(["members"], ["x", "y"], ["y", "x"]),
+                propertyChange(["monitor"], "http", "https"),
+                propertyChange(["options", "z"], "1", None),
+                propertyChange(["options", "w"], None, "1"),
+            ]
+        }
+
+    @staticmethod
+    def test_ignore_order():
+        difference = compare(Parser(OLD), Parser(NEW), ignore_order=True)
+        assert [
+            change.property for change in difference.changed["ltm pool /Common/a"]
+        ] == [
+            ["monitor"],
+            ["options", "z"],
+            ["options", "w"],
+        ]
+        assert not compare(
+            Parser("ltm a a {\n    b { 1 2 }\n}\n"),
+            Parser("ltm a a {\n    b { 2 1 }\n}\n"),
+            ignore_order=True,
+        )
+
+    @staticmethod
+    def test_identical():
+        previous = Parser("example/bigip.conf", is_filepath=True)
+        assert not compare(previous, Parser("example/bigip.conf", is_filepath=True))
+        assert not compare(
+            previous,
+            Parser("example/bigip.conf", is_filepath=True, previous=previous),
+        )
+        assert not compare(
+            previous.dict, Parser("example/bigip.conf", is_filepath=True, lazy=True)
+        )
+
+    @staticmethod
+    def test_object_type_changed():
+        difference = compare({"ltm a a": {"x": {"y": "1"}}}, {"ltm a a": {"x": "1"}})
+        assert difference.changed == {
+            "ltm a a": [propertyChange(["x"], {"y": "1"}, "1")]
+        }
+
+    @staticmethod
+    def test_to_dict():
+        assert compare(Parser(OLD), Parser(NEW)).to_dict()["changed"][
+            "ltm pool /Common/a"
+        ][1] == {
+            "property": ["monitor"],
+            "old": "http",
+            "new": "https",
+        }
+
+    @staticmethod
+    def test_to_json_patch():
+        old = Parser(OLD).dict
+        patch = compare(Parser(OLD), Parser(NEW)).to_json_patch()
+        assert patch == [
+            {"op": "remove", "path": "/ltm pool ~1Common~1b"},
+            {
+                "op": "replace",
+                "path": "/ltm pool ~1Common~1a/members",
+                "value": ["y", "x"],
+            },
+            {
+                "op": "replace",
+                "path": "/ltm pool ~1Common~1a/monitor",
+                "value": "https",
+            },
+            {"op": "remove", "path": "/ltm pool ~1Common~1a/options/z"},
+            {"op": "add", "path": "/ltm pool ~1Common~1a/options/w", "value": "1"},
+            {"op": "add", "path": "/ltm pool ~1Common~1d", "value": {"x": "1"}},
+        ]
+        # apply the patch
+        for operation in patch:
+            keys = [
+                key.replace("~1", "/").replace("~0", "~")
+                for key in operation["path"].split("/")[1:]
+            ]
+            target = old
+            for key in keys[:-1]:
+                target = target[key]
+            if operation["op"] == "remove":
+                del target[keys[-1]]
+            else:
+                target[keys[-1]] = operation["value"]
+        assert old == Parser(NEW).dict
+
+    @staticmethod
+    def test_tabular():
+        difference = compare(Parser(OLD), Parser(NEW))
+        assert difference.tabular[0] == tmconfChange(
+            "removed", "ltm pool", "/Common/b", [], {"x": "1"}, None
+        )
+        assert difference.tabular[2] == tmconfChange(
+            "changed", "ltm pool", "/Common/a", ["monitor"], "http", "https"
+        )
+        assert difference.tabular[-1] == tmconfChange(
+            "added", "ltm pool", "/Common/d", [], None, {"x": "1"}
+        )
+        assert difference.tabular_kv == [
+            entry._asdict() for entry in difference.tabular
+        ]
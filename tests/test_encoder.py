@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Test JSON encoders"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import importlib
+import io
+import json
+import shutil
+import sys
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy import __projectname__, encoder
+from tmconfpy.cache import ParseCache
+from tmconfpy.cli import cli
+from tmconfpy.encoder import (
+    COMPACT_JSON_ENCODERS,
+    JSON_ENCODER_ENV,
+    JSON_ENCODERS,
+    get_json_encoder,
+)
+from tmconfpy.parser import Parser
+
+FILE = "example/test.tmconf"
+
+
+def installed(name):
+    """Skip the test if the JSON encoder `name` is not installed."""
+    if name not in ("json", "json_compact"):
+        pytest.importorskip(name)
+    return name
+
+
+class TestEncoders:
+    @staticmethod
+    @pytest.mark.parametrize("name", JSON_ENCODERS)
+    def test_matches_stdlib(name):
+        parser = Parser(FILE, is_filepath=True, json_encoder=installed(name))
+        stdlib = Parser(FILE, is_filepath=True, json_encoder="json")
+        assert json.loads(parser.json) == json.loads(stdlib.json)
+        assert json.loads(parser.tabular_json) == json.loads(stdlib.tabular_json)
+        assert json.loads(parser.tabular_json_kv) == json.loads(stdlib.tabular_json_kv)
+        assert [json.loads(line) for line in parser.jsonl.split("\n")] == [
+            json.loads(line) for line in stdlib.jsonl.split("\n")
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize("name", JSON_ENCODERS)
+    def test_write(name):
+        for method, kwargs, attribute in [
+            ("write_json", {}, "json"),
+            ("write_jsonl", {}, "jsonl"),
+            ("write_tabular", {}, "tabular_json"),
+            ("write_tabular", {"kv": True}, "tabular_json_kv"),
+        ]:
+            file = io.StringIO()
+            parser = Parser(FILE, is_filepath=True, json_encoder=installed(name))
+            getattr(parser, method)(file, **kwargs)
+            assert file.getvalue() == getattr(parser, attribute)
+        file = io.StringIO()
+        Parser.stream_jsonl(FILE, file, is_filepath=True, json_encoder=name)
+        assert (
+            file.getvalue() == Parser(FILE, is_filepath=True, json_encoder=name).jsonl
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("name", JSON_ENCODERS)
+    def test_special_characters(name):
+        dumps = get_json_encoder(installed(name)).dumps
+        data = {"description": '"a \\"b\\" /c"', "ü": ["\t", "{ }"]}
+        assert json.loads(dumps(data)) == data
+
+    @staticmethod
+    @pytest.mark.parametrize("name", COMPACT_JSON_ENCODERS)
+    def test_compact(name):
+        dumps = get_json_encoder(installed(name)).dumps
+        data = {"a": ["".join(map(chr, range(128))), "ü\u2028€"], "b": {"c": {}}}
+        assert dumps(data) == json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False
+        )
+        assert (
+            dumps(Parser("ltm a a {\n    x 1\n}").tabular)
+            == '[["ltm a","a",{"x":"1"}]]'
+        )
+
+    @staticmethod
+    def test_canonical_json(monkeypatch):
+        data = {"b": ["\t", "ü", '"/'], "a": {"d": "1", "c": {}}}
+        expected = '{"a":{"c":{},"d":"1"},"b":["\\t","ü","\\"/"]}'.encode()
+        assert encoder.canonical_json(data) == expected
+        monkeypatch.setattr(encoder, "msgspec", None)
+        assert encoder.canonical_json(data) == expected
+        monkeypatch.setattr(encoder, "orjson", None)
+        assert encoder.canonical_json(data) == expected
+
+    @staticmethod
+    def test_stdlib_format():
+        assert (
+            Parser("ltm a a {\n    b { c d }\n}", json_encoder="json").json
+            == '{"ltm a a": {"b": ["c", "d"]}}'
+        )
+
+
+class TestSelection:
+    @staticmethod
+    def test_default(monkeypatch):
+        monkeypatch.delenv(JSON_ENCODER_ENV, raising=False)
+        assert get_json_encoder().name == "json"
+        assert Parser("")._json_encoder.name == "json"
+        assert Parser(FILE, is_filepath=True).json == json.dumps(
+            Parser(FILE, is_filepath=True).dict
+        )
+
+    @staticmethod
+    def test_without_libraries(monkeypatch):
+        monkeypatch.delenv(JSON_ENCODER_ENV, raising=False)
+        for name in ("msgspec", "orjson", "ujson"):
+            monkeypatch.setattr(encoder, name, None)
+        assert get_json_encoder().name == "json"
+        assert encoder.get_compact_json_encoder().name == "json_compact"
+        with pytest.raises(ModuleNotFoundError, match="'orjson' is not installed"):
+            get_json_encoder("orjson")
+
+    @staticmethod
+    def test_environment(monkeypatch):
+        monkeypatch.setenv(JSON_ENCODER_ENV, installed("orjson"))
+        assert get_json_encoder().name == "orjson"
+        assert get_json_encoder("json").name == "json"
+        assert Parser("ltm a a {\n    b c\n}").json == '{"ltm a a":{"b":"c"}}'
+
+    @staticmethod
+    def test_unknown():
+        with pytest.raises(ValueError, match="Unknown JSON encoder 'simplejson'"):
+            Parser("", json_encoder="simplejson")
+
+    @staticmethod
+    def test_cache():
+        installed("orjson")
+        cache = ParseCache()
+        stdlib = Parser(FILE, is_filepath=True, cache=cache)
+        parser = Parser(FILE, is_filepath=True, cache=cache, json_encoder="orjson")
+        assert len(cache) == 2
+        assert parser.json != stdlib.json
+        cached = Parser(FILE, is_filepath=True, cache=cache, json_encoder="orjson")
+        assert cached.json == parser.json
+
+    @staticmethod
+    @pytest.mark.parametrize("output_format", ["object", "jsonl"])
+    def test_cli(monkeypatch, capfd, output_format):
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                __projectname__,
+                "./example/imap.tmconf",
+                "--format",
+                output_format,
+                "--json-encoder",
+                installed("orjson"),
+            ],
+        )
+        cli()
+        cli_output, _ = capfd.readouterr()
+        assert '{"activation-mode":"require"}' in cli_output
+
+
+class TestStandalone:
+    """parser.py is copied on its own into the ansible collection (module_utils)."""
+
+    @staticmethod
+    def test_import(monkeypatch, tmp_path):
+        package = tmp_path / "module_utils"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        shutil.copy("tmconfpy/parser.py", package / "parser.py")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        standalone = importlib.import_module("module_utils.parser")
+        parser = standalone.Parser(FILE, is_filepath=True)
+        expected = Parser(FILE, is_filepath=True)
+        assert parser.dict == expected.dict
+        assert parser.json == json.dumps(expected.dict)
+        assert parser.fingerprints == expected.fingerprints
+        with pytest.raises(ModuleNotFoundError, match="requires the tmconfpy package"):
+            standalone.Parser("", json_encoder="orjson")
@@ -0,0 +1,597 @@
+# -*- coding: utf-8 -*-
+"""Test parse engines"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy import ParseCache, encoder
+from tmconfpy.parser import LazyTmconfDict, Parser, tmconfChanges
+
+from .test_special_cases import SPECIAL_CASES
+
+EXAMPLE_FILES = [
+    "example/bigip.conf",
+    "example/imap.tmconf",
+    "example/pop3.tmconf",
+    "example/test.tmconf",
+]
+
+
+@pytest.mark.parametrize("file_path", EXAMPLE_FILES)
+def test_stream_engine_matches_legacy(file_path):
+    legacy = Parser(file_path, is_filepath=True, engine="legacy")
+    stream = Parser(file_path, is_filepath=True, engine="stream")
+    assert stream.dict == legacy.dict
+    assert list(stream.dict) == list(legacy.dict)
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [SPECIAL_CASES[key][0] for key in SPECIAL_CASES.keys()],
+)
+def test_stream_engine_matches_legacy_special_cases(test_data):
+    assert (
+        Parser(test_data, engine="stream").dict
+        == Parser(test_data, engine="legacy").dict
+    )
+
+
+def test_stream_engine_irule_header_closes_object():
+    test_data = "ltm other /Common/other {\n    key value\nltm rule /Common/rule1 { }\n"
+    assert (
+        Parser(test_data, engine="stream").dict
+        == Parser(test_data, engine="legacy").dict
+        == {"ltm other /Common/other": {}, "ltm rule /Common/rule1": ""}
+    )
+
+
+def test_stream_engine_missing_bracket():
+    with pytest.raises(
+        ValueError, match="Missing '}' for object 'ltm other /Common/other {'"
+    ):
+        Parser("ltm other /Common/other {\n    key value\n", engine="stream")
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    [
+        # nested and unnamed objects
+        "apm policy p {\n    items {\n        {\n            a 1\n            sub {\n                {\n                    b 2\n                }\n                {\n                    c 3\n                }\n            }\n        }\n        {\n            d 4\n        }\n    }\n    e 5\n}",
+        # multiline string and pseudo-array in a nested object
+        'ltm x y {\n    nested {\n        description "line 1\n{\nline 2"\n        members { a b }\n    }\n}',
+        # single line ending with "{" is not a nested object
+        "ltm x y {\n    key {\n}",
+    ],
+)
+def test_build_object_matches_orchestrate(test_data):
+    parser = Parser.__new__(Parser)
+    lines = test_data.split("\n")
+    assert parser._build_object(list(lines)) == parser._orchestrate(list(lines))
+
+
+def test_build_object_nested():
+    assert Parser(
+        "apm policy p {\n    items {\n        {\n            a 1\n        }\n        {\n            b { }\n        }\n    }\n}\n"
+    ).dict == {"apm policy p": {"items": {"0": {"a": "1"}, "1": {"b": {}}}}}
+
+
+@pytest.mark.parametrize("engine", Parser.ENGINES)
+def test_mis_indented_bracket(engine):
+    with pytest.raises(
+        ValueError, match="Missing or mis-indented '}' for line number 1: '    b {'"
+    ):
+        Parser(
+            "ltm x y {\n    a {\n        b {\n            c d\n           }\n    }\n}\n",
+            engine=engine,
+        )
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine 'fast'"):
+        Parser("", engine="fast")
+
+
+class TestParallel:
+    """Test parallel parsing of top-level objects."""
+
+    @staticmethod
+    @pytest.mark.parametrize("file_path", EXAMPLE_FILES)
+    def test_executor(monkeypatch, file_path):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1000)
+        serial = Parser(file_path, is_filepath=True)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parallel = Parser(file_path, is_filepath=True, executor=executor)
+        assert parallel.dict == serial.dict
+        assert list(parallel.dict) == list(serial.dict)
+
+    @staticmethod
+    def test_workers(monkeypatch):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1000)
+        serial = Parser("example/test.tmconf", is_filepath=True)
+        parallel = Parser("example/test.tmconf", is_filepath=True, workers=2)
+        assert parallel.dict == serial.dict
+        assert list(parallel.dict) == list(serial.dict)
+
+    @staticmethod
+    @pytest.mark.parametrize("source", ["str", "bytes", "file_path"])
+    @pytest.mark.parametrize(
+        "options", [{}, {"separate_irules": True}, {"include": "ltm pool"}]
+    )
+    def test_ranges(monkeypatch, tmp_path, source, options):
+        # ranges are cut after each "}" line, within the iRule, the multiline string and after the objects
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1)
+        test_data = 'ltm pool /Common/p1 {\n    members { a }\n}\nltm rule /Common/r1 {\nwhen HTTP_REQUEST {\n    log local0. a\n}\nwhen HTTP_RESPONSE {\n}\n}\n# comment\nltm virtual /Common/v1 {\n    description "x\n}\ny"\n}\nltm pool /Common/p2 { }\n'
+        tmconf = {
+            "str": test_data,
+            "bytes": test_data.encode(),
+            "file_path": str(tmp_path / "test.tmconf"),
+        }[source]
+        (tmp_path / "test.tmconf").write_text(test_data)
+        is_filepath = source == "file_path"
+        serial = Parser(tmconf, is_filepath=is_filepath, **options)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = Parser(
+                tmconf, is_filepath=is_filepath, executor=executor, **options
+            )
+        assert list(parallel.dict.items()) == list(serial.dict.items())
+        assert dict(parallel.irules) == dict(serial.irules)
+
+    @staticmethod
+    def test_ranges_binary_file(monkeypatch):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1)
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_LINES", 1)
+        serial = Parser("example/test.tmconf", is_filepath=True)
+        with open("example/test.tmconf", "rb") as file:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                assert Parser(file, executor=executor).dict == serial.dict
+
+    @staticmethod
+    def test_ranges_non_ascii(monkeypatch, caplog):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1)
+        test_data = "ltm x a {\n    description ä\n}\nltm x b {\n    description ö\n}\n"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parsed = Parser(test_data.encode(), executor=executor)
+        assert parsed.dict == Parser(test_data).dict
+        assert caplog.text.count("contains non-ASCII characters") == 1
+
+    @staticmethod
+    def test_ranges_missing_bracket(monkeypatch):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(
+                ValueError, match="Missing '}' for object 'ltm other /Common/other {'"
+            ):
+                Parser(
+                    "ltm x y {\n}\nltm other /Common/other {\n    a {\n}\n",
+                    executor=executor,
+                )
+
+    @staticmethod
+    @pytest.mark.parametrize("test_data", [SPECIAL_CASES["gtm_topology"][0]])
+    def test_gtm_topology(monkeypatch, test_data):
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_SIZE", 1)
+        monkeypatch.setattr(Parser, "PARALLEL_CHUNK_LINES", 1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert Parser(test_data, executor=executor).dict == Parser(test_data).dict
+
+    @staticmethod
+    def test_worker_error():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError, match="Missing or mis-indented"):
+                Parser("ltm x y {\n    a {\n        b c\n   }\n}\n", executor=executor)
+
+    @staticmethod
+    def test_invalid_workers():
+        with pytest.raises(ValueError, match="workers must be 1 or greater"):
+            Parser("", workers=0)
+
+    @staticmethod
+    def test_legacy_engine():
+        with pytest.raises(ValueError, match="requires the stream engine"):
+            Parser("", engine="legacy", workers=2)
+
+
+class TestLazy:
+    """Test lazy parsing of top-level objects."""
+
+    @staticmethod
+    @pytest.mark.parametrize("file_path", EXAMPLE_FILES)
+    def test_lazy(file_path):
+        parser = Parser(file_path, is_filepath=True)
+        lazy = Parser(file_path, is_filepath=True, lazy=True)
+        assert isinstance(lazy.dict, LazyTmconfDict)
+        assert len(lazy.dict) == len(parser.dict)
+        assert list(lazy.dict) == list(parser.dict)
+        assert dict(lazy.dict) == parser.dict
+        assert lazy.json == parser.json
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "test_data",
+        [SPECIAL_CASES[key][0] for key in SPECIAL_CASES.keys()],
+    )
+    def test_lazy_special_cases(test_data):
+        assert dict(Parser(test_data, lazy=True).dict) == Parser(test_data).dict
+
+    @staticmethod
+    def test_lazy_access(mocker):
+        lazy = Parser("example/test.tmconf", is_filepath=True, lazy=True)
+        parse_block = mocker.spy(lazy, "_parse_block")
+        assert "ltm profile imap imap" in lazy.dict
+        assert "ltm profile imap missing" not in lazy.dict
+        assert parse_block.call_count == 0
+        assert lazy.dict["ltm profile imap imap"] == {"activation-mode": "require"}
+        assert lazy.dict["ltm profile imap imap"] is lazy.dict["ltm profile imap imap"]
+        assert parse_block.call_count == 1
+        with pytest.raises(KeyError):
+            lazy.dict["ltm profile imap missing"]  # pylint: disable=pointless-statement
+
+    @staticmethod
+    def test_lazy_duplicates_and_irule():
+        test_data = "ltm a b {\n    x 1\n}\nltm c d {\n    y 1\nltm rule r { }\nltm a b {\n    x 2\n}\n"
+        assert list(Parser(test_data, lazy=True).dict.items()) == list(
+            Parser(test_data).dict.items()
+        )
+
+    @staticmethod
+    def test_lazy_sort():
+        test_data = (
+            "ltm z z {\n    b 1\n    a { y x }\n}\nltm a a {\n    b 1\n    a 2\n}\n"
+        )
+        sorted_dict = Parser(test_data, sort=True).dict
+        lazy = Parser(test_data, sort=True, lazy=True)
+        assert list(lazy.dict.items()) == list(sorted_dict.items())
+        assert list(lazy.dict["ltm z z"].items()) == list(
+            sorted_dict["ltm z z"].items()
+        )
+
+    @staticmethod
+    def test_lazy_invalid():
+        with pytest.raises(ValueError, match="requires the stream engine"):
+            Parser("", engine="legacy", lazy=True)
+        with pytest.raises(ValueError, match="can not be combined"):
+            Parser("", workers=2, lazy=True)
+
+
+class TestSeparateIRules:
+    """Test iRules kept out of Parser.dict."""
+
+    FILE = "example/test.tmconf"
+
+    def test_separate_irules(self, mocker):
+        parser = Parser(self.FILE, is_filepath=True)
+        separate = Parser(self.FILE, is_filepath=True, separate_irules=True)
+        assert isinstance(separate.irules, LazyTmconfDict)
+        assert separate.irules.keys() == parser.irules.keys()
+        assert len(separate.irules) == 15
+        assert separate.dict == {
+            key: obj for key, obj in parser.dict.items() if key not in parser.irules
+        }
+        parse_block = mocker.spy(separate, "_parse_block")
+        key = next(iter(separate.irules))
+        assert separate.irules[key] == parser.dict[key]
+        assert parse_block.call_count == 1
+        assert dict(separate.irules) == parser.irules
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"lazy": True},
+            {"sort": True},
+            {"workers": 2},
+            {"use_mmap": True},
+        ],
+    )
+    def test_options(self, options):
+        parser = Parser(self.FILE, is_filepath=True, sort=options.get("sort", False))
+        separate = Parser(self.FILE, is_filepath=True, separate_irules=True, **options)
+        assert list(separate.irules.items()) == list(parser.irules.items())
+        assert dict(separate.dict) == {
+            key: obj for key, obj in parser.dict.items() if key not in parser.irules
+        }
+
+    def test_cache(self):
+        cache = ParseCache()
+        parser = Parser(self.FILE, is_filepath=True)
+        Parser(self.FILE, is_filepath=True, separate_irules=True, cache=cache)
+        # results with and without iRules are cached separately
+        assert Parser(self.FILE, is_filepath=True, cache=cache).dict == parser.dict
+        cached = Parser(self.FILE, is_filepath=True, separate_irules=True, cache=cache)
+        assert dict(cached.irules) == parser.irules
+
+    def test_bytes(self):
+        with open(self.FILE, "rb") as file:
+            data = file.read()
+        assert (
+            dict(Parser(data, separate_irules=True).irules)
+            == Parser(self.FILE, is_filepath=True).irules
+        )
+
+    @staticmethod
+    def test_invalid():
+        with pytest.raises(ValueError, match="require the stream engine"):
+            Parser("", engine="legacy", separate_irules=True)
+
+
+class TestIncremental:
+    """Test incremental parsing based on a previous Parser."""
+
+    OLD = "ltm a a {\n    x 1\n}\nltm b b {\n    y { 2 1 }\n}\nltm c c {\n    z 1\n}\n"
+    NEW = "ltm a a {\n    x 1\n}\nltm c c {\n    z 2\n}\nltm d d {\n    w 1\n}\n"
+
+    def test_changes(self):
+        previous = Parser(self.OLD)
+        assert previous.changes is None
+        parser = Parser(self.NEW, previous=previous)
+        assert parser.dict == Parser(self.NEW).dict
+        assert parser.changes == tmconfChanges(
+            added=["ltm d d"], removed=["ltm b b"], changed=["ltm c c"]
+        )
+        assert parser.dict["ltm a a"] is previous.dict["ltm a a"]
+
+    def test_parse_changed_only(self, mocker):
+        previous = Parser(self.OLD)
+        build_object = mocker.spy(Parser, "_build_object")
+        Parser(self.NEW, previous=previous)
+        assert build_object.call_count == 2
+
+    @staticmethod
+    @pytest.mark.parametrize("file_path", EXAMPLE_FILES)
+    def test_unchanged(file_path):
+        for previous in (
+            Parser(file_path, is_filepath=True),
+            Parser(file_path, is_filepath=True, engine="legacy"),
+            Parser(file_path, is_filepath=True, lazy=True),
+        ):
+            parser = Parser(file_path, is_filepath=True, previous=previous)
+            assert parser.changes == ([], [], [])
+            assert list(parser.dict.items()) == list(previous.dict.items())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"lazy": True}, {"cache": ParseCache()}, {"workers": 2}],
+    )
+    def test_separate_irules(options):
+        tmconf = open("example/test.tmconf", encoding="utf-8").read()
+        changed = tmconf + "ltm a a {\n    x 1\n}\n"
+        previous = Parser(tmconf, separate_irules=True, **options)
+        if "cache" in options:
+            # the second parser is taken from the cache
+            previous = Parser(tmconf, separate_irules=True, **options)
+        parser = Parser(changed, separate_irules=True, previous=previous)
+        assert parser.changes == (["ltm a a"], [], [])
+        assert parser.dict == Parser(changed, separate_irules=True).dict
+        assert list(parser.irules) == list(previous.irules)
+
+    def test_sort(self):
+        previous = Parser(self.OLD, sort=True)
+        parser = Parser(self.NEW + self.OLD, sort=True, previous=previous)
+        sorted_dict = Parser(self.NEW + self.OLD, sort=True).dict
+        assert list(parser.dict.items()) == list(sorted_dict.items())
+        with pytest.raises(ValueError, match="same sort and separate_irules"):
+            Parser(self.NEW, previous=previous)
+
+    def test_invalid(self):
+        previous = Parser(self.OLD)
+        with pytest.raises(ValueError, match="Incremental parsing requires"):
+            Parser(self.NEW, engine="legacy", previous=previous)
+        with pytest.raises(ValueError, match="Incremental parsing requires"):
+            Parser(self.NEW, lazy=True, previous=previous)
+
+
+class TestIntern:
+    """Test interning of keys and strings of the parsed tmconf."""
+
+    TMCONF = "ltm pool a {\n    x enabled\n    y { 1 2 }\n}\nltm pool b {\n    x enabled\n    y { 2 }\n}\n"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"engine": "legacy"},
+            {"workers": 2},
+            {"lazy": True},
+            {"sort": True},
+        ],
+    )
+    def test_intern(options):
+        parser = Parser(TestIntern.TMCONF, intern=True, **options)
+        assert dict(parser.dict) == dict(Parser(TestIntern.TMCONF, **options).dict)
+        a, b = parser.dict["ltm pool a"], parser.dict["ltm pool b"]
+        assert a["x"] is b["x"]
+        assert a["y"][1] is b["y"][0]
+        assert next(iter(a)) is next(iter(b))
+        assert parser.tabular[0].path is parser.tabular[1].path
+
+    def test_not_interned(self):
+        parser = Parser(self.TMCONF, intern=False)
+        assert parser.dict["ltm pool a"]["x"] is not parser.dict["ltm pool b"]["x"]
+
+    def test_shared_table(self):
+        table: dict = {}
+        parser = Parser(self.TMCONF, intern=table)
+        other = Parser(self.TMCONF, intern=table)
+        assert other.dict["ltm pool a"]["x"] is parser.dict["ltm pool b"]["x"]
+        assert "enabled" in table
+
+    def test_cache(self):
+        cache = ParseCache()
+        Parser(self.TMCONF, cache=cache)
+        parser = Parser(self.TMCONF, cache=cache, intern=True)
+        assert parser.dict["ltm pool a"]["x"] is parser.dict["ltm pool b"]["x"]
+
+    def test_long_strings(self, monkeypatch):
+        monkeypatch.setattr(Parser, "INTERN_MAX_LENGTH", 4)
+        table: dict = {}
+        Parser(self.TMCONF, intern=table)
+        assert "enabled" not in table
+        assert "x" in table
+
+    @pytest.mark.parametrize("min_size, interned", [(0, True), (1024, False)])
+    def test_default(self, monkeypatch, tmp_path, min_size, interned):
+        monkeypatch.setattr(Parser, "INTERN_MIN_SIZE", min_size)
+        file_path = tmp_path / "bigip.conf"
+        file_path.write_text(self.TMCONF)
+        for parser in (
+            Parser(self.TMCONF),
+            Parser(self.TMCONF.encode()),
+            Parser(str(file_path), is_filepath=True),
+        ):
+            assert (parser._intern_table is not None) is interned
+        with open(file_path, "rb") as file:
+            parser = Parser(file)
+        assert (parser._intern_table is not None) is interned
+        assert parser.dict == Parser(self.TMCONF).dict
+
+
+class TestFingerprints:
+    """Test fingerprints of top-level objects."""
+
+    TMCONF = "ltm a a {\n    x 1\n    y { 2 1 }\n}\nltm b b {\n    z { w 1 }\n}\n"
+    REORDERED = "ltm b b {\n    z { w 1 }\n}\nltm a a {\n    y { 1 2 }\n    x 1\n}\n"
+
+    def test_fingerprints(self):
+        parser = Parser(self.TMCONF)
+        assert list(parser.fingerprints) == ["ltm a a", "ltm b b"]
+        assert all(
+            len(digest) == 2 * Parser.FINGERPRINT_SIZE
+            for digest in parser.fingerprints.values()
+        )
+        assert parser.fingerprints is parser.fingerprints
+        assert parser.fingerprints == Parser(self.REORDERED).fingerprints
+        assert parser.fingerprint == Parser(self.REORDERED).fingerprint
+        changed = Parser(self.TMCONF.replace("x 1", "x 2"))
+        assert changed.fingerprints["ltm a a"] != parser.fingerprints["ltm a a"]
+        assert changed.fingerprints["ltm b b"] == parser.fingerprints["ltm b b"]
+        assert changed.fingerprint != parser.fingerprint
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"engine": "legacy"},
+            {"sort": True},
+            {"lazy": True},
+            {"intern": True},
+            {"workers": 2},
+            {"json_encoder": "json"},
+        ],
+    )
+    def test_options(options):
+        parser = Parser("example/bigip.conf", is_filepath=True)
+        assert (
+            Parser("example/bigip.conf", is_filepath=True, **options).fingerprints
+            == parser.fingerprints
+        )
+
+    def test_without_fast_encoders(self, monkeypatch):
+        fingerprints = Parser(self.TMCONF).fingerprints
+        monkeypatch.setattr(encoder, "msgspec", None)
+        monkeypatch.setattr(encoder, "orjson", None)
+        assert Parser(self.TMCONF).fingerprints == fingerprints
+
+    def test_incremental(self, mocker):
+        previous = Parser(self.TMCONF)
+        new = self.TMCONF.replace("x 1", "x 2")
+        assert Parser(new, previous=previous)._fingerprints is None
+        fingerprints = previous.fingerprints
+        fingerprint = mocker.spy(Parser, "_fingerprint")
+        parser = Parser(new, previous=previous)
+        assert fingerprint.call_count == 1
+        assert parser.fingerprints == Parser(new).fingerprints
+        assert parser.fingerprints["ltm b b"] == fingerprints["ltm b b"]
+
+
+class TestSelection:
+    """Test include and exclude of top-level objects."""
+
+    FILE = "example/test.tmconf"
+
+    @classmethod
+    def selected(cls, predicate):
+        return {
+            key: value
+            for key, value in Parser(cls.FILE, is_filepath=True).dict.items()
+            if predicate(key)
+        }
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"engine": "legacy"},
+            {"lazy": True},
+            {"workers": 2},
+            {"sort": True},
+        ],
+    )
+    def test_include(self, options):
+        parser = Parser(
+            self.FILE,
+            is_filepath=True,
+            include=["ltm cipher", "sys snmp"],
+            **options,
+        )
+        expected = self.selected(
+            lambda key: key.startswith("ltm cipher ") or key == "sys snmp"
+        )
+        assert expected
+        assert dict(parser.dict) == expected
+
+    def test_glob_and_exclude(self):
+        parser = Parser(
+            self.FILE,
+            is_filepath=True,
+            include="ltm cipher * /Common/f5-*",
+            exclude=["ltm cipher group", "*-quic"],
+        )
+        expected = self.selected(
+            lambda key: (
+                key.startswith("ltm cipher rule /Common/f5-")
+                and not key.endswith("-quic")
+            )
+        )
+        assert expected
+        assert parser.dict == expected
+
+    def test_exclude(self):
+        parser = Parser(self.FILE, is_filepath=True, exclude="ltm")
+        assert parser.dict == self.selected(lambda key: not key.startswith("ltm "))
+
+    @staticmethod
+    def test_whole_words():
+        tmconf = "ltm profile http a {\n    x 1\n}\nltm profile http2 b {\n    x 2\n}\nltm profile httpx c { }\n"
+        assert list(Parser(tmconf, include="ltm profile http").dict) == [
+            "ltm profile http a"
+        ]
+        assert list(Parser(tmconf, exclude="ltm profile http").dict) == [
+            "ltm profile http2 b",
+            "ltm profile httpx c",
+        ]
+
+    def test_iter_objects(self):
+        entries = Parser.iter_objects(self.FILE, is_filepath=True, include="sys")
+        assert {
+            f"{entry.path} {entry.name}" if entry.name else entry.path: entry.object
+            for entry in entries
+        } == self.selected(lambda key: key.startswith("sys "))
+
+    def test_cache(self):
+        cache = ParseCache()
+        parser = Parser(self.FILE, is_filepath=True, cache=cache)
+        selected = Parser(self.FILE, is_filepath=True, cache=cache, include="sys")
+        assert len(cache) == 2
+        assert selected.dict != parser.dict
+
+    def test_previous(self):
+        previous = Parser(self.FILE, is_filepath=True, include="sys")
+        assert (
+            Parser(self.FILE, is_filepath=True, include="sys", previous=previous).dict
+            == previous.dict
+        )
+        with pytest.raises(ValueError, match="same include and exclude"):
+            Parser(self.FILE, is_filepath=True, previous=previous)
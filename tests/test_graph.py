@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Test tmconfpy.graph"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy.graph import ReferenceGraph
+from tmconfpy.parser import Parser
+
+TMCONF = """ltm monitor http /Common/http-custom {
+    defaults-from /Common/http
+    interval 5
+}
+ltm monitor http /Common/http {
+    interval 5
+}
+ltm node /Common/10.0.0.1 {
+    address 10.0.0.1
+}
+ltm node /Common/2001:db8::1 {
+    address 2001:db8::1
+}
+ltm pool /Common/pool_app1 {
+    members {
+        /Common/10.0.0.1:80 {
+            address 10.0.0.1
+            monitor /Common/http
+        }
+        /Common/2001:db8::1.80 {
+            address 2001:db8::1
+        }
+    }
+    monitor /Common/http-custom and /Common/gateway_icmp
+}
+ltm profile http /Common/http {
+    insert-xforwarded-for enabled
+}
+ltm profile http /Common/http-x {
+    defaults-from /Common/http
+}
+ltm rule /Common/rule_a {
+when HTTP_REQUEST {}
+}
+ltm snatpool /Common/snat1 {
+    members {
+        /Common/10.1.0.100
+    }
+}
+ltm virtual /Common/vs_app1 {
+    destination /Common/10.1.0.1:80
+    pool /Common/pool_app1
+    profiles {
+        /Common/http-x { }
+        /Common/tcp { }
+    }
+    rules {
+        /Common/rule_a
+    }
+    source-address-translation {
+        pool /Common/snat1
+        type snat
+    }
+}
+ltm virtual /Common/vs_app2 {
+    destination /Common/10.1.0.2:80
+    profiles {
+        /Common/http { }
+    }
+}
+"""
+
+
+class TestReferenceGraph:
+    @staticmethod
+    def test_references():
+        graph = ReferenceGraph(Parser(TMCONF))
+        assert graph.references("ltm virtual /Common/vs_app1") == [
+            "ltm pool /Common/pool_app1",
+            "ltm profile http /Common/http-x",
+            "ltm rule /Common/rule_a",
+            "ltm snatpool /Common/snat1",
+        ]
+        assert graph.references("ltm pool /Common/pool_app1") == [
+            "ltm node /Common/10.0.0.1",
+            "ltm node /Common/2001:db8::1",
+            "ltm monitor http /Common/http-custom",
+            "ltm monitor http /Common/http",
+        ]
+        assert graph.references("ltm virtual /Common/vs_app2") == [
+            "ltm profile http /Common/http"
+        ]
+        assert graph.references("ltm monitor http /Common/http-custom") == [
+            "ltm monitor http /Common/http"
+        ]
+        assert graph.references("ltm node /Common/10.0.0.1") == []
+        assert repr(graph) == "ReferenceGraph(11 objects, 11 references)"
+        assert len(graph) == 11
+
+    @staticmethod
+    def test_edges():
+        graph = ReferenceGraph(Parser(TMCONF))
+        assert graph.edges("ltm virtual /Common/vs_app1") == [
+            ("pool", "ltm pool /Common/pool_app1"),
+            ("profiles", "ltm profile http /Common/http-x"),
+            ("rules", "ltm rule /Common/rule_a"),
+            ("pool", "ltm snatpool /Common/snat1"),
+        ]
+
+    @staticmethod
+    def test_referenced_by():
+        graph = ReferenceGraph(Parser(TMCONF))
+        assert graph.referenced_by("ltm pool /Common/pool_app1") == [
+            "ltm virtual /Common/vs_app1"
+        ]
+        assert graph.referenced_by("ltm monitor http /Common/http") == [
+            "ltm monitor http /Common/http-custom",
+            "ltm pool /Common/pool_app1",
+        ]
+        assert graph.referenced_by("ltm snatpool /Common/snat1") == [
+            "ltm virtual /Common/vs_app1"
+        ]
+        assert graph.referenced_by("ltm virtual /Common/vs_app1") == []
+
+    @staticmethod
+    def test_closure():
+        graph = ReferenceGraph(Parser(TMCONF))
+        assert graph.dependencies("ltm virtual /Common/vs_app1") == [
+            "ltm pool /Common/pool_app1",
+            "ltm profile http /Common/http-x",
+            "ltm rule /Common/rule_a",
+            "ltm snatpool /Common/snat1",
+            "ltm node /Common/10.0.0.1",
+            "ltm node /Common/2001:db8::1",
+            "ltm monitor http /Common/http-custom",
+            "ltm monitor http /Common/http",
+            "ltm profile http /Common/http",
+        ]
+        assert graph.dependents("ltm monitor http /Common/http") == [
+            "ltm monitor http /Common/http-custom",
+            "ltm pool /Common/pool_app1",
+            "ltm virtual /Common/vs_app1",
+        ]
+        assert graph.dependents("ltm profile http /Common/http") == [
+            "ltm profile http /Common/http-x",
+            "ltm virtual /Common/vs_app2",
+            "ltm virtual /Common/vs_app1",
+        ]
+
+    @staticmethod
+    def test_unresolved():
+        graph = ReferenceGraph(Parser(TMCONF))
+        assert graph.unresolved == {
+            "ltm pool /Common/pool_app1": [("monitor", "/Common/gateway_icmp")],
+            # snatpool members are SNAT translation addresses, not nodes
+            "ltm snatpool /Common/snat1": [("members", "/Common/10.1.0.100")],
+            "ltm virtual /Common/vs_app1": [("profiles", "/Common/tcp")],
+        }
+
+    @staticmethod
+    def test_properties():
+        graph = ReferenceGraph(
+            Parser(TMCONF).dict, properties={"destination": None, "pool": ("ltm pool",)}
+        )
+        assert graph.references("ltm virtual /Common/vs_app1") == [
+            "ltm pool /Common/pool_app1"
+        ]
+        assert graph.unresolved["ltm virtual /Common/vs_app2"] == [
+            ("destination", "/Common/10.1.0.2:80")
+        ]
+
+    @staticmethod
+    def test_cycle():
+        graph = ReferenceGraph(
+            {
+                "ltm profile http /Common/a": {"defaults-from": "/Common/b"},
+                "ltm profile http /Common/b": {"defaults-from": "/Common/a"},
+            }
+        )
+        assert graph.dependencies("ltm profile http /Common/a") == [
+            "ltm profile http /Common/b"
+        ]
+        assert graph.dependents("ltm profile http /Common/a") == [
+            "ltm profile http /Common/b"
+        ]
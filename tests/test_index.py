@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Test index files"""
+# pylint: disable=line-too-long,missing-function-docstring
+
+import json
+import os
+import shutil
+
+import pytest  # pylint: disable=unused-import
+
+from tmconfpy.parser import Parser
+
+from .test_special_cases import SPECIAL_CASES
+
+
+@pytest.fixture(name="tmconf_file")
+def fixture_tmconf_file(tmp_path):
+    file_path = tmp_path / "bigip.conf"
+    shutil.copy("example/test.tmconf", file_path)
+    return str(file_path)
+
+
+def test_index_created_and_used(mocker, tmconf_file):
+    expected = Parser(tmconf_file, is_filepath=True).dict
+
+    parser = Parser(tmconf_file, is_filepath=True, index=True)
+    assert os.path.exists(tmconf_file + Parser.INDEX_SUFFIX)
+    assert dict(parser.dict) == expected
+
+    index_stream = mocker.spy(Parser, "_index_tmconf_stream")
+    hash_file = mocker.spy(Parser, "_hash_file")
+    parser = Parser(tmconf_file, is_filepath=True, index=True)
+    assert index_stream.call_count == 0
+    # the content is verified even if size and modification time match
+    assert hash_file.call_count == 1
+    assert list(parser.dict) == list(expected)
+    assert parser.dict["ltm profile imap imap"] == expected["ltm profile imap imap"]
+    assert dict(parser.dict) == expected
+
+
+def test_index_custom_path(tmp_path, tmconf_file):
+    index_path = str(tmp_path / "custom.idx")
+    Parser(tmconf_file, is_filepath=True, index=index_path)
+    with open(index_path, encoding="utf-8") as file:
+        data = json.load(file)
+    assert data["version"] == Parser.INDEX_VERSION
+    assert data["size"] == os.path.getsize(tmconf_file)
+    assert data["sha256"] == Parser._hash_file(tmconf_file)  # pylint: disable=protected-access
+
+
+def test_index_outdated(tmconf_file):
+    Parser(tmconf_file, is_filepath=True, index=True)
+    with open(tmconf_file, "a", encoding="utf-8") as file:
+        file.write("ltm profile imap added {\n    activation-mode require\n}\n")
+    parser = Parser(tmconf_file, is_filepath=True, index=True)
+    assert parser.dict["ltm profile imap added"] == {"activation-mode": "require"}
+    assert dict(parser.dict) == Parser(tmconf_file, is_filepath=True).dict
+
+
+def test_index_touched(mocker, tmconf_file):
+    Parser(tmconf_file, is_filepath=True, index=True)
+    os.utime(tmconf_file, ns=(0, 0))
+    index_stream = mocker.spy(Parser, "_index_tmconf_stream")
+    parser = Parser(tmconf_file, is_filepath=True, index=True)
+    assert index_stream.call_count == 0
+    assert dict(parser.dict) == Parser(tmconf_file, is_filepath=True).dict
+    with open(tmconf_file + Parser.INDEX_SUFFIX, encoding="utf-8") as file:
+        assert json.load(file)["mtime_ns"] == 0
+
+
+def test_index_same_size_and_mtime(tmp_path):
+    file_path = tmp_path / "bigip.conf"
+    file_path.write_text(
+        "ltm pool /Common/aa {\n    x 1\n}\nltm pool /Common/bb {\n    y 2\n}\n"
+    )
+    Parser(str(file_path), is_filepath=True, index=True)
+    file_stat = os.stat(file_path)
+    # same size, rewritten with the modification time kept (cp -p, rsync -t)
+    file_path.write_text(
+        "ltm pool /Common/bb {\n    y 2\n}\nltm pool /Common/aa {\n    x 1\n}\n"
+    )
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    parser = Parser(str(file_path), is_filepath=True, index=True)
+    assert dict(parser.dict) == {
+        "ltm pool /Common/bb": {"y": "2"},
+        "ltm pool /Common/aa": {"x": "1"},
+    }
+    assert list(parser.dict) == ["ltm pool /Common/bb", "ltm pool /Common/aa"]
+
+
+def test_index_corrupt(tmconf_file):
+    with open(tmconf_file + Parser.INDEX_SUFFIX, "w", encoding="utf-8") as file:
+        file.write("{not json")
+    parser = Parser(tmconf_file, is_filepath=True, index=True)
+    assert dict(parser.dict) == Parser(tmconf_file, is_filepath=True).dict
+
+
+def test_index_gtm_topology(tmp_path):
+    file_path = tmp_path / "bigip_gtm.conf"
+    file_path.write_text(SPECIAL_CASES["gtm_topology"][0])
+    Parser(str(file_path), is_filepath=True, index=True)
+    parser = Parser(str(file_path), is_filepath=True, index=True)
+    assert dict(parser.dict) == SPECIAL_CASES["gtm_topology"][1]
+
+
+def test_index_requires_filepath():
+    with pytest.raises(ValueError, match="requires a file path"):
+        Parser("ltm a b { }", index=True)
@@ -32,6 +32,18 @@ class Test_ParserPrivateMethods:
         ]
         assert Parser._remove_indent(Parser, ["hello", "world"]) == ["hello", "world"]
 
+    @staticmethod
+    def test_count_brackets():
+        """Test _count_brackets method."""
+        assert Parser._count_brackets("a { b { c }", False) == (1, False)
+        assert Parser._count_brackets("a { b { c }", True) == (0, True)
+        assert Parser._count_brackets('a "{" { b', False) == (1, False)
+        assert Parser._count_brackets('} " {', False) == (-1, True)
+        assert Parser._count_brackets('} " {', True) == (1, False)
+        assert Parser._count_brackets('a ".+" {', False) == (1, False)
+        assert Parser._count_brackets('a \\{ \\" {', False) == (1, False)
+        assert Parser._count_brackets('a \\" " {', False) == (0, True)
+
     @staticmethod
     def test_get_object_name():
         """Test _get_object_name method."""
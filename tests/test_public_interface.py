@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """Test test_module.py"""
 
+import io
 import json
 
 import pytest  # pylint: disable=unused-import
 
-from tmconfpy import Parser, tabularTmconf
+from tmconfpy import ParseCache, Parser, tabularTmconf, tmconfKey
 
 TEST_DATA = {
     "json": (
@@ -120,3 +121,339 @@ class TestPublicModuleInterface:
         """Test jsonl property."""
         parser = Parser(testdata)
         assert parser.jsonl == expected
+
+    @pytest.mark.parametrize(
+        "method, kwargs, attribute",
+        [
+            ("write_json", {}, "json"),
+            ("write_jsonl", {}, "jsonl"),
+            ("write_tabular", {}, "tabular_json"),
+            ("write_tabular", {"kv": True}, "tabular_json_kv"),
+        ],
+    )
+    def test_write(self, monkeypatch, method, kwargs, attribute):
+        """Test write_* methods write the same JSON as the properties, in chunks."""
+        monkeypatch.setattr(Parser, "WRITE_CHUNK_SIZE", 1000)
+        parser = Parser("example/test.tmconf", is_filepath=True)
+        file = io.StringIO()
+        write: list = []
+        monkeypatch.setattr(file, "write", lambda data: write.append(data))
+        getattr(parser, method)(file, **kwargs)
+        expected = getattr(Parser("example/test.tmconf", is_filepath=True), attribute)
+        assert "".join(write) == expected
+        assert len(write) > 1
+        assert not getattr(parser, f"_tmconf_{attribute}")
+        # the cached string is written as is
+        write.clear()
+        getattr(parser, attribute)
+        getattr(parser, method)(file, **kwargs)
+        assert write == [expected]
+
+    @pytest.mark.parametrize("testdata", ["", TEST_DATA["tabular"][0]])
+    def test_write_small(self, testdata):
+        """Test write_* methods with empty and small input."""
+        for method, attribute in [
+            ("write_json", "json"),
+            ("write_jsonl", "jsonl"),
+            ("write_tabular", "tabular_json"),
+        ]:
+            file = io.StringIO()
+            getattr(Parser(testdata), method)(file)
+            assert file.getvalue() == getattr(Parser(testdata), attribute)
+
+    @pytest.mark.parametrize("testdata, expected", [TEST_DATA["jsonl"]])
+    def test_stream_jsonl(self, testdata, expected):
+        """Test stream_jsonl writes one line per top-level object."""
+        file = io.StringIO()
+        Parser.stream_jsonl(testdata, file)
+        assert file.getvalue() == expected
+        file = io.StringIO()
+        Parser.stream_jsonl("example/test.tmconf", file, is_filepath=True)
+        assert file.getvalue() == Parser("example/test.tmconf", is_filepath=True).jsonl
+
+    def test_stream_jsonl_write_per_object(self, monkeypatch):
+        """Test stream_jsonl writes each object before the next one is parsed."""
+        events = []
+        file = io.StringIO()
+        monkeypatch.setattr(file, "write", lambda data: events.append("write"))
+        build_object = Parser._build_object
+
+        def spy(self, arr):
+            events.append("parse")
+            return build_object(self, arr)
+
+        monkeypatch.setattr(Parser, "_build_object", spy)
+        Parser.stream_jsonl(TEST_DATA["jsonl"][0], file)
+        assert events == ["parse", "write", "parse", "write"]
+
+    @pytest.mark.parametrize("testdata, expected", [TEST_DATA["tabular"]])
+    def test_iter_objects(self, testdata, expected):
+        """Test iter_objects generator."""
+        iterator = Parser.iter_objects(testdata)
+        assert next(iterator) == expected[0]
+        assert list(iterator) == expected[1:]
+
+    @pytest.mark.parametrize("testdata, expected", [TEST_DATA["tabular"]])
+    def test_iter_objects_filepath(self, tmp_path, testdata, expected):
+        """Test iter_objects generator with a file using CRLF line endings."""
+        file_path = tmp_path / "test.tmconf"
+        file_path.write_bytes(testdata.replace("\n", "\r\n").encode())
+        assert list(Parser.iter_objects(str(file_path), is_filepath=True)) == expected
+
+    def test_iter_objects_matches_tabular(self):
+        """Test iter_objects yields the same objects as tabular."""
+        parser = Parser("example/test.tmconf", is_filepath=True)
+        assert (
+            list(Parser.iter_objects("example/test.tmconf", is_filepath=True))
+            == parser.tabular
+        )
+
+
+class TestInputTypes:
+    """Test the input types accepted by tmconfpy.parser.Parser."""
+
+    tmconf = TEST_DATA["tabular"][0]
+    expected = {
+        "ltm profile imap imap": {"activation-mode": "require"},
+        "ltm profile pop3 pop3": {"activation-mode": "require"},
+    }
+
+    @pytest.mark.parametrize("engine", Parser.ENGINES)
+    def test_bytes(self, engine):
+        """Test bytes and bytearray input with CRLF line endings."""
+        data = self.tmconf.replace("\n", "\r\n").encode()
+        assert Parser(data, engine=engine).dict == self.expected
+        assert Parser(bytearray(data), engine=engine).dict == self.expected
+        assert Parser(data, engine=engine).text == self.tmconf
+
+    @pytest.mark.parametrize("engine", Parser.ENGINES)
+    def test_binary_file_object(self, engine):
+        """Test binary file object input."""
+        file = io.BytesIO(b"\n" + self.tmconf.encode())
+        file.readline()
+        parser = Parser(file, engine=engine)
+        assert parser.dict == self.expected
+        assert parser.text == self.tmconf
+
+    def test_binary_file_object_not_seekable(self):
+        """Test text of a non-seekable binary file object is not available."""
+        file = io.BufferedReader(io.BytesIO(self.tmconf.encode()))
+        file.seekable = lambda: False
+        parser = Parser(file)
+        assert parser.dict == self.expected
+        with pytest.raises(ValueError, match="non-seekable"):
+            parser.text  # pylint: disable=pointless-statement
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_filepath(self, tmp_path, use_mmap):
+        """Test file path input, with and without mmap."""
+        file_path = tmp_path / "test.tmconf"
+        file_path.write_bytes(self.tmconf.replace("\n", "\r\n").encode())
+        parser = Parser(str(file_path), is_filepath=True, use_mmap=use_mmap)
+        assert parser.dict == self.expected
+        assert parser.text == self.tmconf
+
+    def test_mmap_file_object(self):
+        """Test mmap of a file object which is not at the beginning of the file."""
+        with open("example/test.tmconf", "rb") as file:
+            file.readline()
+            parser = Parser(file, use_mmap=True)
+            assert parser.dict == Parser("example/test.tmconf", is_filepath=True).dict
+
+    def test_mmap_empty_file(self, tmp_path):
+        """Test mmap of an empty file."""
+        file_path = tmp_path / "empty.tmconf"
+        file_path.write_bytes(b"")
+        assert Parser(str(file_path), is_filepath=True, use_mmap=True).dict == {}
+
+    def test_non_ascii(self, caplog):
+        """Test non-ASCII characters are logged once."""
+        Parser(b'ltm x y {\n    a "\xc3\xa4"\n    b "\xc3\xb6"\n}\n')
+        assert caplog.messages == ["File '<bytes>' contains non-ASCII characters."]
+
+
+class TestKeepPolicy:
+    """Test what tmconfpy.parser.Parser keeps once computed."""
+
+    tmconf = TEST_DATA["tabular"][0]
+    views = [
+        "json",
+        "jsonl",
+        "tabular",
+        "tabular_kv",
+        "tabular_json",
+        "tabular_json_kv",
+        "columnar",
+    ]
+
+    def test_keep_all(self):
+        """Test dict and derived views are kept by default."""
+        parser = Parser(self.tmconf)
+        assert parser.dict is parser.dict
+        for view in self.views:
+            assert getattr(parser, view) is getattr(parser, view)
+
+    def test_keep_dict(self, mocker):
+        """Test derived views are computed on each access with keep='dict'."""
+        parser = Parser(self.tmconf, keep="dict")
+        parse = mocker.spy(parser, "_parse")
+        assert parser.dict is parser.dict
+        expected = Parser(self.tmconf)
+        for view in self.views[:-1]:
+            assert getattr(parser, view) == getattr(expected, view)
+            assert getattr(parser, f"_tmconf_{view}") is None
+        assert list(parser.columnar) == expected.tabular
+        assert parser._tmconf_columnar is None
+        assert parse.call_count == 0
+
+    def test_keep_none(self, mocker):
+        """Test dict is parsed on each access with keep='none'."""
+        parser = Parser(self.tmconf, keep="none")
+        parse = mocker.spy(parser, "_parse")
+        assert parser.dict == Parser(self.tmconf).dict
+        assert parser.json == Parser(self.tmconf).json
+        assert parse.call_count == 2
+        assert parser._tmconf_dict is None
+        assert parser._tmconf_json is None
+
+    def test_keep_none_file_object(self):
+        """Test a seekable file object is parsed again from its initial position."""
+        file = io.BytesIO(b"\n" + self.tmconf.encode())
+        file.readline()
+        parser = Parser(file, keep="none")
+        assert parser.dict == Parser(self.tmconf).dict
+        assert parser.dict == Parser(self.tmconf).dict
+
+    def test_empty(self, mocker):
+        """Test views of empty tmconf are computed once."""
+        parser = Parser("")
+        iter_tabular = mocker.spy(parser, "_iter_tabular")
+        for view in self.views:
+            getattr(parser, view)
+            getattr(parser, view)
+        assert parser.jsonl == ""
+        assert iter_tabular.call_count == 1
+
+    @pytest.mark.parametrize("engine", Parser.ENGINES)
+    def test_keep_text(self, tmp_path, mocker, engine):
+        """Test text read from a file is not kept with keep_text=False."""
+        file_path = tmp_path / "test.tmconf"
+        file_path.write_text(self.tmconf)
+        parser = Parser(
+            str(file_path), is_filepath=True, engine=engine, keep_text=False
+        )
+        assert parser._tmconf_text is None
+        read_tmconf_source = mocker.spy(parser, "_read_tmconf_source")
+        assert parser.text == self.tmconf
+        assert parser.text == self.tmconf
+        assert read_tmconf_source.call_count == 2
+        assert Parser(str(file_path), is_filepath=True).text is not None
+
+    def test_release(self, mocker):
+        """Test release drops derived views, text and dict."""
+        parser = Parser(self.tmconf.encode())
+        for view in self.views + ["text"]:
+            getattr(parser, view)
+        parser.release()
+        for view in self.views + ["text", "dict"]:
+            assert getattr(parser, f"_tmconf_{view}") is None
+        parse = mocker.spy(parser, "_parse")
+        assert parser.dict == Parser(self.tmconf).dict
+        assert parser.dict is parser.dict
+        assert parse.call_count == 1
+        assert parser.text == self.tmconf
+
+    def test_release_not_seekable(self):
+        """Test release keeps dict of a non-seekable file object."""
+        file = io.BufferedReader(io.BytesIO(self.tmconf.encode()))
+        file.seekable = lambda: False
+        parser = Parser(file)
+        parser.release()
+        assert parser.dict == Parser(self.tmconf).dict
+
+    def test_release_cache(self):
+        """Test dict is taken from the cache after release."""
+        cache = ParseCache()
+        parser = Parser(self.tmconf, cache=cache)
+        parser.release()
+        assert parser.dict == Parser(self.tmconf).dict
+        assert len(cache) == 1
+
+    def test_invalid(self):
+        """Test invalid keep options."""
+        with pytest.raises(ValueError, match="Unknown keep policy 'some'"):
+            Parser(self.tmconf, keep="some")
+        with pytest.raises(ValueError, match="keep='none'"):
+            Parser(self.tmconf, keep="none", lazy=True)
+        file = io.BufferedReader(io.BytesIO(self.tmconf.encode()))
+        file.seekable = lambda: False
+        with pytest.raises(ValueError, match="require a seekable file object"):
+            Parser(file, keep="none")
+
+
+class TestKeyIndex:
+    """Test structured object names and the path and partition indexes."""
+
+    tmconf = 'ltm virtual /Common/vs1 {\n    x 1\n}\nltm profile http /Common/app.app/http {\n    y 1\n}\nltm virtual /Tenant/vs2 {\n    z 1\n}\nltm data-group internal "/Common/my group" {\n    type ip\n}\nsys global-settings {\n    w 1\n}\nltm profile imap imap {\n    v 1\n}\n'
+
+    def test_object_keys(self):
+        """Test the top-level object names are split into their parts."""
+        object_keys = Parser(self.tmconf).object_keys
+        assert object_keys["ltm virtual /Common/vs1"] == tmconfKey(
+            "ltm", "virtual", None, "/Common/vs1", "/Common"
+        )
+        assert object_keys["ltm profile http /Common/app.app/http"] == tmconfKey(
+            "ltm", "profile", "http", "/Common/app.app/http", "/Common"
+        )
+        assert object_keys['ltm data-group internal "/Common/my group"'] == tmconfKey(
+            "ltm", "data-group", "internal", '"/Common/my group"', "/Common"
+        )
+        assert object_keys["sys global-settings"] == tmconfKey(
+            "sys", None, None, "global-settings", None
+        )
+        assert object_keys["ltm profile imap imap"].partition is None
+
+    def test_by_path(self):
+        """Test by_path returns the tabular entries of a path."""
+        parser = Parser(self.tmconf)
+        assert parser.by_path("ltm virtual") == [
+            entry for entry in parser.tabular if entry.path == "ltm virtual"
+        ]
+        assert parser.by_path("ltm data-group internal") == [
+            tabularTmconf(
+                "ltm data-group internal", '"/Common/my group"', {"type": "ip"}
+            )
+        ]
+        assert parser.by_path("sys") == [
+            tabularTmconf("sys", "global-settings", {"w": "1"})
+        ]
+        assert parser.by_path("ltm pool") == []
+
+    def test_by_partition(self):
+        """Test by_partition returns the tabular entries of a partition."""
+        parser = Parser(self.tmconf)
+        assert [entry.name for entry in parser.by_partition("/Common")] == [
+            "/Common/vs1",
+            "/Common/app.app/http",
+            '"/Common/my group"',
+        ]
+        assert parser.by_partition("Tenant") == parser.by_partition("/Tenant/")
+        assert parser.by_partition("/Tenant")[0].object == {"z": "1"}
+        assert parser.by_partition("/Other") == []
+
+    def test_lazy(self, mocker):
+        """Test only the objects returned are parsed with lazy."""
+        expected = Parser(self.tmconf).by_path("ltm virtual")
+        parser = Parser(self.tmconf, lazy=True)
+        build_object = mocker.spy(Parser, "_build_object")
+        assert parser.by_path("ltm virtual") == expected
+        assert build_object.call_count == 2
+
+    def test_quoted_name(self):
+        """Test quoted names with spaces are kept as name in tabular and columnar."""
+        parser = Parser(self.tmconf)
+        entry = tabularTmconf(
+            "ltm data-group internal", '"/Common/my group"', {"type": "ip"}
+        )
+        assert entry in parser.tabular
+        assert entry in list(parser.columnar)
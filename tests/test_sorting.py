@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """Test test_parser_methods.py"""
 
+import copy
+import io
+
 import pytest  # pylint: disable=unused-import
 
-from tmconfpy.parser import Parser
+from tmconfpy.parser import Parser, SortedTmconfView
 
 # pylint: disable=protected-access
 
@@ -56,3 +59,47 @@ ltm profile profile-type MyProfile {
         """Test sort_dict method."""
         parsed = Parser(self.test_data, sort=True)
         assert parsed.dict == self.expected_result_sorted
+
+    @pytest.mark.parametrize("json_encoder", ["json", "orjson"])
+    def test_write_sorted(self, json_encoder):
+        """Test sorting while writing matches the output of sort=True."""
+        if json_encoder != "json":
+            pytest.importorskip(json_encoder)
+        parsed = Parser(self.test_data, json_encoder=json_encoder)
+        unsorted = copy.deepcopy(parsed.dict)
+        expected = Parser(self.test_data, sort=True, json_encoder=json_encoder)
+        for method, kwargs, attribute in [
+            ("write_json", {}, "json"),
+            ("write_jsonl", {}, "jsonl"),
+            ("write_tabular", {}, "tabular_json"),
+            ("write_tabular", {"kv": True}, "tabular_json_kv"),
+        ]:
+            file = io.StringIO()
+            getattr(parsed, method)(file, sort=True, **kwargs)
+            assert file.getvalue() == getattr(expected, attribute)
+        assert parsed.dict == unsorted
+        assert list(parsed.dict) == list(unsorted)
+
+    def test_write_sorted_cached_views(self):
+        """Test sorting while writing ignores views built unsorted."""
+        parsed = Parser(self.test_data)
+        assert parsed.json != Parser(self.test_data, sort=True).json
+        file = io.StringIO()
+        parsed.write_json(file, sort=True)
+        assert file.getvalue() == Parser(self.test_data, sort=True).json
+
+    def test_sorted_view(self):
+        """Test sorted_view matches sort=True without sorting the parsed tmconf."""
+        parsed = Parser(self.test_data)
+        view = parsed.sorted_view
+        assert isinstance(view, SortedTmconfView)
+        assert view == self.expected_result_sorted
+        assert list(view) == list(self.expected_result_sorted)
+        assert list(view["ltm profile profile-type MyProfile"]["object"]) == [
+            "aaa",
+            "bbb-list",
+            "zzz",
+        ]
+        assert parsed.dict == self.expected_result
+        assert len(view) == 2
+        assert "ltm profile profile-type OtherProfile" in view
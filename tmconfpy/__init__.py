@@ -1,11 +1,32 @@
 # -*- coding: utf-8 -*-
 """Top-level package for tmconfpy."""
 
-from .parser import Parser, tabularTmconf
+from .cache import ParseCache
+from .device import Device
+from .diff import TmconfDiff
+from .graph import ReferenceGraph
+from .parser import (
+    ColumnarTmconf,
+    LazyTmconfDict,
+    Parser,
+    SortedTmconfView,
+    tabularTmconf,
+    tmconfChanges,
+    tmconfKey,
+)
 
 __all__ = [
+    "ColumnarTmconf",
+    "Device",
+    "LazyTmconfDict",
+    "ParseCache",
     "Parser",
+    "ReferenceGraph",
+    "SortedTmconfView",
+    "TmconfDiff",
     "tabularTmconf",
+    "tmconfChanges",
+    "tmconfKey",
 ]
 __author__ = """Simon Kowallik"""
 __email__ = "sk-github@simonkowallik.com"
@@ -2,10 +2,11 @@
 """Simple API server for tmconfpy"""
 
 import enum
-from typing import Union
+import os
+from typing import Optional
 
-from fastapi import Body, FastAPI, UploadFile
-from fastapi.responses import JSONResponse, Response
+from fastapi import Body, FastAPI, Query, UploadFile
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from . import (
@@ -17,6 +18,8 @@ from . import (
     __projectname__,
     __version__,
 )
+from .cache import ParseCache
+from .encoder import get_compact_json_encoder
 from .parser import Parser
 
 EXAMPLE_RESPONSES = {
@@ -112,6 +115,14 @@ EXAMPLE_RESPONSES = {
     },
 }
 
+# parse results are cached in memory, and on disk if TMCONFPY_CACHE_DIR is set
+PARSE_CACHE = ParseCache(
+    maxsize=int(os.environ.get("TMCONFPY_CACHE_SIZE", "32")),
+    directory=os.environ.get("TMCONFPY_CACHE_DIR"),
+)
+# JSON responses are compact and don't escape non-ASCII characters, the same with any JSON encoder installed
+COMPACT_JSON_ENCODER = get_compact_json_encoder().name
+
 
 app = FastAPI(
     openapi_tags=[
@@ -177,7 +188,7 @@ async def fileparser(
         filename, reverse=False, key=lambda upload_file: upload_file.filename
     ):
         data = await _file.read()
-        parsed = Parser(data.decode(), sort=sort)
+        parsed = Parser(data, sort=sort, cache=PARSE_CACHE)
         results.append(FileParserResult(filename=_file.filename, output=parsed.dict))
 
     return results
@@ -199,7 +210,9 @@ async def parser(
     ),
     response_format: ParserResponseFormat = ParserResponseFormat.object,
     sort: bool = False,
-) -> Union[Response, JSONResponse]:
+    include: Optional[list[str]] = Query(None),
+    exclude: Optional[list[str]] = Query(None),
+) -> Response:
     """
     Accepts a POST request with a tmconf file content as the body. Returns a JSON object with the parsed tmconf.
 
@@ -209,14 +222,31 @@ async def parser(
     $ curl -s http://localhost:8000/parser/ --data-binary @example/imap.tmconf
     {"ltm profile imap imap":{"activation-mode":"require"}}
     ```
+
+    `include` and `exclude` select objects by path prefix (like `ltm virtual`) or glob pattern, can be given multiple times:
+
+    ```shell
+    $ curl -s 'http://localhost:8000/parser/?include=ltm%20profile%20imap' --data-binary @example/test.tmconf
+    ```
     """
-    parsed = Parser(tmconf, sort=sort)
+    parsed = Parser(
+        tmconf,
+        sort=sort,
+        cache=PARSE_CACHE,
+        include=include,
+        exclude=exclude,
+        # JSON lines are formatted by json.dumps, JSON documents are compact
+        json_encoder="json"
+        if response_format == ParserResponseFormat.jsonl
+        else COMPACT_JSON_ENCODER,
+    )
+    # JSON is encoded by the JSON encoder of the parser (or taken from the cache)
     # tabular
     if response_format == ParserResponseFormat.tabular:
-        return JSONResponse(content=parsed.tabular)
+        return Response(media_type="application/json", content=parsed.tabular_json)
     # tabular_kv
     if response_format == ParserResponseFormat.tabular_kv:
-        return JSONResponse(content=parsed.tabular_kv)
+        return Response(media_type="application/json", content=parsed.tabular_json_kv)
     # jsonl - jsonlines
     elif response_format == ParserResponseFormat.jsonl:
         return Response(
@@ -226,4 +256,4 @@ async def parser(
             content=parsed.jsonl,
         )
     # object
-    return JSONResponse(content=parsed.dict)
+    return Response(media_type="application/json", content=parsed.json)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Content-addressed cache for parsed tmconf."""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """
+    Cache parsed tmconf as JSON strings, keyed by a hash of the tmconf content and parser options.
+
+    Recently used entries are kept in memory (LRU), bounded by number of entries and size.
+    If a `directory` is given, entries are also stored on disk, the least recently used
+    files are removed when the directory grows beyond `max_disk_bytes`.
+
+    Example:
+        >>> from tmconfpy import Parser, ParseCache
+        >>> cache = ParseCache(maxsize=16, directory="/var/cache/tmconfpy")
+        >>> parsed = Parser('example/imap.tmconf', is_filepath=True, cache=cache)
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        maxsize: int = 32,
+        max_bytes: int = 512 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 4 * 1024 * 1024 * 1024,
+    ):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept in memory, 0 disables the in-memory cache.
+            max_bytes (int): Maximum total size (characters) of the entries kept in memory.
+            directory (str): Directory to store entries on disk, created if missing. No disk store if None.
+            max_disk_bytes (int): Maximum total size (bytes) of the entries stored in `directory`.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (
+            self.directory is not None and os.path.exists(self._path(key))
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached JSON string for `key`, None if it is not cached."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = file.read().decode()
+            # record the access for least recently used eviction
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Cache the JSON string `value` for `key`."""
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(value.encode())
+            os.replace(f"{path}.tmp", path)
+        except OSError as error:
+            log.warning("Unable to write cache file '%s': %s", path, error)
+            return
+        self._evict_disk()
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.directory is None:
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                os.remove(entry.path)
+
+    def _path(self, key: str) -> str:
+        """Return the file path of `key` in the disk store."""
+        return os.path.join(self.directory, f"{key}{self.SUFFIX}")
+
+    def _remember(self, key: str, value: str) -> None:
+        """Keep `value` in memory, evict least recently used entries beyond the limits."""
+        if self.maxsize <= 0 or len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += len(value)
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used files from the disk store beyond `max_disk_bytes`."""
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.SUFFIX):
+                continue
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+            files.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+            total += entry_stat.st_size
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
@@ -2,18 +2,63 @@
 """Command Line Interface for tmconfpy."""
 
 import argparse
+import os
 import sys
 
 from . import __description__, __homepage__, __license__, __projectname__, __version__
+from .cache import ParseCache
+from .diff import compare
+from .encoder import JSON_ENCODER_ENV, JSON_ENCODERS, get_json_encoder
 from .parser import Parser
 
 
+def _add_parse_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments which control parsing to the argument parser."""
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory to cache parse results in, defaults to environment variable TMCONFPY_CACHE_DIR.",
+        default=os.environ.get("TMCONFPY_CACHE_DIR"),
+        required=False,
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Memory-map the tmconf file instead of reading it line by line.",
+        required=False,
+    )
+    parser.add_argument(
+        "--json-encoder",
+        type=str,
+        help=f"JSON encoder to use, defaults to environment variable {JSON_ENCODER_ENV} or json (stdlib).",
+        choices=JSON_ENCODERS,
+        default=None,
+        required=False,
+    )
+    parser.add_argument(
+        "--include",
+        type=str,
+        action="append",
+        help="Only parse objects whose name starts with this path (like 'ltm virtual') or matches this glob pattern, can be given multiple times.",
+        default=None,
+        required=False,
+    )
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        action="append",
+        help="Skip objects whose name starts with this path or matches this glob pattern, can be given multiple times.",
+        default=None,
+        required=False,
+    )
+
+
 def _cli_arg_parser():
     """Build cli argument parser and return args object."""
     parser = argparse.ArgumentParser(
         prog=__projectname__,
         description=__description__,
-        epilog=f"LICENSE: {__license__}, homepage: {__homepage__}",
+        epilog=f"Compare two tmconf files with: {__projectname__} diff --help. LICENSE: {__license__}, homepage: {__homepage__}",
     )
     parser.add_argument(
         "--version",
@@ -42,37 +87,160 @@ def _cli_arg_parser():
         help="Sort the output.",
         required=False,
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each object as soon as it is parsed, requires --format jsonl. Objects with duplicate names are written once per occurrence.",
+        required=False,
+    )
+    _add_parse_arguments(parser)
     parser.add_argument(
         "file_path",
-        type=argparse.FileType("r"),
+        type=argparse.FileType("rb"),
         help="Path to tmconf file to read. Use - for STDIN.",
         nargs="?",
-        default=(None if sys.stdin.isatty() else sys.stdin),
+        default=(None if sys.stdin.isatty() else sys.stdin.buffer),
     )
 
     return parser.parse_args()
 
 
+def _cli_diff_arg_parser():
+    """Build cli argument parser of the diff subcommand and return args object."""
+    parser = argparse.ArgumentParser(
+        prog=f"{__projectname__} diff",
+        description="Compare two tmconf files by top-level object and write the differences as JSON. Exits with 1 if the files differ.",
+        epilog=f"LICENSE: {__license__}, homepage: {__homepage__}",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=argparse.FileType("w"),
+        help="File to write JSON output to.",
+        nargs="?",
+        default=sys.stdout,
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        help="Output format, patch is RFC 6902 JSON Patch. Defaults to object.",
+        choices=["object", "tabular", "tabular_kv", "jsonl", "patch"],
+        default="object",
+        required=False,
+    )
+    parser.add_argument(
+        "--ignore-order",
+        action="store_true",
+        help="Compare lists regardless of the order of their items.",
+        required=False,
+    )
+    _add_parse_arguments(parser)
+    parser.add_argument(
+        "old_file_path",
+        type=argparse.FileType("rb"),
+        help="Path to tmconf file to compare to. Use - for STDIN.",
+    )
+    parser.add_argument(
+        "new_file_path",
+        type=argparse.FileType("rb"),
+        help="Path to tmconf file to compare. Use - for STDIN.",
+    )
+
+    return parser.parse_args(sys.argv[2:])
+
+
+def _is_empty(file) -> bool:
+    """Check if the binary `file` contains whitespace only, leading blank lines are consumed."""
+    head = file.peek()
+    while head and not head.strip():
+        file.readline()
+        head = file.peek()
+    return not head
+
+
 def cli():
     """Handle CLI interaction."""
+    if sys.argv[1:2] == ["diff"]:
+        cli_diff()
+        return
     args = _cli_arg_parser()
 
-    tmconf_content = args.file_path.read() if args.file_path is not None else ""
-
-    if tmconf_content.strip() == "":
+    if args.file_path is None or _is_empty(args.file_path):
         print(
             "No file_path given or input is empty. Use -h|--help for help.",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    parsed = Parser(tmconf_content, sort=args.sort)
+    if args.stream:
+        if args.format != "jsonl" or args.sort or args.cache_dir:
+            print(
+                "--stream requires --format jsonl and can not be combined with --sort or --cache-dir.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        # write each object as soon as it is parsed
+        Parser.stream_jsonl(
+            args.file_path,
+            args.output,
+            use_mmap=args.mmap,
+            json_encoder=args.json_encoder,
+            include=args.include,
+            exclude=args.exclude,
+        )
+        return
+
+    cache = ParseCache(maxsize=0, directory=args.cache_dir) if args.cache_dir else None
+    # sort while writing, the parsed tmconf (and cache entry) stays the same as without --sort
+    parsed = Parser(
+        args.file_path,
+        use_mmap=args.mmap,
+        cache=cache,
+        json_encoder=args.json_encoder,
+        include=args.include,
+        exclude=args.exclude,
+    )
+
+    if args.format == "tabular":
+        parsed.write_tabular(args.output, sort=args.sort)
+    elif args.format == "tabular_kv":
+        parsed.write_tabular(args.output, kv=True, sort=args.sort)
+    elif args.format == "jsonl":
+        parsed.write_jsonl(args.output, sort=args.sort)
+    else:
+        parsed.write_json(args.output, sort=args.sort)
+
 
+def cli_diff():
+    """Handle CLI interaction of the diff subcommand."""
+    args = _cli_diff_arg_parser()
+
+    cache = ParseCache(maxsize=0, directory=args.cache_dir) if args.cache_dir else None
+    old, new = (
+        Parser(
+            file_path,
+            use_mmap=args.mmap,
+            cache=cache,
+            json_encoder=args.json_encoder,
+            include=args.include,
+            exclude=args.exclude,
+        )
+        for file_path in (args.old_file_path, args.new_file_path)
+    )
+    difference = compare(old, new, ignore_order=args.ignore_order)
+
+    dumps = get_json_encoder(args.json_encoder).dumps
     if args.format == "tabular":
-        args.output.write(parsed.tabular_json)
+        args.output.write(dumps(difference.tabular))
     elif args.format == "tabular_kv":
-        args.output.write(parsed.tabular_json_kv)
+        args.output.write(dumps(difference.tabular_kv))
     elif args.format == "jsonl":
-        args.output.write(parsed.jsonl)
+        args.output.write("\n".join(dumps(entry) for entry in difference.tabular_kv))
+    elif args.format == "patch":
+        args.output.write(dumps(difference.to_json_patch()))
     else:
-        args.output.write(parsed.json)
+        args.output.write(dumps(difference.to_dict()))
+    args.output.flush()
+
+    if difference:
+        sys.exit(1)
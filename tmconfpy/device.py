@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Parse the tmconf files of a BIG-IP config directory into one configuration."""
+
+import gzip
+import io
+import logging
+import os
+import tarfile
+from concurrent.futures import Executor
+from typing import BinaryIO, Dict, Iterable, Optional, Union
+
+from .parser import Parser
+
+log = logging.getLogger(__name__)
+
+
+class Device:
+    """
+    Configuration of a BIG-IP device, parsed from the tmconf files of its config directory (like /config).
+
+    The files are parsed in parallel, one file per worker, and merged in load order into `dict`.
+    `sources` holds the file (relative to `directory`) of each object in `dict`. Objects defined more
+    than once, in different files or the same file, are reported in `duplicates`. Like
+    `Parser.dict`, the last definition is kept.
+
+    `from_ucs` and `from_scf` parse a UCS archive or a single configuration file instead of a
+    config directory, `directory` is the path of the archive or file then.
+
+    Example:
+        >>> from tmconfpy.device import Device
+        >>> device = Device('/config')
+        >>> device.files
+        ['bigip_base.conf', 'bigip.conf', 'bigip_gtm.conf', 'partitions/Tenant/bigip.conf']
+        >>> device.sources["ltm virtual /Tenant/vs_app1"]
+        'partitions/Tenant/bigip.conf'
+        >>> device.duplicates
+        {}
+    """
+
+    # tmconf files of a config directory and of each partition directory, in load order
+    FILES = ("bigip_base.conf", "bigip_user.conf", "bigip.conf", "bigip_gtm.conf")
+    # directory of the partition directories, relative to the config directory
+    PARTITIONS_DIRECTORY = "partitions"
+
+    def __init__(
+        self,
+        directory: str,
+        files: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        sort: bool = False,
+        use_mmap: bool = False,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ):
+        """
+        Args:
+            directory (str): Config directory of the device, like /config.
+            files (Iterable[str]): Files to parse in load order, relative to `directory`. Defaults to the files returned by `find_files`.
+            workers (int): Number of worker processes to parse files in parallel (threads on free-threaded python), defaults to the number of CPUs. 1 parses the files one after the other.
+            executor (Executor): concurrent.futures executor to parse files in parallel, takes precedence over `workers`.
+            sort (bool): If True, sort dictionaries and lists of the parsed configuration recursively.
+            use_mmap (bool): If True, memory-map the files instead of reading them line by line.
+            include (str, Iterable[str]): Only parse top-level objects selected by these paths or glob patterns, see `Parser`.
+            exclude (str, Iterable[str]): Skip top-level objects selected by these paths or glob patterns, see `Parser`.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be 1 or greater, got {workers}")
+        self.directory = directory
+        self.files: list = list(self.find_files(directory) if files is None else files)
+        if not self.files:
+            raise FileNotFoundError(f"No tmconf files found in '{directory}'.")
+        # the same options for each file, passed to the workers
+        options = (True, use_mmap, include, exclude, sort)
+        paths = [os.path.join(directory, file) for file in self.files]
+        if executor is None and workers is None:
+            workers = min(len(paths), os.cpu_count() or 1)
+        if executor is not None:
+            results = self._parse_files(executor, paths, options)
+        elif workers > 1 and len(paths) > 1:
+            with Parser._create_executor(workers) as pool:
+                results = self._parse_files(pool, paths, options)
+        else:
+            results = [_parse_file(path, *options) for path in paths]
+        self._merge(results, sort)
+
+    def __len__(self) -> int:
+        return len(self.dict)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.directory}', {len(self.files)} files, {len(self.dict)} objects, {len(self.duplicates)} duplicates)"
+
+    @classmethod
+    def from_ucs(
+        cls,
+        ucs: Union[str, BinaryIO],
+        sort: bool = False,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ) -> "Device":
+        """
+        Parse the tmconf files of a UCS archive (gzip compressed tar) without extracting it.
+
+        The archive is read as a stream, each tmconf file (`FILES` in config/ and config/partitions/*/)
+        is parsed line by line while it is read, other members are skipped. Nothing is written to disk
+        and only the parsed configuration is kept in memory. The files are merged in load order.
+
+        Args:
+            ucs (str, BinaryIO): File path or binary file object of the UCS archive, uncompressed tar archives are supported too.
+            sort (bool): If True, sort dictionaries and lists of the parsed configuration recursively.
+            include (str, Iterable[str]): Only parse top-level objects selected by these paths or glob patterns, see `Parser`.
+            exclude (str, Iterable[str]): Skip top-level objects selected by these paths or glob patterns, see `Parser`.
+
+        Example:
+            >>> from tmconfpy.device import Device
+            >>> device = Device.from_ucs('backup.ucs')
+            >>> device.sources["ltm virtual /Tenant/vs_app1"]
+            'partitions/Tenant/bigip.conf'
+        """
+        results: Dict = {}
+        fileobj = None if isinstance(ucs, str) else ucs
+        # "r|*" reads the members one after the other, without seeking
+        with tarfile.open(name=cls._name(ucs), fileobj=fileobj, mode="r|*") as tar:
+            for member in tar:
+                file = cls._config_file(member.name) if member.isfile() else None
+                if file is not None:
+                    reader = io.BufferedReader(
+                        _TarMemberReader(tar.extractfile(member), member.name)
+                    )
+                    results[file] = _parse_file(
+                        reader, False, False, include, exclude, sort
+                    )
+        if not results:
+            raise FileNotFoundError(f"No tmconf files found in '{cls._name(ucs)}'.")
+        device = cls.__new__(cls)
+        device.directory = cls._name(ucs)
+        device.files = sorted(results, key=cls._load_order)
+        device._merge([results[file] for file in device.files], sort)
+        return device
+
+    @classmethod
+    def from_scf(
+        cls,
+        scf: Union[str, BinaryIO],
+        sort: bool = False,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ) -> "Device":
+        """
+        Parse a single configuration file (SCF), created by `tmsh save sys config file`.
+
+        An SCF holds the whole configuration of a device in one tmconf file, its objects are parsed
+        line by line while the file is read. Gzip compressed files (.gz) are decompressed while reading.
+
+        Args:
+            scf (str, BinaryIO): File path or binary file object of the SCF.
+            sort (bool): If True, sort dictionaries and lists of the parsed configuration recursively.
+            include (str, Iterable[str]): Only parse top-level objects selected by these paths or glob patterns, see `Parser`.
+            exclude (str, Iterable[str]): Skip top-level objects selected by these paths or glob patterns, see `Parser`.
+        """
+        if isinstance(scf, str) and scf.endswith(".gz"):
+            with gzip.open(scf, "rb") as file:
+                results = _parse_file(file, False, False, include, exclude, sort)
+        else:
+            results = _parse_file(
+                scf, isinstance(scf, str), False, include, exclude, sort
+            )
+        device = cls.__new__(cls)
+        device.directory = cls._name(scf)
+        device.files = [os.path.basename(device.directory)]
+        device._merge([results], sort)
+        return device
+
+    def by_file(self, file: str) -> Dict:
+        """Return the top-level objects of `dict` defined (last) in `file`, relative to `directory`."""
+        return {
+            key: self.dict[key]
+            for key, source in self.sources.items()
+            if source == file
+        }
+
+    @classmethod
+    def find_files(cls, directory: str) -> list:
+        """Return the tmconf files (`FILES`) of the config `directory` and its partition directories, relative to `directory` in load order."""
+        files = [
+            file for file in cls.FILES if os.path.isfile(os.path.join(directory, file))
+        ]
+        partitions = os.path.join(directory, cls.PARTITIONS_DIRECTORY)
+        if os.path.isdir(partitions):
+            for partition in sorted(os.listdir(partitions)):
+                files.extend(
+                    os.path.join(cls.PARTITIONS_DIRECTORY, partition, file)
+                    for file in cls.FILES
+                    if os.path.isfile(os.path.join(partitions, partition, file))
+                )
+        return files
+
+    def _merge(self, results: list, sort: bool) -> None:
+        """Merge the parsed top-level objects of each file (list of (name, object)) in the order of `files`."""
+        self.dict: Dict = {}
+        self.sources: Dict[str, str] = {}
+        # files of each object defined more than once, in load order
+        self.duplicates: Dict[str, list] = {}
+        for file, items in zip(self.files, results):
+            for key, obj in items:
+                if key in self.sources:
+                    self.duplicates.setdefault(key, [self.sources[key]]).append(file)
+                self.dict[key] = obj
+                self.sources[key] = file
+        for key, files in self.duplicates.items():
+            log.warning("Object '%s' is defined more than once: %s", key, files)
+        if sort:
+            self.dict = dict(sorted(self.dict.items()))
+
+    @staticmethod
+    def _name(source: Union[str, BinaryIO]) -> str:
+        """Return the file path of `source`, the name of a file object or <stream>."""
+        return (
+            source if isinstance(source, str) else getattr(source, "name", "<stream>")
+        )
+
+    @classmethod
+    def _config_file(cls, name: str) -> Optional[str]:
+        """Return the tmconf file of the archive member `name` relative to config/, None if it is not one of `FILES`."""
+        parts = name.removeprefix("./").split("/")
+        if parts[0] != "config":
+            return None
+        if len(parts) == 2 and parts[1] in cls.FILES:
+            return parts[1]
+        if (
+            len(parts) == 4
+            and parts[1] == cls.PARTITIONS_DIRECTORY
+            and parts[3] in cls.FILES
+        ):
+            return "/".join(parts[1:])
+        return None
+
+    @classmethod
+    def _load_order(cls, file: str) -> tuple:
+        """Sort key of the tmconf `file` relative to config/, files of the config directory first, then by partition."""
+        parts = file.split("/")
+        if len(parts) == 1:
+            return (0, "", cls.FILES.index(file))
+        return (1, parts[1], cls.FILES.index(parts[2]))
+
+    @staticmethod
+    def _parse_files(executor: Executor, paths: list, options: tuple) -> list:
+        """Parse the files `paths` in `executor`, largest first, return the results in the order of `paths`."""
+        futures: Dict = {}
+        # the largest file takes longest, start it first
+        for path in sorted(paths, key=os.path.getsize, reverse=True):
+            futures[path] = executor.submit(_parse_file, path, *options)
+        return [futures[path].result() for path in paths]
+
+
+class _TarMemberReader(io.RawIOBase):
+    """Non-seekable reader of a member of a tar archive opened as stream, which fails to tell if it is seekable."""
+
+    def __init__(self, member: BinaryIO, name: str):
+        super().__init__()
+        self._member = member
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._member.readinto(buffer)
+
+
+def _parse_file(
+    tmconf: Union[str, BinaryIO],
+    is_filepath: bool,
+    use_mmap: bool,
+    include: Union[None, str, Iterable[str]],
+    exclude: Union[None, str, Iterable[str]],
+    sort: bool,
+) -> list:
+    """Parse the tmconf file or binary file object `tmconf`, return its top-level objects as list of (name, object), runs in executor workers."""
+    items = Parser._iter_items(tmconf, is_filepath, use_mmap, include, exclude)
+    if not sort:
+        return list(items)
+    # parsing state is not used by _sort_dict, a bare instance is sufficient
+    parser = Parser.__new__(Parser)
+    # each object is sorted as value of a dict, like the objects of Parser.dict
+    return [(key, parser._sort_dict({key: obj})[key]) for key, obj in items]
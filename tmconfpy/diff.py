@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Compare parsed tmconf by top-level object."""
+
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Dict, Iterator, Union
+
+from .parser import Parser
+
+# namedtuple for a changed property of a top-level object, `property` is the list of keys within the object
+# ([] for the whole object), `old` is None for added and `new` is None for removed properties
+propertyChange = namedtuple("propertyChange", ["property", "old", "new"])
+# namedtuple for tabular differences, `change` is one of "removed", "changed", "added"
+tmconfChange = namedtuple(
+    "tmconfChange", ["change", "path", "name", "property", "old", "new"]
+)
+
+
+class TmconfDiff:
+    """
+    Differences between two parsed tmconf, returned by `compare`.
+
+    `added` and `removed` hold the top-level objects by name which only exist in the new or old tmconf,
+    `changed` holds the property changes (`propertyChange`) of each top-level object which exists in both.
+
+    Example:
+        >>> from tmconfpy.diff import compare
+        >>> difference = compare(Parser("ltm a a {\\n    x 1\\n}\\n"), Parser("ltm a a {\\n    x 2\\n}\\n"))
+        >>> difference.to_json_patch()
+        [{'op': 'replace', 'path': '/ltm a a/x', 'value': '2'}]
+    """
+
+    def __init__(self, added: Dict, removed: Dict, changed: Dict):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.added)} added, {len(self.removed)} removed, {len(self.changed)} changed)"
+
+    def to_dict(self) -> Dict:
+        """Return the differences as dict of added and removed objects and the property changes of changed objects."""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": {
+                key: [
+                    {"property": change.property, "old": change.old, "new": change.new}
+                    for change in changes
+                ]
+                for key, changes in self.changed.items()
+            },
+        }
+
+    def to_json_patch(self) -> list:
+        """Return the differences as RFC 6902 JSON Patch, which turns the old parsed tmconf into the new one."""
+        patch = [{"op": "remove", "path": _json_pointer([key])} for key in self.removed]
+        for key, changes in self.changed.items():
+            for change in changes:
+                path = _json_pointer([key, *change.property])
+                if change.old is None:
+                    patch.append({"op": "add", "path": path, "value": change.new})
+                elif change.new is None:
+                    patch.append({"op": "remove", "path": path})
+                else:
+                    patch.append({"op": "replace", "path": path, "value": change.new})
+        patch.extend(
+            {"op": "add", "path": _json_pointer([key]), "value": obj}
+            for key, obj in self.added.items()
+        )
+        return patch
+
+    @property
+    def tabular(self) -> list[tmconfChange]:
+        """Differences as list of tuples (`tmconfChange`), one per removed, changed property and added object."""
+        return list(self._iter_tabular())
+
+    @property
+    def tabular_kv(self) -> list[dict]:
+        """Differences as list of dictionaries, same as `tabular`."""
+        return [entry._asdict() for entry in self._iter_tabular()]
+
+    def _iter_tabular(self) -> Iterator[tmconfChange]:
+        """Yield the entries of `tabular`."""
+        for key, obj in self.removed.items():
+            path, name = Parser._split_object_name(key)
+            yield tmconfChange("removed", path, name, [], obj, None)
+        for key, changes in self.changed.items():
+            path, name = Parser._split_object_name(key)
+            for change in changes:
+                yield tmconfChange(
+                    "changed", path, name, change.property, change.old, change.new
+                )
+        for key, obj in self.added.items():
+            path, name = Parser._split_object_name(key)
+            yield tmconfChange("added", path, name, [], None, obj)
+
+
+def compare(
+    old: Union[Parser, Mapping], new: Union[Parser, Mapping], ignore_order: bool = False
+) -> TmconfDiff:
+    """
+    Compare two parsed tmconf and return the differences.
+
+    Top-level objects are matched by name, identical objects are skipped by a single comparison
+    and only changed objects are compared property by property. Lists are compared as a whole.
+
+    Args:
+        old (Parser, Mapping): Parser or parsed tmconf to compare to.
+        new (Parser, Mapping): Parser or parsed tmconf to compare.
+        ignore_order (bool): Compare lists regardless of the order of their items.
+
+    Example:
+        >>> from tmconfpy import Parser
+        >>> from tmconfpy.diff import compare
+        >>> compare(Parser('old/bigip.conf', is_filepath=True), Parser('new/bigip.conf', is_filepath=True))
+        TmconfDiff(1 added, 0 removed, 2 changed)
+    """
+    old_dict = old.dict if isinstance(old, Parser) else old
+    new_dict = new.dict if isinstance(new, Parser) else new
+    added: Dict = {}
+    removed: Dict = {}
+    changed: Dict = {}
+    for key, old_obj in old_dict.items():
+        if key not in new_dict:
+            removed[key] = old_obj
+            continue
+        new_obj = new_dict[key]
+        # objects reused with `previous` are the same object
+        if old_obj is new_obj or _equal(old_obj, new_obj, ignore_order):
+            continue
+        changes: list = []
+        _compare_values(old_obj, new_obj, [], changes, ignore_order)
+        changed[key] = changes
+    for key, new_obj in new_dict.items():
+        if key not in old_dict:
+            added[key] = new_obj
+    return TmconfDiff(added, removed, changed)
+
+
+def _compare_values(old, new, path: list, changes: list, ignore_order: bool) -> None:
+    """Append the changes between the differing values `old` and `new` at `path` to `changes`."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        changes.append(propertyChange(path, old, new))
+        return
+    for key, old_value in old.items():
+        if key not in new:
+            changes.append(propertyChange([*path, key], old_value, None))
+        elif not _equal(old_value, new[key], ignore_order):
+            _compare_values(old_value, new[key], [*path, key], changes, ignore_order)
+    for key, new_value in new.items():
+        if key not in old:
+            changes.append(propertyChange([*path, key], None, new_value))
+
+
+def _equal(old, new, ignore_order: bool) -> bool:
+    """Returns True if the parsed values `old` and `new` are equal, lists regardless of order if `ignore_order` is True."""
+    if old == new:
+        return True
+    if not ignore_order:
+        return False
+    if isinstance(old, list) and isinstance(new, list):
+        return sorted(old) == sorted(new)
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() == new.keys() and all(
+            _equal(value, new[key], ignore_order) for key, value in old.items()
+        )
+    return False
+
+
+def _json_pointer(keys: list) -> str:
+    """Return the RFC 6901 JSON Pointer of `keys`."""
+    return "".join(f"/{key.replace('~', '~0').replace('/', '~1')}" for key in keys)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""JSON encoders to serialize parsed tmconf."""
+
+import json
+import os
+from collections import namedtuple
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+_msgspec_sorted_encoder = (
+    None if msgspec is None else msgspec.json.Encoder(order="sorted")
+)
+
+# supported JSON encoders, fastest first, json (the stdlib module) is used by default
+JSON_ENCODERS = ("msgspec", "orjson", "ujson", "json", "json_compact")
+# JSON encoders which write the same JSON as json_compact: json.dumps without whitespace and non-ASCII escapes, fastest first
+COMPACT_JSON_ENCODERS = ("msgspec", "orjson", "json_compact")
+# environment variable to select the JSON encoder
+JSON_ENCODER_ENV = "TMCONFPY_JSON_ENCODER"
+
+jsonEncoder = namedtuple(
+    "jsonEncoder", ["name", "dumps", "item_separator", "key_separator"]
+)
+
+
+def get_json_encoder(name: Optional[str] = None) -> jsonEncoder:
+    """
+    Return the JSON encoder `name`, the encoder selected by `JSON_ENCODER_ENV` or the stdlib `json` encoder.
+
+    `dumps` of each encoder returns a `str`. The stdlib encoder writes the same JSON as `json.dumps`, the
+    faster encoders are opt-in: orjson, msgspec and ujson write compact JSON (no whitespace after `,`
+    and `:`), orjson and msgspec don't escape non-ASCII characters.
+
+    Args:
+        name (str): Name of the JSON encoder, one of `JSON_ENCODERS`.
+
+    Example:
+        >>> from tmconfpy.encoder import get_json_encoder
+        >>> get_json_encoder("json").dumps({"ltm profile imap imap": {"activation-mode": "require"}})
+        '{"ltm profile imap imap": {"activation-mode": "require"}}'
+    """
+    name = name or os.environ.get(JSON_ENCODER_ENV) or "json"
+    if name not in JSON_ENCODERS:
+        raise ValueError(
+            f"Unknown JSON encoder '{name}', expected one of: {', '.join(JSON_ENCODERS)}"
+        )
+    if name == "orjson" and orjson is not None:
+        return jsonEncoder(name, _orjson_dumps, ",", ":")
+    if name == "msgspec" and msgspec is not None:
+        return jsonEncoder(name, _msgspec_dumps, ",", ":")
+    if name == "ujson" and ujson is not None:
+        return jsonEncoder(name, _ujson_dumps, ",", ":")
+    if name == "json":
+        return jsonEncoder(name, json.dumps, ", ", ": ")
+    if name == "json_compact":
+        return jsonEncoder(name, _json_compact_dumps, ",", ":")
+    raise ModuleNotFoundError(f"JSON encoder '{name}' is not installed.")
+
+
+def get_compact_json_encoder() -> jsonEncoder:
+    """Return the first of `COMPACT_JSON_ENCODERS` which is installed, the output doesn't depend on the libraries installed."""
+    return get_json_encoder(
+        next(
+            name
+            for name in COMPACT_JSON_ENCODERS
+            if name == "json_compact" or globals()[name] is not None
+        )
+    )
+
+
+def canonical_json(obj: Any) -> bytes:
+    """
+    Serialize `obj` to canonical JSON, compact with sorted keys and UTF-8 encoded.
+
+    The output is the same for all encoders, msgspec or orjson are used if installed,
+    regardless of `JSON_ENCODER_ENV`.
+    """
+    if msgspec is not None:
+        return _msgspec_sorted_encoder.encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def _tuple_default(obj: Any) -> Any:
+    """Encode tuple subclasses, like tabularTmconf, as array."""
+    if isinstance(obj, tuple):
+        return tuple(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_compact_dumps(obj: Any) -> str:
+    """Serialize `obj` to a compact JSON string without escaping non-ASCII characters using the json module."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize `obj` to a JSON string using orjson."""
+    return orjson.dumps(obj, default=_tuple_default).decode()
+
+
+def _msgspec_dumps(obj: Any) -> str:
+    """Serialize `obj` to a JSON string using msgspec."""
+    return msgspec.json.encode(obj).decode()
+
+
+def _ujson_dumps(obj: Any) -> str:
+    """Serialize `obj` to a JSON string using ujson."""
+    return ujson.dumps(obj, escape_forward_slashes=False)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Cross-references between parsed tmconf objects."""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Union
+
+from .parser import Parser
+
+
+class ReferenceGraph:
+    """
+    References between the top-level objects of a parsed tmconf, like virtual to pool, pool to node and monitor.
+
+    The graph is built in one pass over the parsed tmconf. Names of objects (/Partition/name) are
+    collected from the properties in `properties` at any depth of an object: from words of strings
+    (like monitor "/Common/http and /Common/tcp"), items of lists and keys of objects. A name refers to
+    the top-level objects with this name whose path starts with one of the paths of the property,
+    to all objects with this name if the paths are None, or to objects with the same path as the
+    referring object if the paths are empty (defaults-from). Pool members refer to their node.
+
+    Objects are stored by number, lookups return object names (keys of `Parser.dict`).
+
+    Example:
+        >>> from tmconfpy import Parser
+        >>> from tmconfpy.graph import ReferenceGraph
+        >>> graph = ReferenceGraph(Parser('/config/bigip.conf', is_filepath=True))
+        >>> graph.referenced_by("ltm pool /Common/pool_app1")
+        ['ltm virtual /Common/vs_app1']
+        >>> graph.dependents("ltm monitor http /Common/http-custom")
+        ['ltm pool /Common/pool_app1', 'ltm virtual /Common/vs_app1']
+    """
+
+    # properties which refer to other objects and the paths of the objects they refer to
+    PROPERTIES: Dict[str, Optional[tuple]] = {
+        # pool of a virtual, pool of its source-address-translation (ltm snatpool)
+        "pool": ("ltm pool", "ltm snatpool", "gtm pool"),
+        "pools": ("gtm pool",),
+        "profiles": ("ltm profile",),
+        "rules": ("ltm rule", "gtm rule"),
+        "monitor": ("ltm monitor", "gtm monitor"),
+        "members": ("ltm node",),
+        "defaults-from": (),
+    }
+
+    def __init__(
+        self,
+        tmconf: Union[Parser, Mapping],
+        properties: Optional[Dict[str, Optional[tuple]]] = None,
+    ):
+        """
+        Args:
+            tmconf (Parser, Mapping): Parser or parsed tmconf.
+            properties (dict): Properties which refer to other objects and the paths of the objects they refer to, defaults to `PROPERTIES`.
+        """
+        tmconf_dict = tmconf.dict if isinstance(tmconf, Parser) else tmconf
+        self.properties = self.PROPERTIES if properties is None else properties
+        # paths with a trailing space, a path starts with "ltm monitor " or equals "ltm pool "
+        self._prefixes = {
+            prop: None if paths is None else tuple(f"{path} " for path in paths)
+            for prop, paths in self.properties.items()
+        }
+        self.keys: list = list(tmconf_dict)
+        self._numbers = {key: number for number, key in enumerate(self.keys)}
+        self._paths: list = []
+        self._names: Dict = {}
+        for number, key in enumerate(self.keys):
+            path, name = Parser._split_object_name(key)
+            self._paths.append(f"{path} ")
+            self._names.setdefault(name, []).append(number)
+        # references as (property, object number), references and referring objects by object number
+        self._edges: Dict = {}
+        self._forward: Dict = {}
+        self._reverse: Dict = {}
+        # names which don't refer to an object in tmconf, as (property, name) by object name
+        self.unresolved: Dict = {}
+        resolved: Dict = {}
+        for number, obj in enumerate(tmconf_dict.values()):
+            if isinstance(obj, dict):
+                self._add_references(number, obj, resolved)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.keys)} objects, {sum(map(len, self._forward.values()))} references)"
+
+    def edges(self, key: str) -> list:
+        """Return the references of the object `key` as list of tuples (property, object name)."""
+        return [
+            (prop, self.keys[target])
+            for prop, target in self._edges.get(self._numbers[key], ())
+        ]
+
+    def references(self, key: str) -> list:
+        """Return the names of the objects the object `key` refers to."""
+        return [
+            self.keys[target] for target in self._forward.get(self._numbers[key], ())
+        ]
+
+    def referenced_by(self, key: str) -> list:
+        """Return the names of the objects which refer to the object `key`."""
+        return [
+            self.keys[source] for source in self._reverse.get(self._numbers[key], ())
+        ]
+
+    def dependencies(self, key: str) -> list:
+        """Return the names of the objects the object `key` refers to directly or indirectly, like the pools, nodes and monitors of a virtual."""
+        return self._closure(key, self._forward)
+
+    def dependents(self, key: str) -> list:
+        """Return the names of the objects which refer to the object `key` directly or indirectly, the objects affected if it is changed or deleted."""
+        return self._closure(key, self._reverse)
+
+    def _closure(self, key: str, adjacency: Dict) -> list:
+        """Return the names of the objects reachable from the object `key` in `adjacency`, in order of distance."""
+        start = self._numbers[key]
+        visited = bytearray(len(self.keys))
+        visited[start] = 1
+        queue = [start]
+        for number in queue:
+            for target in adjacency.get(number, ()):
+                if not visited[target]:
+                    visited[target] = 1
+                    queue.append(target)
+        return [self.keys[number] for number in queue[1:]]
+
+    def _add_references(self, number: int, obj: Dict, resolved: Dict) -> None:
+        """Add the references of the top-level object `number`, `resolved` holds the objects of names resolved before."""
+        edges = []
+        for prop, name in self._iter_references(obj):
+            # only defaults-from depends on the path of the referring object
+            cache_key = (prop, name, self._paths[number])
+            targets = resolved.get(cache_key)
+            if targets is None:
+                targets = resolved[cache_key] = self._resolve(number, prop, name)
+            if not targets:
+                self.unresolved.setdefault(self.keys[number], []).append((prop, name))
+            edges.extend((prop, target) for target in targets)
+        if not edges:
+            return
+        self._edges[number] = edges
+        forward = self._forward[number] = []
+        for _, target in edges:
+            if target != number and target not in forward:
+                forward.append(target)
+                self._reverse.setdefault(target, []).append(number)
+
+    def _iter_references(self, obj: Dict) -> Iterator[tuple]:
+        """Yield the names (property, name) in the properties of `obj` which refer to other objects, at any depth."""
+        stack = [obj]
+        while stack:
+            for prop, value in stack.pop().items():
+                if prop in self.properties:
+                    for name in value.split() if isinstance(value, str) else value:
+                        if name.startswith("/"):
+                            yield prop, name
+                if isinstance(value, dict):
+                    # like the monitor of a pool member
+                    stack.append(value)
+
+    def _resolve(self, number: int, prop: str, name: str) -> list:
+        """Return the numbers of the objects `name` in property `prop` of object `number` refers to."""
+        candidates = self._names.get(name)
+        if candidates is None and prop == "members":
+            # pool member /Common/node:80 (IPv4, name) or /Common/node.80 (IPv6)
+            for separator in (":", "."):
+                node = name.rpartition(separator)[0]
+                if node in self._names:
+                    candidates = self._names[node]
+                    break
+        if not candidates:
+            return []
+        prefixes = self._prefixes[prop]
+        if prefixes is None:
+            return candidates
+        if not prefixes:
+            prefixes = (self._paths[number],)
+        return [
+            candidate
+            for candidate in candidates
+            if self._paths[candidate].startswith(prefixes)
+        ]
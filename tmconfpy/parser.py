@@ -1,12 +1,54 @@
 # -*- coding: utf-8 -*-
 """tmconfpy - Serialize F5 BIG-IP tmconf files to dict/JSON."""
 
+import fnmatch
+import hashlib
 import json
 import logging
+import mmap
+import os
 import re
+import stat
 import sys
-from collections import namedtuple
-from typing import Dict, Optional
+from array import array
+from collections import Counter, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, compress
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    Union,
+)
+
+try:
+    from .encoder import canonical_json, get_json_encoder
+except ImportError:
+    # parser.py is also used on its own, like the module_utils of the ansible collection, with the stdlib JSON encoder only
+    _jsonEncoder = namedtuple(
+        "_jsonEncoder", ["name", "dumps", "item_separator", "key_separator"]
+    )
+
+    def get_json_encoder(name: Optional[str] = None) -> _jsonEncoder:
+        """Return the stdlib JSON encoder, other JSON encoders require tmconfpy.encoder."""
+        if name not in (None, "json"):
+            raise ModuleNotFoundError(
+                f"JSON encoder '{name}' requires the tmconfpy package."
+            )
+        return _jsonEncoder("json", json.dumps, ", ", ": ")
+
+    def canonical_json(obj) -> bytes:
+        """Serialize `obj` to canonical JSON, compact with sorted keys and UTF-8 encoded, see tmconfpy.encoder.canonical_json."""
+        return json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
 
 # pylint: disable=line-too-long,too-many-branches
 
@@ -23,18 +65,81 @@ log = logging.getLogger(__name__)
 
 # namedtuple for tabular data
 tabularTmconf = namedtuple("tabularTmconf", ["path", "name", "object"])
+# namedtuple for top-level objects found by Parser._iter_tmconf_blocks
+_tmconfBlock = namedtuple("_tmconfBlock", ["lines", "start", "end", "irule"])
+# namedtuple for top-level object names changed compared to a previous Parser
+tmconfChanges = namedtuple("tmconfChanges", ["added", "removed", "changed"])
+# namedtuple for the parts of a top-level object name, None if the name has no such part
+tmconfKey = namedtuple("tmconfKey", ["module", "type", "subtype", "name", "partition"])
+# namedtuple for the index of top-level object names built by Parser._get_key_index
+_tmconfKeyIndex = namedtuple("_tmconfKeyIndex", ["keys", "paths", "partitions"])
 
 
 class Parser:
     """Parse tmconf data or file and serialize it to a python dict or JSON (str)."""
 
-    def __init__(self, tmconf: str, is_filepath: bool = False, sort: bool = False):
+    ENGINES = ("stream", "legacy")
+    # what a parser keeps once computed: derived views and dict, dict only or nothing
+    KEEP_POLICIES = ("all", "dict", "none")
+    # number of lines of top-level objects submitted to an executor at once
+    PARALLEL_CHUNK_LINES = 20000
+    # approximate number of bytes of the input scanned by an executor worker at once
+    PARALLEL_CHUNK_SIZE = 512 * 1024
+    # file name suffix and format version of index files
+    INDEX_SUFFIX = ".tmconfidx"
+    INDEX_VERSION = 1
+    # inputs of this size (bytes) or larger are interned by default
+    INTERN_MIN_SIZE = 1024 * 1024
+    # longer strings, like iRules, are not interned
+    INTERN_MAX_LENGTH = 128
+    # approximate number of characters written at once by the write_* methods
+    WRITE_CHUNK_SIZE = 64 * 1024
+    # size (bytes) of the digests returned by `fingerprints` and `fingerprint`
+    FINGERPRINT_SIZE = 16
+
+    def __init__(
+        self,
+        tmconf: Union[str, bytes, BinaryIO],
+        is_filepath: bool = False,
+        sort: bool = False,
+        engine: str = "stream",
+        use_mmap: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        lazy: bool = False,
+        index: Union[bool, str] = False,
+        cache=None,
+        previous: Optional["Parser"] = None,
+        separate_irules: bool = False,
+        intern: Union[None, bool, Dict] = None,
+        json_encoder: Optional[str] = None,
+        keep: str = "all",
+        keep_text: bool = True,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ):
         '''
         Parse tmconf data or file and serialize it to a python dict and JSON.
 
         Args:
-            tmconf (str): tmconf data (str) or file path.
+            tmconf (str, bytes, BinaryIO): tmconf data (str or bytes), binary file object or file path.
             is_filepath (bool): If True, `tmconf` is a file path, otherwise it is tmconf data.
+            sort (bool): If True, sort dictionaries and lists of the parsed tmconf recursively.
+            engine (str): Parse engine to use, `stream` (single pass, default) or `legacy` (split/group/orchestrate).
+            use_mmap (bool): If True, memory-map file paths and regular files instead of reading them line by line.
+            workers (int): Number of worker processes to parse top-level objects in parallel (threads on free-threaded python).
+            executor (Executor): concurrent.futures executor to parse top-level objects in parallel, takes precedence over `workers`.
+            lazy (bool): If True, only index the top-level objects, `dict` is a Mapping which parses each object on first access.
+            index (bool, str): If True or an index file path, load the index of top-level objects from the index file, create it if missing or outdated. Defaults to the file path with `INDEX_SUFFIX`, implies `lazy`.
+            cache (ParseCache): Cache for parse results, keyed by the content of `tmconf` and parser options. Any object providing `get(key)` and `put(key, value)` for JSON strings is supported.
+            previous (Parser): Parser of an earlier version of the tmconf, parsed objects of unchanged top-level objects are reused (shared with `previous`) instead of parsed again, see `changes`.
+            separate_irules (bool): If True, iRules are not part of `dict`, only their position is recorded and each iRule is read from the input on first access of `irules`.
+            intern (bool, dict): If True, equal keys and short strings of the parsed tmconf share a single string object. A dict is used as intern table and can be shared between parsers. Defaults to True for inputs of `INTERN_MIN_SIZE` bytes or more and non-seekable file objects.
+            json_encoder (str): JSON encoder for `json`, `jsonl`, `tabular_json`, `tabular_json_kv` and the `write_*` methods, one of `tmconfpy.encoder.JSON_ENCODERS`. Defaults to the environment variable `TMCONFPY_JSON_ENCODER` or `json`, the stdlib encoder, see `tmconfpy.encoder.get_json_encoder`.
+            keep (str): What is kept once computed, `all` (default) keeps `dict` and the views derived from it (`json`, `tabular`, ...), `dict` keeps `dict` only, `none` keeps nothing and parses the input again on each access of `dict`.
+            keep_text (bool): If False, tmconf read from a file or decoded from bytes for `text` is not kept and read again on each access.
+            include (str, Iterable[str]): Only parse top-level objects whose name starts with one of these paths (like `ltm virtual`, whole words) or matches one of these glob patterns (like `ltm profile *ssl /Common/*`). Other objects are skipped without being parsed.
+            exclude (str, Iterable[str]): Skip top-level objects whose name starts with one of these paths or matches one of these glob patterns, takes precedence over `include`.
 
         Example:
             >>> from tmconfpy import Parser
@@ -59,82 +164,665 @@ class Parser:
             >>> parsed.jsonl
             '{"path": "ltm profile pop3", "name": "pop3", "object": {"activation-mode": "require"}}\n{"path": "ltm profile imap", "name": "imap", "object": {"activation-mode": "require"}}'
         '''
-        self._tmconf_text = self._read_tmconf_file(tmconf) if is_filepath else tmconf
+        if index and not is_filepath:
+            raise ValueError("An index file requires a file path as input.")
+        lazy = lazy or bool(index)
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown engine '{engine}', expected one of: {', '.join(self.ENGINES)}"
+            )
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be 1 or greater, got {workers}")
+        if engine == "legacy" and (executor is not None or (workers or 1) > 1):
+            raise ValueError("Parallel parsing requires the stream engine.")
+        if separate_irules and engine == "legacy":
+            raise ValueError("Separate iRules require the stream engine.")
+        if lazy and engine == "legacy":
+            raise ValueError("Lazy parsing requires the stream engine.")
+        if lazy and (executor is not None or (workers or 1) > 1):
+            raise ValueError("Lazy parsing can not be combined with parallel parsing.")
+        if lazy and cache is not None:
+            raise ValueError("Lazy parsing can not be combined with a cache.")
+        if previous is not None and (
+            engine == "legacy"
+            or lazy
+            or executor is not None
+            or (workers or 1) > 1
+            or cache is not None
+        ):
+            raise ValueError(
+                "Incremental parsing requires the stream engine and can not be combined with lazy, parallel or cached parsing."
+            )
+        if keep not in self.KEEP_POLICIES:
+            raise ValueError(
+                f"Unknown keep policy '{keep}', expected one of: {', '.join(self.KEEP_POLICIES)}"
+            )
+        if keep == "none" and lazy:
+            raise ValueError("Lazy parsing can not be combined with keep='none'.")
+        if previous is not None and (
+            previous._sort != sort or previous._separate_irules != separate_irules
+        ):
+            raise ValueError(
+                "previous must be parsed with the same sort and separate_irules options."
+            )
+        include = self._as_patterns(include)
+        exclude = self._as_patterns(exclude)
+        if previous is not None and (
+            previous._include != include or previous._exclude != exclude
+        ):
+            raise ValueError(
+                "previous must be parsed with the same include and exclude options."
+            )
+        self._sort = sort
+        self._separate_irules = separate_irules
+        self._engine = engine
+        self._workers = workers
+        self._executor = executor
+        self._lazy = lazy
+        self._index = index
+        self._cache = cache
+        self._keep = keep
+        self._keep_text = keep_text
+        self._include = include
+        self._exclude = exclude
+        # returns True for the names of top-level objects to parse, None to parse all
+        self._select = self._compile_selection(include, exclude)
+        self._json_encoder = get_json_encoder(json_encoder)
+        self._tmconf_source = tmconf
+        self._is_filepath = is_filepath
+        self._use_mmap = use_mmap
+        self._tmconf_position = (
+            tmconf.tell() if hasattr(tmconf, "seekable") and tmconf.seekable() else None
+        )
+        self._tmconf_text: Optional[str] = (
+            tmconf if isinstance(tmconf, str) and not is_filepath else None
+        )
+        if (lazy or separate_irules or keep == "none") and not self._is_rereadable():
+            raise ValueError(
+                "Lazy parsing, separate iRules and keep='none' require a seekable file object."
+            )
+        # views derived from dict, None until computed and if not kept
+        self._tmconf_json: Optional[str] = None
+        self._tmconf_jsonl: Optional[str] = None
+        self._tmconf_tabular: Optional[list[tabularTmconf]] = None
+        self._tmconf_tabular_kv: Optional[list[dict]] = None
+        self._tmconf_tabular_json: Optional[str] = None
+        self._tmconf_tabular_json_kv: Optional[str] = None
+        self._tmconf_columnar: Optional[ColumnarTmconf] = None
+        self._tmconf_key_index: Optional[_tmconfKeyIndex] = None
+        # digests of top-level objects by name, recorded by serial stream parsing
+        self._block_digests: Optional[Dict] = None
+        self._tmconf_changes: Optional[tmconfChanges] = None
+        # fingerprints of top-level objects by name, computed on first access and kept
+        self._fingerprints: Optional[Dict] = None
+        # positions of iRules by name and the mapping returned by `irules`, with separate_irules
+        self._irule_index: Optional[Dict] = None
+        self._irules: Optional[LazyTmconfDict] = None
+        # interned strings by value, None if interning is disabled
+        self._intern_table: Optional[Dict] = None
+        if isinstance(intern, dict):
+            self._intern_table = intern
+        elif intern or (intern is None and self._is_large_source()):
+            self._intern_table = {}
 
-        self._tmconf_dict = self._parse_tmconf_content()
-        if sort:
-            self._tmconf_dict = self._sort_dict(self._tmconf_dict)
-        self._tmconf_json = ""
-        self._tmconf_jsonl = ""
-        self._tmconf_tabular: list[tabularTmconf] = []
-        self._tmconf_tabular_kv: list[dict] = []
-        self._tmconf_tabular_json = ""
-        self._tmconf_tabular_json_kv = ""
+        # the parsed tmconf, None if it is not kept
+        self._tmconf_dict: Optional[Mapping] = None
+        tmconf_dict = self._parse(previous)
+        if keep != "none":
+            self._tmconf_dict = tmconf_dict
 
     @property
     def text(self) -> str:
-        """Plain tmconf read from file or provided as input."""
-        return self._tmconf_text
+        """Plain tmconf read from file or provided as input, files and bytes are decoded on first access."""
+        if self._tmconf_text is not None:
+            return self._tmconf_text
+        text = self._read_tmconf_source()
+        if self._keep_text:
+            self._tmconf_text = text
+        return text
 
     @property
     def dict(self) -> dict:
-        """Parsed tmconf as python dictionary."""
-        return self._tmconf_dict
+        """Parsed tmconf as python dictionary, a read-only LazyTmconfDict mapping when parsing lazily."""
+        if self._tmconf_dict is not None:
+            return self._tmconf_dict
+        # not kept or released, parse again
+        tmconf_dict = self._parse()
+        if self._keep != "none":
+            self._tmconf_dict = tmconf_dict
+        return tmconf_dict
+
+    def release(self) -> None:
+        """
+        Release the views derived from `dict`, the tmconf read for `text` and `dict` itself.
+
+        Everything is computed again from the input on next access, `dict` is only
+        released if the input can be read again (not a non-seekable file object).
+        """
+        self._tmconf_json = None
+        self._tmconf_jsonl = None
+        self._tmconf_tabular = None
+        self._tmconf_tabular_kv = None
+        self._tmconf_tabular_json = None
+        self._tmconf_tabular_json_kv = None
+        self._tmconf_columnar = None
+        self._tmconf_key_index = None
+        if self._is_filepath or not isinstance(self._tmconf_source, str):
+            self._tmconf_text = None
+        if self._is_rereadable():
+            self._tmconf_dict = None
+            self._irules = None
+
+    @property
+    def irules(self) -> Mapping:
+        """iRules (ltm rule, gtm rule, pem irule) by name, a read-only LazyTmconfDict which reads each iRule from the input on first access with `separate_irules`."""
+        if not self._separate_irules:
+            tmconf_dict = self.dict
+            return {key: tmconf_dict[key] for key in tmconf_dict if self._is_irule(key)}
+        if self._irules is None:
+            if self._irule_index is None:
+                # parse result was cached, iRules were not scanned
+                self._irule_index = {
+                    key: block
+                    for key, block in self._index_tmconf_stream().items()
+                    if self._is_irule(key)
+                    and (self._select is None or self._select(key))
+                }
+            self._irules = LazyTmconfDict(self, self._irule_index, self._sort)
+        return self._irules
+
+    @property
+    def changes(self) -> Optional[tmconfChanges]:
+        """Names of top-level objects added, removed and changed compared to `previous`, None without `previous`."""
+        return self._tmconf_changes
+
+    @property
+    def fingerprints(self) -> Dict[str, str]:
+        """
+        Fingerprints of the top-level objects by name, a hex digest of the content of each object.
+
+        Fingerprints don't depend on the order of keys and lists, the parser options or the JSON encoder,
+        equal objects have equal fingerprints. They are computed on first access and kept, with `previous`
+        the fingerprints of unchanged objects are taken from `previous` if it computed them.
+        """
+        if self._fingerprints is None:
+            self._fingerprints = {
+                key: self._fingerprint(obj) for key, obj in self.dict.items()
+            }
+        return self._fingerprints
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the whole tmconf, a hex digest of `fingerprints` which doesn't depend on the order of objects."""
+        return self._digest(canonical_json(self.fingerprints))
 
     @property
     def json(self) -> str:
         """Parsed tmconf as JSON string."""
-        if not self._tmconf_json:
-            self._tmconf_json = json.dumps(self._tmconf_dict)
-        return self._tmconf_json
+        if self._tmconf_json is not None:
+            return self._tmconf_json
+        tmconf_dict = self.dict
+        return self._keep_view(
+            "_tmconf_json",
+            self._json_encoder.dumps(
+                tmconf_dict if isinstance(tmconf_dict, dict) else dict(tmconf_dict)
+            ),
+        )
 
     @property
     def jsonl(self) -> str:
         """Parsed tmconf as JSONL string."""
-        if not self._tmconf_jsonl:
-            jsonl = [
-                json.dumps(path_name_object._asdict())
-                for path_name_object in self.tabular
-            ]
-            self._tmconf_jsonl = "\n".join(jsonl)
-        return self._tmconf_jsonl
+        if self._tmconf_jsonl is not None:
+            return self._tmconf_jsonl
+        jsonl = [
+            self._json_encoder.dumps(path_name_object._asdict())
+            for path_name_object in self.tabular
+        ]
+        return self._keep_view("_tmconf_jsonl", "\n".join(jsonl))
 
     @property
     def tabular_json(self) -> str:
         """Parsed tmconf as JSON array of arrays, each with three fields, path (str), name (str) object (object)."""
-        if not self._tmconf_tabular_json:
-            self._tmconf_tabular_json = json.dumps(
+        if self._tmconf_tabular_json is not None:
+            return self._tmconf_tabular_json
+        return self._keep_view(
+            "_tmconf_tabular_json",
+            self._json_encoder.dumps(
                 [path_name_object for path_name_object in self.tabular]
-            )
-        return self._tmconf_tabular_json
+            ),
+        )
 
     @property
     def tabular_json_kv(self) -> str:
         """Parsed tmconf as JSON array of dictionaries, each with three fields, path (str), name (str) object (object)."""
-        if not self._tmconf_tabular_json_kv:
-            self._tmconf_tabular_json_kv = json.dumps(self.tabular_kv)
-        return self._tmconf_tabular_json_kv
+        if self._tmconf_tabular_json_kv is not None:
+            return self._tmconf_tabular_json_kv
+        return self._keep_view(
+            "_tmconf_tabular_json_kv", self._json_encoder.dumps(self.tabular_kv)
+        )
 
     @property
     def tabular(self) -> list[tabularTmconf]:
         """Parsed tmconf as list of tuples, each with three fields, path (str), name (str) object (dict)."""
-        if not self._tmconf_tabular:
-            self._tmconf_tabular = [
-                (lambda path, obj: tabularTmconf(" ".join(path[:-1]), path[-1], obj))(
-                    item[0].split(" "), item[1]
-                )
-                for item in self.dict.items()
-            ]
-        return self._tmconf_tabular
+        if self._tmconf_tabular is not None:
+            return self._tmconf_tabular
+        return self._keep_view("_tmconf_tabular", list(self._iter_tabular()))
 
     @property
     def tabular_kv(self) -> list[dict]:
         """Parsed tmconf as list of dictionaries, each with three fields, path (str), name (str) object (dict)."""
-        if not self._tmconf_tabular_kv:
-            self._tmconf_tabular_kv = [
-                entry_namedtuple._asdict() for entry_namedtuple in self.tabular
-            ]
-        return self._tmconf_tabular_kv
+        if self._tmconf_tabular_kv is not None:
+            return self._tmconf_tabular_kv
+        return self._keep_view(
+            "_tmconf_tabular_kv",
+            [entry_namedtuple._asdict() for entry_namedtuple in self.tabular],
+        )
+
+    def write_json(self, fp: TextIO, sort: bool = False) -> None:
+        """Write the parsed tmconf as JSON to the text file object `fp`, same as `json` but encoded and written object by object. If `sort` is True, keys and lists are written in sorted order, without sorting `dict`."""
+        sort = sort and not self._sort
+        if self._tmconf_json is not None and not sort:
+            fp.write(self._tmconf_json)
+            return
+        tmconf_dict = self.dict
+        dumps = self._json_encoder.dumps
+        if sort:
+            chunks: Iterable[str] = (
+                f"{dumps(key)}{self._json_encoder.key_separator}{self._dumps_sorted(tmconf_dict[key])}"
+                for key in sorted(tmconf_dict)
+            )
+        else:
+            chunks = (dumps({key: obj})[1:-1] for key, obj in tmconf_dict.items())
+        self._write_chunks(
+            fp,
+            chain(
+                ["{"],
+                self._iter_separated(chunks, self._json_encoder.item_separator),
+                ["}"],
+            ),
+        )
+
+    def write_jsonl(self, fp: TextIO, sort: bool = False) -> None:
+        """Write the parsed tmconf as JSONL to the text file object `fp`, same as `jsonl` but encoded and written object by object. If `sort` is True, objects, keys and lists are written in sorted order, without sorting `dict`."""
+        sort = sort and not self._sort
+        if self._tmconf_jsonl is not None and not sort:
+            fp.write(self._tmconf_jsonl)
+            return
+        self._write_chunks(
+            fp,
+            self._iter_separated(
+                (
+                    self._dumps_tabular_entry(entry, True, sort)
+                    for entry in self._iter_tabular(sort)
+                ),
+                "\n",
+            ),
+        )
+
+    def write_tabular(self, fp: TextIO, kv: bool = False, sort: bool = False) -> None:
+        """Write the parsed tmconf as JSON array to the text file object `fp`, same as `tabular_json` (`tabular_json_kv` if `kv` is True) but encoded and written object by object. If `sort` is True, objects, keys and lists are written in sorted order, without sorting `dict`."""
+        sort = sort and not self._sort
+        tabular_json = self._tmconf_tabular_json_kv if kv else self._tmconf_tabular_json
+        if tabular_json is not None and not sort:
+            fp.write(tabular_json)
+            return
+        self._write_chunks(
+            fp,
+            chain(
+                ["["],
+                self._iter_separated(
+                    (
+                        self._dumps_tabular_entry(entry, kv, sort)
+                        for entry in self._iter_tabular(sort)
+                    ),
+                    self._json_encoder.item_separator,
+                ),
+                ["]"],
+            ),
+        )
+
+    @property
+    def sorted_view(self) -> "SortedTmconfView":
+        """Parsed tmconf as read-only mapping with keys and lists in sorted order, like `dict` of `Parser(sort=True)` but sorted on access instead of copied, see `SortedTmconfView`."""
+        return SortedTmconfView(self.dict)
+
+    @property
+    def columnar(self) -> "ColumnarTmconf":
+        """Parsed tmconf as columns path (dictionary-encoded), name and object, see `ColumnarTmconf`."""
+        if self._tmconf_columnar is not None:
+            return self._tmconf_columnar
+        return self._keep_view(
+            "_tmconf_columnar", ColumnarTmconf.from_items(self.dict.items())
+        )
+
+    @property
+    def object_keys(self) -> Dict[str, tmconfKey]:
+        """Parts of the top-level object names (module, type, subtype, name, partition) by name, see `tmconfKey`."""
+        return self._get_key_index().keys
+
+    def by_path(self, path: str) -> list[tabularTmconf]:
+        """
+        Return the top-level objects of `path` (like "ltm virtual") as list of tuples, same as the entries of `tabular` with this path.
+
+        The index of paths is built on first use from the names of the top-level objects, with `lazy`
+        only the objects returned are parsed.
+        """
+        tmconf_dict = self.dict
+        index = self._get_key_index()
+        return [
+            tabularTmconf(path, index.keys[key].name, tmconf_dict[key])
+            for key in index.paths.get(path, ())
+        ]
+
+    def by_partition(self, partition: str) -> list[tabularTmconf]:
+        """Return the top-level objects in `partition` (like "/Common") as list of tuples, same as the entries of `tabular` in this partition."""
+        tmconf_dict = self.dict
+        index = self._get_key_index()
+        return [
+            self._tabular_entry(key, tmconf_dict[key], self._intern_table)
+            for key in index.partitions.get(f"/{partition.strip('/')}", ())
+        ]
+
+    def _get_key_index(self) -> _tmconfKeyIndex:
+        """Return the parts of the top-level object names and the names by path and partition."""
+        if self._tmconf_key_index is not None:
+            return self._tmconf_key_index
+        keys: Dict = {}
+        paths: Dict = {}
+        partitions: Dict = {}
+        for key in self.dict:
+            path, name = self._split_object_name(key)
+            object_key = keys[key] = self._split_path(path, name)
+            paths.setdefault(path, []).append(key)
+            if object_key.partition is not None:
+                partitions.setdefault(object_key.partition, []).append(key)
+        return self._keep_view(
+            "_tmconf_key_index", _tmconfKeyIndex(keys, paths, partitions)
+        )
+
+    @classmethod
+    def iter_objects(
+        cls,
+        tmconf: Union[str, bytes, BinaryIO],
+        is_filepath: bool = False,
+        use_mmap: bool = False,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ) -> Iterator[tabularTmconf]:
+        """
+        Parse tmconf data or file lazily and yield each top-level object as soon as it is complete.
+
+        Only the lines of the current top-level object are kept in memory, files are read line by line.
+        Unlike `Parser.dict`, objects with duplicate names are yielded once per occurrence.
+
+        Args:
+            tmconf (str, bytes, BinaryIO): tmconf data (str or bytes), binary file object or file path.
+            is_filepath (bool): If True, `tmconf` is a file path, otherwise it is tmconf data.
+            use_mmap (bool): If True, memory-map file paths and regular files instead of reading them line by line.
+            include (str, Iterable[str]): Only parse top-level objects selected by these paths or glob patterns, see `Parser`.
+            exclude (str, Iterable[str]): Skip top-level objects selected by these paths or glob patterns, see `Parser`.
+
+        Example:
+            >>> from tmconfpy import Parser
+            >>> for entry in Parser.iter_objects('example/imap.tmconf', is_filepath=True):
+            ...     print(entry)
+            tabularTmconf(path='ltm profile imap', name='imap', object={'activation-mode': 'require'})
+        """
+        for key, obj in cls._iter_items(
+            tmconf, is_filepath, use_mmap, include, exclude
+        ):
+            yield cls._tabular_entry(key, obj)
+
+    @classmethod
+    def _iter_items(
+        cls,
+        tmconf: Union[str, bytes, BinaryIO],
+        is_filepath: bool = False,
+        use_mmap: bool = False,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ) -> Iterator[tuple]:
+        """Yield each top-level object as (name, object) as soon as it is complete, once per occurrence."""
+        # parsing state is local to the generators, a bare instance is sufficient
+        parser = cls.__new__(cls)
+        select = cls._compile_selection(
+            cls._as_patterns(include), cls._as_patterns(exclude)
+        )
+        lines = cls._iter_source_lines(tmconf, is_filepath, use_mmap)
+        for block in parser._iter_tmconf_blocks(lines, select=select):
+            yield from parser._build_object(block.lines).items()
+
+    def _iter_tabular(self, sort: bool = False) -> Iterator[tabularTmconf]:
+        """Yield the entries of `tabular`, without keeping them unless `tabular` was built already. If `sort` is True, yield them sorted by object name."""
+        if self._tmconf_tabular is not None and not sort:
+            return iter(self._tmconf_tabular)
+        tmconf_dict = self.dict
+        return (
+            self._tabular_entry(key, tmconf_dict[key], self._intern_table)
+            for key in (sorted(tmconf_dict) if sort else tmconf_dict)
+        )
+
+    def _dumps_tabular_entry(
+        self, entry: tabularTmconf, kv: bool = False, sort: bool = False
+    ) -> str:
+        """Encode a tabular entry as JSON array, as JSON object if `kv` is True, with keys and lists of the object in sorted order if `sort` is True."""
+        dumps = self._json_encoder.dumps
+        if not sort:
+            return dumps(entry._asdict() if kv else entry)
+        values = [
+            dumps(entry.path),
+            dumps(entry.name),
+            self._dumps_sorted(entry.object),
+        ]
+        if kv:
+            return f"{{{self._json_encoder.item_separator.join(f'{dumps(field)}{self._json_encoder.key_separator}{value}' for field, value in zip(entry._fields, values))}}}"
+        return f"[{self._json_encoder.item_separator.join(values)}]"
+
+    def _dumps_sorted(self, obj) -> str:
+        """Encode the parsed object `obj` as JSON with keys and lists in sorted order, same as `_sort_dict` but without copying `obj`."""
+        chunks: list = []
+        self._encode_sorted(obj, chunks)
+        return "".join(chunks)
+
+    def _encode_sorted(self, obj, chunks: list) -> None:
+        """Append the JSON of the parsed object `obj` with keys and lists in sorted order to `chunks`."""
+        dumps = self._json_encoder.dumps
+        if isinstance(obj, dict) and not any(
+            isinstance(value, dict) for value in obj.values()
+        ):
+            # flat objects are encoded at once, the sorted copy is dropped right away
+            chunks.append(
+                dumps(
+                    {
+                        key: sorted(obj[key])
+                        if isinstance(obj[key], list)
+                        else obj[key]
+                        for key in sorted(obj)
+                    }
+                )
+            )
+        elif isinstance(obj, dict):
+            chunks.append("{")
+            separator = ""
+            for key in sorted(obj):
+                chunks.append(
+                    f"{separator}{dumps(key)}{self._json_encoder.key_separator}"
+                )
+                self._encode_sorted(obj[key], chunks)
+                separator = self._json_encoder.item_separator
+            chunks.append("}")
+        elif isinstance(obj, list):
+            chunks.append(dumps(sorted(obj)))
+        else:
+            chunks.append(dumps(obj))
+
+    @staticmethod
+    def _iter_separated(chunks: Iterable[str], separator: str = ", ") -> Iterator[str]:
+        """Yield `chunks` with `separator` in front of all but the first one."""
+        chunks = iter(chunks)
+        for chunk in chunks:
+            yield chunk
+            break
+        for chunk in chunks:
+            yield separator
+            yield chunk
+
+    def _write_chunks(self, fp: TextIO, chunks: Iterable[str]) -> None:
+        """Write `chunks` to the file object `fp`, joined to about `WRITE_CHUNK_SIZE` characters per write."""
+        buffer: list = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self.WRITE_CHUNK_SIZE:
+                fp.write("".join(buffer))
+                buffer = []
+                size = 0
+        if buffer:
+            fp.write("".join(buffer))
+
+    @classmethod
+    def stream_jsonl(
+        cls,
+        tmconf: Union[str, bytes, BinaryIO],
+        fp: TextIO,
+        is_filepath: bool = False,
+        use_mmap: bool = False,
+        json_encoder: Optional[str] = None,
+        include: Union[None, str, Iterable[str]] = None,
+        exclude: Union[None, str, Iterable[str]] = None,
+    ) -> None:
+        """
+        Parse tmconf data or file and write each top-level object as JSONL line to the text file object `fp` as soon as it is parsed.
+
+        Unlike `Parser.jsonl`, the result is never complete in memory, only the current top-level object
+        is kept. Like `iter_objects`, objects with duplicate names are written once per occurrence.
+
+        Args:
+            tmconf (str, bytes, BinaryIO): tmconf data (str or bytes), binary file object or file path.
+            fp (TextIO): Text file object to write the JSONL lines to.
+            is_filepath (bool): If True, `tmconf` is a file path, otherwise it is tmconf data.
+            use_mmap (bool): If True, memory-map file paths and regular files instead of reading them line by line.
+            json_encoder (str): JSON encoder, one of `tmconfpy.encoder.JSON_ENCODERS`, see `Parser`.
+            include (str, Iterable[str]): Only parse top-level objects selected by these paths or glob patterns, see `Parser`.
+            exclude (str, Iterable[str]): Skip top-level objects selected by these paths or glob patterns, see `Parser`.
+
+        Example:
+            >>> import sys
+            >>> from tmconfpy import Parser
+            >>> Parser.stream_jsonl('example/imap.tmconf', sys.stdout, is_filepath=True)
+            {"path": "ltm profile imap", "name": "imap", "object": {"activation-mode": "require"}}
+        """
+        dumps = get_json_encoder(json_encoder).dumps
+        separator = ""
+        for entry in cls.iter_objects(
+            tmconf, is_filepath, use_mmap, include=include, exclude=exclude
+        ):
+            fp.write(f"{separator}{dumps(entry._asdict())}")
+            separator = "\n"
+
+    @staticmethod
+    def _tabular_entry(
+        key: str, obj, intern_table: Optional[Dict] = None
+    ) -> tabularTmconf:
+        """Split the object name `key` into path and name and return a tabularTmconf, the path is interned in `intern_table` if given."""
+        path, name = Parser._split_object_name(key)
+        if intern_table is not None:
+            path = intern_table.setdefault(path, path)
+        return tabularTmconf(path, name, obj)
+
+    @staticmethod
+    def _split_object_name(key: str) -> tuple:
+        """Split the top-level object name `key` into path and name, a quoted name may contain spaces."""
+        if key.endswith('"'):
+            start = key.find(' "')
+            if start != -1:
+                return key[:start], key[start + 1 :]
+        path, _, name = key.rpartition(" ")
+        return path, name
+
+    @staticmethod
+    def _split_path(path: str, name: str) -> tmconfKey:
+        """Return the parts of the path and name of a top-level object, the partition is the first folder of a full name (/Common/name)."""
+        module, _, rest = path.partition(" ")
+        object_type, _, subtype = rest.partition(" ")
+        folders = name.strip('"').split("/")
+        partition = f"/{folders[1]}" if len(folders) > 2 and not folders[0] else None
+        return tmconfKey(
+            module or None, object_type or None, subtype or None, name, partition
+        )
+
+    def _parse(self, previous: Optional["Parser"] = None) -> Mapping:
+        """Parse the input with the options of the parser, return the parsed tmconf."""
+        cache_key = cached = None
+        if self._cache is not None:
+            cache_key = self._cache_key(self._sort)
+            cached = self._cache.get(cache_key)
+
+        if cached is not None:
+            self._keep_view("_tmconf_json", cached)
+            return self._intern_objects(json.loads(cached))
+        if self._tmconf_position is not None:
+            # parse again from the start of the input
+            self._tmconf_source.seek(self._tmconf_position)
+        if self._lazy:
+            blocks = (
+                self._load_index(self._index)
+                if self._index
+                else self._index_tmconf_stream()
+            )
+            if self._select is not None:
+                blocks = {
+                    key: block for key, block in blocks.items() if self._select(key)
+                }
+            if self._separate_irules:
+                self._irule_index = {
+                    key: block for key, block in blocks.items() if self._is_irule(key)
+                }
+                blocks = {
+                    key: block
+                    for key, block in blocks.items()
+                    if key not in self._irule_index
+                }
+            return LazyTmconfDict(self, blocks, self._sort)
+        if self._engine == "legacy":
+            if self._is_filepath and self._tmconf_text is None:
+                self._tmconf_text = self._read_tmconf_file(self._tmconf_source)
+            tmconf_dict = self._parse_tmconf_content()
+            if not self._keep_text and self._is_filepath:
+                self._tmconf_text = None
+        elif self._executor is not None:
+            tmconf_dict = self._parse_tmconf_stream(self._executor)
+        elif self._workers is not None and self._workers > 1:
+            with self._create_executor(self._workers) as pool:
+                tmconf_dict = self._parse_tmconf_stream(pool)
+        else:
+            tmconf_dict = self._parse_tmconf_stream(previous=previous)
+        if self._sort and previous is not None:
+            # reused and newly parsed objects are sorted already
+            tmconf_dict = dict(sorted(tmconf_dict.items()))
+        elif self._sort:
+            tmconf_dict = self._sort_dict(tmconf_dict)
+        if self._cache is not None:
+            self._cache.put(
+                cache_key,
+                self._keep_view("_tmconf_json", self._json_encoder.dumps(tmconf_dict)),
+            )
+        return tmconf_dict
+
+    def _keep_view(self, attribute: str, value):
+        """Keep `value` as `attribute` if views derived from `dict` are kept, return `value`."""
+        if self._keep == "all":
+            setattr(self, attribute, value)
+        return value
+
+    def _is_rereadable(self) -> bool:
+        """Returns True if the input can be read again, False for non-seekable file objects."""
+        return (
+            self._is_filepath
+            or self._tmconf_position is not None
+            or isinstance(self._tmconf_source, (str, bytes, bytearray, mmap.mmap))
+        )
 
     def _sort_dict(self, d) -> dict:
         """Sort dictionaries and lists recursively."""
@@ -165,9 +853,7 @@ class Parser:
                 while bracket_count != 0:
                     c += 1
                     line = arr[i + c]
-                    subcount = 0
 
-                    previous_char = ""
                     if not (
                         (
                             line.strip().startswith("#")
@@ -176,17 +862,7 @@ class Parser:
                         )
                         and rule_flag
                     ):
-                        updated_line = (
-                            line.strip().replace('\\"', "").replace(r'".+"', "")
-                        )
-                        for char in updated_line:
-                            if char == '"' and previous_char != "\\":
-                                quoted = not quoted
-                            if not quoted and char == "{" and previous_char != "\\":
-                                subcount += 1
-                            if not quoted and char == "}" and previous_char != "\\":
-                                subcount -= 1
-                            previous_char = char
+                        subcount, quoted = self._count_brackets(line, quoted)
                         if self._is_irule(line):
                             c -= 1
                             bracket_count = 0
@@ -249,65 +925,191 @@ class Parser:
                     # skip over nested block
                     i += c
 
-                # case: empty object
-                elif "".join(arr[i].split(" ")).endswith("{ }") or "".join(
-                    arr[i].split(" ")
-                ).endswith("{}"):
-                    obj[arr[i].split("{")[0].strip()] = {}
-
-                # case: pseudo-array pattern (coerce to array)
-                elif "{" in arr[i] and "}" in arr[i] and '"' not in arr[i]:
-                    obj_name = arr[i].split("{")[0].strip()
-                    obj[obj_name] = self._obj_to_arr(arr[i])
-
-                # case: single-string property
-                elif (
-                    " " not in arr[i].strip()
-                    or re.match(r'^"[\s\S]*"$', arr[i].strip())
-                ) and "}" not in arr[i]:
-                    obj[arr[i].strip()] = ""
-
-                # regular string property
-                # ensure string props on same indentation level
-                elif self._count_indent(arr[i]) == 4:
-                    # case: multiline string
-                    count = arr[i].count('"')
-                    if count % 2 == 1:
-                        c = 1
-
-                        # keep count of '"'?
-                        while arr[i + c] and arr[i + c].count('"') % 2 != 1:
-                            c += 1
-
-                        chunk = arr[i : i + c + 1]
-                        sub_obj_arr = self._arr_to_multiline_str(chunk)
-                        obj.update(sub_obj_arr)
-                        i += c
-
-                    # case: typical string
-                    else:
-                        tmp = self._str_to_obj(arr[i].strip())
-                        # case: gtm monitor external and user-defined property
-                        if (
-                            key.startswith("gtm monitor external")
-                            and "user-defined" in tmp
-                        ):
-                            if "user-defined" not in obj:
-                                obj["user-defined"] = {}
-                            tmp_obj = self._str_to_obj(tmp["user-defined"])
-                            obj["user-defined"][list(tmp_obj.keys())[0]] = list(
-                                tmp_obj.values()
-                            )[0]
-                        else:
-                            obj.update(tmp)
-
-                # else log exception
-                else:
-                    log.warning("UNRECOGNIZED LINE for object '%s': '%s'", key, arr[i])
+                # case: multiline string
+                elif self._parse_line(key, obj, arr[i]):
+                    c = 1
+
+                    # keep count of '"'?
+                    while arr[i + c] and arr[i + c].count('"') % 2 != 1:
+                        c += 1
+
+                    chunk = arr[i : i + c + 1]
+                    sub_obj_arr = self._arr_to_multiline_str(chunk)
+                    obj.update(sub_obj_arr)
+                    i += c
+
                 i += 1
 
         return {key: obj}
 
+    def _parse_line(self, key: str, obj: Dict, line: str) -> bool:
+        """Parse a property of the object `key` in a single line into `obj`, return True if the line starts a multiline string instead."""
+        stripped = line.strip()
+        # case: empty object, "{ }" or "{}" ignoring spaces
+        if line.replace(" ", "").endswith("{}"):
+            obj[line.split("{")[0].strip()] = {}
+
+        # case: pseudo-array pattern (coerce to array)
+        elif "{" in line and "}" in line and '"' not in line:
+            obj_name = line.split("{")[0].strip()
+            obj[obj_name] = self._obj_to_arr(line)
+
+        # case: single-string property
+        elif "}" not in line and (" " not in stripped or self._is_quoted(stripped)):
+            obj[stripped] = ""
+
+        # regular string property
+        # ensure string props on same indentation level
+        elif len(line) > 4 and line[:4].isspace() and not line[4].isspace():
+            # case: multiline string
+            if line.count('"') % 2 == 1:
+                return True
+
+            # case: typical string
+            name, _, value = stripped.partition(" ")
+            # case: gtm monitor external and user-defined property
+            if key.startswith("gtm monitor external") and name == "user-defined":
+                if "user-defined" not in obj:
+                    obj["user-defined"] = {}
+                tmp_obj = self._str_to_obj(value)
+                obj["user-defined"][list(tmp_obj.keys())[0]] = list(tmp_obj.values())[0]
+            else:
+                obj[name] = value
+
+        # else log exception
+        else:
+            log.warning("UNRECOGNIZED LINE for object '%s': '%s'", key, line)
+        return False
+
+    def _build_object(self, arr: list) -> Dict:
+        """
+        Build a top-level tmconf object from its lines in a single pass, same semantics as `_orchestrate`.
+
+        Nested objects under construction are kept on a stack of `_tmconfFrame`, instead of
+        copying, re-indenting and parsing the lines of each nested object recursively.
+        A line closes the outermost nested object for which it is the "    }" line at the
+        level of its parent. Lines indented by spaces only are re-indented by a single slice,
+        other lines are re-indented and anonymous objects are numbered level by level.
+        """
+        body = arr[1:-1]
+        root = self._new_frame(self._get_object_name(arr[0]), -1)
+        if root.obj is None:
+            # iRules, monitor min and skipped objects have no nested objects
+            if root.lines is not None:
+                root.lines = body
+            return {root.key: self._frame_value(root)}
+
+        stack = [root]
+        # innermost object and the indentation of its lines
+        frame = root
+        cut = 0
+        for position, line in enumerate(body):
+            stripped = line.lstrip(" ")
+            if len(line) - len(stripped) >= cut and stripped != "{" and stripped != "}":
+                text = line[cut:]
+                # common case: single line property of a parsed object
+                if (
+                    frame.multiline is None
+                    and frame.obj is not None
+                    and not text.endswith("{")
+                ):
+                    if self._parse_line(frame.key, frame.obj, text):
+                        frame.multiline = [text]
+                    continue
+                self._add_frame_line(stack, text, position)
+            else:
+                text = line
+                for level in range(1, len(stack)):
+                    if text == "    }":
+                        self._close_frame(stack, level, position)
+                        break
+                    text = self._strip_indent(text)
+                    # coerce unnamed objects into array
+                    if text == "    {":
+                        text = f"    {stack[level].index} {{"
+                        stack[level].index += 1
+                else:
+                    self._add_frame_line(stack, text, position)
+            frame = stack[-1]
+            cut = 4 * (len(stack) - 1)
+        self._close_frame(stack, 0, len(body))
+        return {stack[0].key: self._frame_value(stack[0])}
+
+    @classmethod
+    def _new_frame(
+        cls, key: str, start: int, header: str = "", index: int = 0
+    ) -> "_tmconfFrame":
+        """Return a new `_tmconfFrame` for the object `key`, which content is collected as lines or parsed depending on its type."""
+        frame = _tmconfFrame(key, start, header, index)
+        # case: iRules (multiline string) and monitor min X of {...}
+        if cls._is_irule(key) or "monitor min" in key:
+            frame.lines = []
+        # skip cli script, also skip 'sys crypto cert-order-manager', it has quotation marks around curly brackets of 'order-info'
+        elif "cli script" not in key and "sys crypto cert-order-manager" not in key:
+            frame.obj = {}
+        return frame
+
+    def _add_frame_line(
+        self, stack: list, text: str, position: int, nested: bool = True
+    ) -> None:
+        """Add the line `text`, re-indented to the level of the innermost object, to the object on top of `stack`."""
+        frame = stack[-1]
+        if frame.lines is not None:
+            frame.lines.append(text)
+        elif frame.obj is None:
+            return
+        elif frame.multiline is not None:
+            frame.multiline.append(text)
+            if not text or text.count('"') % 2 == 1:
+                frame.obj.update(self._arr_to_multiline_str(frame.multiline))
+                frame.multiline = None
+        # case: nested object
+        elif nested and text.endswith("{"):
+            header = self._strip_indent(text)
+            index = 0
+            if header == "    {":
+                header = "    0 {"
+                index = 1
+            stack.append(
+                self._new_frame(self._get_object_name(header), position, text, index)
+            )
+        elif self._parse_line(frame.key, frame.obj, text):
+            frame.multiline = [text]
+
+    def _close_frame(self, stack: list, level: int, position: int) -> None:
+        """Close the object at `level` of `stack` by its closing line at `position` and add it to its parent object."""
+        frame = stack[level]
+        if len(stack) > level + 1:
+            child = stack[level + 1]
+            del stack[level + 1 :]
+            # a single line ending with "{" is not a nested object
+            if position - frame.start - 1 == 1:
+                self._add_frame_line(stack, child.header, child.start, nested=False)
+            # the error replaces errors inside the child, which _orchestrate doesn't reach
+            elif frame.error is None:
+                frame.error = f"Missing or mis-indented '}}' for line number {child.start - frame.start}: '{child.header}'"
+        if frame.multiline is not None and frame.error is None:
+            frame.error = (
+                f"Missing closing '\"' for object '{frame.key}': '{frame.multiline[0]}'"
+            )
+        if level:
+            del stack[level:]
+            parent = stack[-1]
+            parent.obj[frame.key] = self._frame_value(frame)
+            if parent.error is None:
+                parent.error = frame.error
+        elif frame.error is not None:
+            raise ValueError(frame.error)
+
+    @staticmethod
+    def _frame_value(frame: "_tmconfFrame"):
+        """Return the parsed object of a closed `_tmconfFrame`."""
+        if frame.lines is None:
+            return {} if frame.obj is None else frame.obj
+        if "monitor min" in frame.key and not Parser._is_irule(frame.key):
+            return " ".join([s.strip() for s in frame.lines]).split(" ")
+        return "\n".join(frame.lines)
+
     @staticmethod
     def _read_tmconf_file(filepath: str) -> str:
         """read tmconf file, perform sanitization and checks, then return content as str."""
@@ -321,9 +1123,27 @@ class Parser:
             log.warning("File '%s' contains non-ASCII characters.", filepath)
         return data
 
+    def _read_tmconf_source(self) -> str:
+        """read tmconf from the file, bytes or file object provided as input, return content as str."""
+        source = self._tmconf_source
+        if self._is_filepath:
+            with open(source, "rb") as file:
+                data = file.read()
+        elif isinstance(source, (bytes, bytearray, mmap.mmap)):
+            data = source[:]
+        elif self._tmconf_position is not None:
+            source.seek(self._tmconf_position)
+            data = source.read()
+        else:
+            raise ValueError(
+                "Plain tmconf of a non-seekable file object is not available after parsing."
+            )
+        # silent dos2unix
+        return data.decode().replace("\r\n", "\n")
+
     def _parse_tmconf_content(self) -> Dict:
         """Parse the text of a tmconf file and return a dictionary of objects."""
-        file_arr = self._tmconf_text.split("\n")
+        file_arr = self.text.split("\n")
 
         # gtm topology
         new_file_arr: list = []
@@ -388,11 +1208,870 @@ class Parser:
             for line in file_arr
             if not (line == "" or line.strip().startswith("#comment# "))
         ]
-        group_arr = [self._orchestrate(obj) for obj in self._group_objects(file_arr)]
+        group_arr = [
+            self._intern_objects(self._orchestrate(obj))
+            for obj in self._group_objects(file_arr)
+            if self._select is None or self._select(self._get_object_name(obj[0]))
+        ]
         group_arr_dict = self._arr_to_dict(group_arr)
 
         return {**data, **group_arr_dict}
 
+    def _parse_tmconf_stream(
+        self, executor: Optional[Executor] = None, previous: Optional["Parser"] = None
+    ) -> Dict:
+        """
+        Parse the text of a tmconf file in a single pass and return a dictionary of objects.
+
+        When an `executor` is given, ranges of the input are scanned and parsed by it,
+        see `_parse_tmconf_ranges`. If the input has to be scanned as a whole, top-level
+        objects are submitted to it in chunks instead. The results are merged in the
+        original order.
+        Otherwise the digest of each top-level object is recorded, objects with the same
+        name and digest in `previous` are reused instead of parsed again.
+        """
+        if executor is not None:
+            ranges = self._parse_tmconf_ranges(executor)
+            if ranges is not None:
+                return ranges
+        data: Dict = {}
+        blocks = self._iter_tmconf_blocks(
+            self._iter_source_lines(
+                self._tmconf_source, self._is_filepath, self._use_mmap
+            ),
+            irule_lines=not self._separate_irules,
+            select=self._select,
+        )
+        if self._separate_irules:
+            blocks = self._separate_irule_blocks(blocks)
+        if executor is None:
+            previous_digests = {} if previous is None else previous._get_block_digests()
+            # bound once, dict of a parser which doesn't keep it is parsed on each access
+            previous_dict = {} if previous is None else previous.dict
+            # fingerprints are only tracked if previous computed them
+            previous_fingerprints = None if previous is None else previous._fingerprints
+            fingerprints: Dict = {}
+            digests: Dict = {}
+            for block in blocks:
+                key = self._get_object_name(block.lines[0])
+                digest = digests[key] = self._block_digest(block.lines)
+                if previous_digests.get(key) == digest and key in previous_dict:
+                    data[key] = previous_dict[key]
+                    if previous_fingerprints is not None:
+                        fingerprints[key] = previous_fingerprints[key]
+                    continue
+                obj = self._intern_objects(self._build_object(block.lines))
+                data.update(
+                    self._sort_dict(obj) if previous is not None and self._sort else obj
+                )
+                if previous_fingerprints is not None:
+                    fingerprints.update(
+                        (name, self._fingerprint(value)) for name, value in obj.items()
+                    )
+            if previous_fingerprints is not None:
+                self._fingerprints = fingerprints
+            if previous is not None:
+                self._tmconf_changes = tmconfChanges(
+                    added=[key for key in digests if key not in previous_digests],
+                    removed=[key for key in previous_digests if key not in digests],
+                    changed=[
+                        key
+                        for key, digest in digests.items()
+                        if key in previous_digests and previous_digests[key] != digest
+                    ],
+                )
+            self._block_digests = digests
+            return data
+
+        futures = [
+            executor.submit(self._orchestrate_blocks, chunk)
+            for chunk in self._iter_chunks(blocks, self.PARALLEL_CHUNK_LINES)
+        ]
+        for future in futures:
+            for obj in future.result():
+                data.update(self._intern_objects(obj))
+        return data
+
+    def _parse_tmconf_ranges(self, executor: Executor) -> Optional[Dict]:
+        """
+        Scan and parse ranges of the input in `executor` and return a dictionary of objects, None if the input has to be scanned as a whole.
+
+        File paths, str and bytes are cut into ranges of about `PARALLEL_CHUNK_SIZE` after lines
+        of a single closing bracket, each worker reads and scans its range as if it started at
+        top-level, see `_orchestrate_range`. A cut within an object, like between the events of
+        an iRule, is detected by the state at the end of the previous range, the range is scanned
+        again from the end of the previous range then. Binary file objects and inputs with
+        `gtm topology` records, which are collected over the whole input, are scanned as a whole.
+        """
+        source = self._tmconf_source
+        if self._is_filepath:
+            with open(source, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    return None
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    bounds = self._find_range_bounds(mapped, size)
+        elif isinstance(source, (str, bytes, bytearray, mmap.mmap)):
+            bounds = self._find_range_bounds(source, len(source))
+        else:
+            return None
+
+        options = (
+            not self._separate_irules,
+            self._include,
+            self._exclude,
+            self._separate_irules,
+        )
+        ranges = list(zip(bounds, bounds[1:]))
+        futures = [
+            executor.submit(
+                self._orchestrate_range,
+                self._range_data(start, stop),
+                start,
+                0,
+                stop == bounds[-1],
+                options,
+            )
+            for start, stop in ranges
+        ]
+        data: Dict = {}
+        irule_index: Dict = {}
+        non_ascii = False
+        # end of the input scanned so far and the iRule state there
+        position = irule = 0
+        for future, (start, stop) in zip(futures, ranges):
+            if start == position and irule == 0:
+                result = future.result()
+            else:
+                # the range was not scanned from the end of the previous one
+                future.cancel()
+                result = self._orchestrate_range(
+                    self._range_data(position, stop),
+                    position,
+                    irule,
+                    stop == bounds[-1],
+                    options,
+                )
+            if result is None:
+                for pending in futures:
+                    pending.cancel()
+                return None
+            objects, irules, end_irule, range_non_ascii = result
+            if end_irule is None:
+                # the range ends within an object, scan it again with the next range
+                continue
+            for obj in objects:
+                data.update(self._intern_objects(obj))
+            irule_index.update(irules)
+            non_ascii = non_ascii or range_non_ascii
+            position, irule = stop, end_irule
+        if non_ascii:
+            log.warning(
+                "File '%s' contains non-ASCII characters.",
+                source if self._is_filepath else "<bytes>",
+            )
+        if self._separate_irules:
+            self._irule_index = irule_index
+        return data
+
+    @classmethod
+    def _find_range_bounds(
+        cls, data: Union[str, bytes, bytearray, mmap.mmap], size: int
+    ) -> list:
+        """Return the offsets of ranges of about `PARALLEL_CHUNK_SIZE` of `data`, cut after lines of a single closing bracket."""
+        if isinstance(data, str):
+            separator, line_ends = "\n}", ("\n", "\r")
+        else:
+            separator, line_ends = b"\n}", (b"\n", b"\r")
+        bounds = [0]
+        position = data.find(separator, cls.PARALLEL_CHUNK_SIZE)
+        while position != -1:
+            if data[position + 2 : position + 3] in line_ends:
+                cut = data.find(line_ends[0], position + 2) + 1
+                if cut == 0 or cut == size:
+                    break
+                bounds.append(cut)
+                position = data.find(separator, cut + cls.PARALLEL_CHUNK_SIZE)
+            else:
+                position = data.find(separator, position + 2)
+        bounds.append(size)
+        return bounds
+
+    def _range_data(self, start: int, stop: int) -> Union[str, bytes, tuple]:
+        """Return the text or bytes between the offsets `start` and `stop` of the input, (file path, start, stop) for file paths."""
+        if self._is_filepath:
+            return self._tmconf_source, start, stop
+        return self._tmconf_source[start:stop]
+
+    @staticmethod
+    def _as_patterns(patterns: Union[None, str, Iterable[str]]) -> Optional[tuple]:
+        """Return `patterns` of `include` or `exclude` as tuple, None if no patterns are given."""
+        if patterns is None:
+            return None
+        if isinstance(patterns, str):
+            return (patterns,)
+        return tuple(patterns)
+
+    @classmethod
+    def _compile_selection(
+        cls, include: Optional[tuple], exclude: Optional[tuple]
+    ) -> Optional[Callable[[str], bool]]:
+        """Return a function which returns True for the names of top-level objects selected by `include` and `exclude`, None if all are selected."""
+        if include is None and not exclude:
+            return None
+        included = None if include is None else cls._compile_patterns(include)
+        excluded = cls._compile_patterns(exclude or ())
+
+        def select(key: str) -> bool:
+            return (included is None or included(key)) and not excluded(key)
+
+        return select
+
+    @staticmethod
+    def _compile_patterns(patterns: tuple) -> Callable[[str], bool]:
+        """Return a function which returns True if an object name starts with one of the paths or matches one of the glob patterns in `patterns`."""
+        globs = [pattern for pattern in patterns if any(c in pattern for c in "*?[")]
+        # whole words, "ltm profile http" doesn't match "ltm profile http2 /Common/x"
+        prefixes = tuple(f"{pattern} " for pattern in patterns if pattern not in globs)
+        regex = (
+            re.compile("|".join(fnmatch.translate(pattern) for pattern in globs))
+            if globs
+            else None
+        )
+
+        def matches(key: str) -> bool:
+            return f"{key} ".startswith(prefixes) or (
+                regex is not None and regex.match(key) is not None
+            )
+
+        return matches
+
+    def _separate_irule_blocks(
+        self, blocks: Iterable["_tmconfBlock"]
+    ) -> Iterator["_tmconfBlock"]:
+        """Yield the top-level objects which are not iRules, record the position of iRules in `_irule_index`."""
+        self._irule_index = {}
+        for block in blocks:
+            key = self._get_object_name(block.lines[0])
+            if self._is_irule(key):
+                self._irule_index[key] = block._replace(lines=None)
+            else:
+                yield block
+
+    def _index_tmconf_stream(self) -> Dict:
+        """Scan the text of a tmconf file in a single pass and return the top-level object names and their blocks, without parsing them."""
+        index: Dict = {}
+        for block in self._iter_tmconf_blocks(
+            self._iter_source_lines(
+                self._tmconf_source, self._is_filepath, self._use_mmap
+            )
+        ):
+            # lines are read from the source again, unless the object doesn't exist in the source (gtm topology)
+            index[self._get_object_name(block.lines[0])] = (
+                block if block.end is None else block._replace(lines=None)
+            )
+        return index
+
+    def _load_index(self, index: Union[bool, str]) -> Dict:
+        """
+        Load the index of top-level objects from the index file, if it matches the tmconf file.
+
+        The index is valid if size and sha256 hash of the content of the tmconf file match, the hash is
+        verified even if the modification time matches (files rewritten by `cp -p`, `rsync -t` or `touch`).
+        Otherwise the tmconf file is indexed again and the index file is (re-)written.
+        """
+        filepath = self._tmconf_source
+        index_path = f"{filepath}{self.INDEX_SUFFIX}" if index is True else index
+        file_stat = os.stat(filepath)
+        try:
+            with open(index_path, "rb") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            data = {}
+
+        sha256 = self._hash_file(filepath)
+        valid = (
+            isinstance(data, dict)
+            and data.get("version") == self.INDEX_VERSION
+            and data.get("size") == file_stat.st_size
+            and data.get("sha256") == sha256
+        )
+        if valid and data.get("mtime_ns") == file_stat.st_mtime_ns:
+            return self._blocks_from_index(data["objects"])
+        if valid:
+            # only the modification time changed, update it in the index file
+            blocks = self._blocks_from_index(data["objects"])
+        else:
+            blocks = self._index_tmconf_stream()
+
+        data = {
+            "version": self.INDEX_VERSION,
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "sha256": sha256,
+            "objects": [
+                [
+                    key,
+                    block.start,
+                    None if block.start is None else block.end - block.start,
+                    block.irule,
+                    block.lines,
+                ]
+                for key, block in blocks.items()
+            ],
+        }
+        try:
+            with open(f"{index_path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(f"{index_path}.tmp", index_path)
+        except OSError as error:
+            log.warning("Unable to write index file '%s': %s", index_path, error)
+        return blocks
+
+    @staticmethod
+    def _blocks_from_index(objects: list) -> Dict:
+        """Return the top-level object names and their blocks from the objects of an index file."""
+        return {
+            key: _tmconfBlock(
+                lines, start, None if start is None else start + length, irule
+            )
+            for key, start, length, irule, lines in objects
+        }
+
+    @classmethod
+    def _hash_file(cls, filepath: str) -> str:
+        """Return the sha256 hex digest of a file."""
+        sha256 = hashlib.sha256()
+        with open(filepath, "rb") as file:
+            cls._update_hash(sha256, file)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _update_hash(sha256, file: BinaryIO) -> None:
+        """Update the hash object `sha256` with the remaining content of a binary file object, in chunks."""
+        while chunk := file.read(1024 * 1024):
+            sha256.update(chunk)
+
+    def _cache_key(self, sort: bool) -> str:
+        """Return the cache key of the input, a sha256 hex digest of parser options and content."""
+        source = self._tmconf_source
+        is_text = isinstance(source, str) and not self._is_filepath
+        # str input is not dos2unix'ed, it may parse differently than the same bytes
+        options = {"sort": sort, "text": is_text}
+        if self._separate_irules:
+            options["separate_irules"] = True
+        if self._include is not None:
+            options["include"] = self._include
+        if self._exclude is not None:
+            options["exclude"] = self._exclude
+        if self._json_encoder.name != "json":
+            # the cached JSON string is returned by `json` as is
+            options["json_encoder"] = self._json_encoder.name
+        sha256 = hashlib.sha256(json.dumps(options, sort_keys=True).encode())
+        if is_text:
+            for i in range(0, len(source), 1024 * 1024):
+                sha256.update(source[i : i + 1024 * 1024].encode())
+        elif isinstance(source, (bytes, bytearray, mmap.mmap)):
+            sha256.update(source)
+        elif self._is_filepath:
+            with open(source, "rb") as file:
+                self._update_hash(sha256, file)
+        elif self._tmconf_position is not None:
+            self._update_hash(sha256, source)
+            source.seek(self._tmconf_position)
+        else:
+            # non-seekable file objects can't be read twice, parse from bytes
+            self._tmconf_source = source.read()
+            sha256.update(self._tmconf_source)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _block_digest(lines: list) -> bytes:
+        """Return the digest of the lines of a top-level object."""
+        return hashlib.blake2b("\n".join(lines).encode(), digest_size=16).digest()
+
+    def _get_block_digests(self) -> Dict:
+        """Return the digests of the top-level objects by name, scan the input again if they were not recorded while parsing."""
+        if self._block_digests is not None:
+            return self._block_digests
+        source = self._tmconf_source
+        if self._tmconf_position is not None:
+            source.seek(self._tmconf_position)
+        elif not self._is_filepath and not isinstance(
+            source, (str, bytes, bytearray, mmap.mmap)
+        ):
+            raise ValueError(
+                "Top-level objects of a non-seekable file object can not be scanned again after parsing."
+            )
+        blocks = self._iter_tmconf_blocks(
+            self._iter_source_lines(source, self._is_filepath, self._use_mmap),
+            irule_lines=not self._separate_irules,
+            select=self._select,
+        )
+        digests = {}
+        for block in blocks:
+            key = self._get_object_name(block.lines[0])
+            # like _parse_tmconf_stream, separate iRules are not part of dict
+            if not (self._separate_irules and self._is_irule(key)):
+                digests[key] = self._block_digest(block.lines)
+        self._block_digests = digests
+        return self._block_digests
+
+    def _fingerprint(self, obj) -> str:
+        """Return the fingerprint of a parsed object, the digest of its canonical JSON with keys and lists sorted."""
+        return self._digest(canonical_json(self._sort_lists(obj)))
+
+    @classmethod
+    def _digest(cls, data: bytes) -> str:
+        """Return the blake2b hex digest of `data` with `FINGERPRINT_SIZE` bytes."""
+        return hashlib.blake2b(data, digest_size=cls.FINGERPRINT_SIZE).hexdigest()
+
+    @classmethod
+    def _sort_lists(cls, obj):
+        """Return the parsed object `obj` with all lists sorted, copies only the dicts which contain lists."""
+        if isinstance(obj, list):
+            return sorted(obj)
+        if isinstance(obj, dict) and any(
+            isinstance(value, (dict, list)) for value in obj.values()
+        ):
+            return {key: cls._sort_lists(value) for key, value in obj.items()}
+        return obj
+
+    def _parse_block(self, block: "_tmconfBlock"):
+        """Parse a top-level object recorded by `_index_tmconf_stream`, return the parsed object."""
+        lines = block.lines
+        if lines is None:
+            lines = next(
+                self._iter_tmconf_blocks(
+                    self._iter_source_range(block.start, block.end), block.irule
+                )
+            ).lines
+        return next(iter(self._intern_objects(self._build_object(lines)).values()))
+
+    def _intern_objects(self, objects: Dict) -> Dict:
+        """Intern the keys and strings of parsed top-level `objects` (name: object) if interning is enabled."""
+        if self._intern_table is None:
+            return objects
+        return {key: self._intern_object(obj) for key, obj in objects.items()}
+
+    def _intern_object(self, obj):
+        """Return a copy of the parsed object `obj` with keys and strings replaced by their first occurrence in the intern table."""
+        table = self._intern_table
+        if isinstance(obj, dict):
+            return {
+                table.setdefault(key, key): self._intern_object(value)
+                for key, value in obj.items()
+            }
+        if isinstance(obj, list):
+            return [self._intern_object(value) for value in obj]
+        if isinstance(obj, str) and len(obj) <= self.INTERN_MAX_LENGTH:
+            return table.setdefault(obj, obj)
+        return obj
+
+    def _is_large_source(self) -> bool:
+        """Returns True if the input is at least `INTERN_MIN_SIZE` bytes or of unknown size, False otherwise."""
+        source = self._tmconf_source
+        if self._is_filepath:
+            try:
+                return os.path.getsize(source) >= self.INTERN_MIN_SIZE
+            except OSError:
+                # the error is raised when the file is read
+                return False
+        if isinstance(source, (str, bytes, bytearray, mmap.mmap)):
+            return len(source) >= self.INTERN_MIN_SIZE
+        if self._tmconf_position is None:
+            return True
+        end = source.seek(0, os.SEEK_END)
+        source.seek(self._tmconf_position)
+        return end - self._tmconf_position >= self.INTERN_MIN_SIZE
+
+    @staticmethod
+    def _orchestrate_blocks(blocks: list) -> list:
+        """Orchestrate the parsing of a chunk of top-level objects, runs in executor workers."""
+        # parsing state is local to _build_object, a bare instance is sufficient
+        parser = Parser.__new__(Parser)
+        return [parser._build_object(block) for block in blocks]
+
+    @staticmethod
+    def _orchestrate_range(
+        data: Union[str, bytes, tuple],
+        offset: int,
+        irule: int,
+        last: bool,
+        options: tuple,
+    ) -> Optional[tuple]:
+        """
+        Scan and parse the top-level objects of a range of the input, runs in executor workers.
+
+        `data` is the text or bytes of the range or (file path, start, stop) to read it from,
+        `offset` is the position of the range in the input and `irule` the iRule state at its
+        start. Returns the parsed objects, the (name, block) of separate iRules, the iRule state
+        at the end of the range and whether the range contains non-ASCII characters. The
+        iRule state is None if the range ends within an object, unless it is the `last` range,
+        which raises the error then. Returns None if the range contains `gtm topology` records.
+        """
+        irule_lines, include, exclude, separate_irules = options
+        if isinstance(data, tuple):
+            filepath, start, stop = data
+            with open(filepath, "rb") as file:
+                file.seek(start)
+                data = file.read(stop - start)
+        if isinstance(data, str):
+            if "gtm topology ldns:" in data:
+                return None
+            lines = Parser._iter_text_lines(data)
+            non_ascii = False
+        else:
+            if b"gtm topology ldns:" in data:
+                return None
+            lines = Parser._iter_bytes_lines(data, None)
+            non_ascii = not data.isascii()
+        # parsing state is local to _iter_tmconf_blocks and _build_object, a bare instance is sufficient
+        parser = Parser.__new__(Parser)
+        blocks = parser._iter_tmconf_blocks(
+            lines,
+            irule,
+            irule_lines=irule_lines,
+            select=Parser._compile_selection(include, exclude),
+        )
+        scanned = []
+        try:
+            while True:
+                scanned.append(next(blocks))
+        except StopIteration as stop_iteration:
+            end_irule = stop_iteration.value
+        except ValueError:
+            if last:
+                raise
+            return [], [], None, non_ascii
+
+        objects = []
+        irules = []
+        for block in scanned:
+            key = parser._get_object_name(block.lines[0])
+            if separate_irules and parser._is_irule(key):
+                irules.append(
+                    (
+                        key,
+                        block._replace(
+                            lines=None,
+                            start=block.start + offset,
+                            end=block.end + offset,
+                        ),
+                    )
+                )
+            else:
+                objects.append(parser._build_object(block.lines))
+        return objects, irules, end_irule, non_ascii
+
+    @staticmethod
+    def _iter_chunks(blocks: Iterable["_tmconfBlock"], size: int) -> Iterator[list]:
+        """Group the lines of top-level objects into chunks of about `size` lines."""
+        chunk: list = []
+        chunk_lines = 0
+        for block in blocks:
+            chunk.append(block.lines)
+            chunk_lines += len(block.lines)
+            if chunk_lines >= size:
+                yield chunk
+                chunk = []
+                chunk_lines = 0
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _create_executor(workers: int) -> Executor:
+        """Create a thread pool on free-threaded python, a process pool otherwise."""
+        if not getattr(sys, "_is_gil_enabled", lambda: True)():
+            return ThreadPoolExecutor(max_workers=workers)
+        return ProcessPoolExecutor(max_workers=workers)
+
+    @classmethod
+    def _iter_source_lines(
+        cls,
+        tmconf: Union[str, bytes, BinaryIO],
+        is_filepath: bool = False,
+        use_mmap: bool = False,
+    ) -> Iterator[tuple]:
+        """Yield (start, end, line) for the lines of tmconf data, bytes, a binary file object or a file path."""
+        if is_filepath:
+            return cls._iter_file_lines(tmconf, use_mmap)
+        if isinstance(tmconf, str):
+            return cls._iter_text_lines(tmconf)
+        if isinstance(tmconf, (bytes, bytearray, mmap.mmap)):
+            return cls._iter_bytes_lines(tmconf, "<bytes>")
+        return cls._iter_binary_lines(tmconf, use_mmap)
+
+    def _iter_source_range(self, start: int, end: int) -> Iterator[tuple]:
+        """Yield (start, end, line) for the lines between the offsets `start` and `end` of the input."""
+        source = self._tmconf_source
+        if isinstance(source, str) and not self._is_filepath:
+            return self._iter_text_lines(source, start, end)
+        if isinstance(source, (bytes, bytearray, mmap.mmap)):
+            return self._iter_bytes_lines(source, None, start, end)
+        if self._is_filepath:
+            with open(source, "rb") as file:
+                file.seek(start)
+                data = file.read(end - start)
+        else:
+            source.seek(start)
+            data = source.read(end - start)
+        return self._iter_bytes_lines(data, None)
+
+    @staticmethod
+    def _iter_text_lines(
+        text: str, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[tuple]:
+        """Yield (start, end, line) for the lines of `text` without creating a list of all lines."""
+        if stop is None:
+            stop = len(text)
+        find = text.find
+        while True:
+            end = find("\n", start, stop)
+            if end == -1:
+                yield start, stop, text[start:stop]
+                return
+            yield start, end + 1, text[start:end]
+            start = end + 1
+
+    @classmethod
+    def _iter_file_lines(cls, filepath: str, use_mmap: bool = False) -> Iterator[tuple]:
+        """Yield (start, end, line) for the lines of a tmconf file, same sanitization and checks as `_read_tmconf_file`."""
+        with open(filepath, "rb") as file:
+            yield from cls._iter_binary_lines(file, use_mmap)
+
+    @classmethod
+    def _iter_binary_lines(
+        cls, file: BinaryIO, use_mmap: bool = False
+    ) -> Iterator[tuple]:
+        """Yield (start, end, line) for the lines of a binary file object, memory-mapped if requested and possible."""
+        name = getattr(file, "name", "<stream>")
+        if use_mmap and hasattr(file, "fileno"):
+            file_stat = os.fstat(file.fileno())
+            # pipes, sockets and empty files can not be memory-mapped
+            if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from cls._iter_bytes_lines(mapped, name, file.tell())
+                return
+
+        non_ascii = False
+        position = file.tell() if getattr(file, "seekable", bool)() else 0
+        for raw_line in file:
+            start = position
+            position += len(raw_line)
+            # silent dos2unix
+            if raw_line.endswith(b"\r\n"):
+                raw_line = raw_line[:-2]
+            elif raw_line.endswith(b"\n"):
+                raw_line = raw_line[:-1]
+            if not non_ascii and not raw_line.isascii():
+                non_ascii = True
+                log.warning("File '%s' contains non-ASCII characters.", name)
+            yield start, position, raw_line.decode()
+
+    @staticmethod
+    def _iter_bytes_lines(
+        data: Union[bytes, bytearray, mmap.mmap],
+        name: Optional[str],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[tuple]:
+        """
+        Yield (start, end, line) for the decoded lines of tmconf bytes, same sanitization and checks as `_read_tmconf_file`.
+
+        The check for non-ASCII characters is skipped if `name` is None.
+        """
+        non_ascii = name is None
+        if stop is None:
+            stop = len(data)
+        find = data.find
+        while start < stop:
+            end = find(b"\n", start, stop)
+            if end == -1:
+                raw_line = data[start:stop]
+                next_start = stop
+            else:
+                # silent dos2unix
+                raw_line = data[
+                    start : end - 1 if end > start and data[end - 1] == 13 else end
+                ]
+                next_start = end + 1
+            if not non_ascii and not raw_line.isascii():
+                non_ascii = True
+                log.warning("File '%s' contains non-ASCII characters.", name)
+            yield start, next_start, raw_line.decode()
+            start = next_start
+
+    def _iter_tmconf_blocks(
+        self,
+        lines: Iterable[tuple],
+        irule: int = 0,
+        irule_lines: bool = True,
+        select: Optional[Callable[[str], bool]] = None,
+    ) -> Generator["_tmconfBlock", None, int]:
+        """
+        Group tmconf lines into top-level objects in a single pass, same semantics as `_parse_tmconf_content`.
+
+        `lines` are (start, end, line) tuples as produced by `_iter_source_lines`.
+        Comments outside of iRules and empty lines are dropped, `gtm topology` records
+        are collected and yielded as one `gtm topology /Common/Shared/topology` object
+        after all other objects. Brace depth, quote state and iRule mode are tracked
+        line by line and each top-level object is yielded as soon as its closing
+        bracket was seen, together with its position in the source and the iRule state
+        at its first line, which is required to scan the object again.
+        With `irule_lines` False, only the first line of iRules is kept.
+        With `select`, only top-level objects whose name is selected are kept and yielded,
+        the brackets of the others are counted to find their end.
+        Returns the iRule state at the end of `lines`.
+        """
+        topology_arr: list = []
+        topology_count = 0
+        longest_match_enabled = True
+        in_topology = False
+
+        block: Optional[list] = None
+        block_start = block_irule = 0
+        rule_flag = keep_lines = False
+        selected = True
+        quoted = False
+        bracket_count = 0
+
+        def topology_lines() -> Iterator[tuple]:
+            """Yield the collected gtm topology records as one object, there is no position in the source."""
+            if topology_arr:
+                topology_arr.append(
+                    f"        longest-match-enabled {'yes' if longest_match_enabled else 'no'}"
+                )
+                topology_arr.append("    }")
+                topology_arr.append("}")
+            for line in topology_arr:
+                yield None, None, line
+
+        for start, end, line in chain(lines, topology_lines()):
+            line_irule = irule
+            stripped = line.strip()
+            if start is not None:
+                # Process comments in iRules:
+                if irule == 0:
+                    if stripped.startswith("# "):
+                        # mark comments outside of irules with specific prefix
+                        line = stripped = stripped.replace("# ", "#comment# ")
+                    elif "rule" in line and self._is_irule(line):
+                        irule += 1
+                # don't count brackets in commented or special lines
+                elif not stripped.startswith("#"):
+                    irule = irule + line.count("{") - line.count("}")
+
+                if (
+                    "topology" in line
+                    and "topology-longest-match" in line
+                    and "no" in line
+                ):
+                    longest_match_enabled = False
+                if "topology" in line and line.startswith("gtm topology ldns:"):
+                    in_topology = True
+                    if len(topology_arr) == 0:
+                        topology_arr.append("gtm topology /Common/Shared/topology {")
+                        topology_arr.append("    records {")
+                    ldns_index = line.index("ldns:")
+                    server_index = line.index("server:")
+                    bracket_index = line.index("{")
+                    ldns = line[ldns_index + 5 : server_index].strip()
+                    topology_arr.append(f"        topology_{topology_count} {{")
+                    topology_count += 1
+                    topology_arr.append(f"            source {ldns}")
+                    server = line[server_index + 7 : bracket_index].strip()
+                    topology_arr.append(f"            destination {server}")
+                    continue
+                if in_topology:
+                    if line == "}":
+                        in_topology = False
+                        topology_arr.append("        }")
+                    else:
+                        topology_arr.append(f"        {line}")
+                    continue
+
+            # remove whitespace and comments
+            if line == "" or stripped.startswith("#comment# "):
+                continue
+
+            if block is not None:
+                if rule_flag and (
+                    stripped.startswith("#") or stripped.startswith("STREAM")
+                ):
+                    if keep_lines:
+                        block.append(line)
+                    continue
+
+                subcount, quoted = self._count_brackets(stripped, quoted)
+                if not ("rule" in line and self._is_irule(line)):
+                    if keep_lines:
+                        block.append(line)
+                    bracket_count += subcount
+                    if bracket_count == 0:
+                        if selected:
+                            yield _tmconfBlock(block, block_start, end, block_irule)
+                        block = None
+                    continue
+
+                # an iRule starts, close the current object before it,
+                # scanning it again ends at the same line.
+                if selected:
+                    yield _tmconfBlock(block, block_start, end, block_irule)
+                block = None
+
+            if "{" in line and "}" in line and line[0] != " ":
+                if select is None or select(self._get_object_name(line)):
+                    yield _tmconfBlock([line], start, end, line_irule)
+            elif stripped.endswith("{") and not line.startswith(" "):
+                block = [line]
+                block_start = start
+                block_irule = line_irule
+                rule_flag = self._is_irule(line)
+                selected = select is None or select(self._get_object_name(line))
+                keep_lines = selected and (irule_lines or not rule_flag)
+                quoted = False
+                bracket_count = 1
+
+        if block is not None:
+            raise ValueError(f"Missing '}}' for object '{block[0]}'")
+        return irule
+
+    @staticmethod
+    def _count_brackets(line: str, quoted: bool) -> tuple:
+        """
+        Return the change of bracket depth by a line and whether it ends within quotes.
+
+        Brackets within quotes and characters after a backslash are not counted.
+        Lines without quotation marks and backslashes are counted as a whole, lines
+        without backslashes per segment between quotation marks, only lines with
+        backslashes are scanned character by character.
+        """
+        if "\\" not in line:
+            if '"' not in line:
+                if quoted:
+                    return 0, True
+                return line.count("{") - line.count("}"), False
+            segments = line.replace(r'".+"', "").split('"')
+            subcount = 0
+            # segments alternate between outside and inside of quotes
+            for segment in segments[quoted::2]:
+                subcount += segment.count("{") - segment.count("}")
+            return subcount, quoted != (len(segments) % 2 == 0)
+
+        subcount = 0
+        previous_char = ""
+        updated_line = line.strip().replace('\\"', "").replace(r'".+"', "")
+        for char in updated_line:
+            if char == '"' and previous_char != "\\":
+                quoted = not quoted
+            if not quoted and char == "{" and previous_char != "\\":
+                subcount += 1
+            if not quoted and char == "}" and previous_char != "\\":
+                subcount -= 1
+            previous_char = char
+        return subcount, quoted
+
     @staticmethod
     def _get_object_name(string: str) -> str:
         """Returns the full object name."""
@@ -403,10 +2082,21 @@ class Parser:
         """Returns True if `string` is an iRule, False otherwise."""
         return "ltm rule" in string or "gtm rule" in string or "pem irule" in string
 
+    @staticmethod
+    def _is_quoted(string: str) -> bool:
+        """Returns True if `string` is enclosed in quotation marks, False otherwise."""
+        return len(string) > 1 and string[0] == '"' and string[-1] == '"'
+
     @staticmethod
     def _count_indent(string: str) -> Optional[int]:
         """Count the number of whitespaces at the beginning of a string."""
-        return re.search(r"\S", string).start() if re.search(r"\S", string) else None
+        stripped = string.lstrip()
+        return len(string) - len(stripped) if stripped else None
+
+    @staticmethod
+    def _strip_indent(line: str) -> str:
+        """Remove indent (4 characters) from a line if it is indented, same as `_remove_indent` for a single line."""
+        return line[4:] if len(line) - len(line.lstrip()) > 1 else line
 
     def _remove_indent(self, arr) -> list:
         """Remove indent (4 whitespaces) from each line in a list of strings if the line is indented."""
@@ -422,9 +2112,8 @@ class Parser:
     @staticmethod
     def _str_to_obj(line) -> Dict:
         """Convert a tmconf string to a dictionary."""
-        split = line.strip().split(" ")
-        key = split.pop(0)
-        return {key: " ".join(split)}
+        key, _, value = line.strip().partition(" ")
+        return {key: value}
 
     @staticmethod
     def _arr_to_multiline_str(arr) -> Dict:
@@ -441,3 +2130,244 @@ class Parser:
         for obj in arr:
             _data.update(obj)
         return _data
+
+
+class _tmconfFrame:
+    """Object under construction by `Parser._build_object`, one per nesting level."""
+
+    __slots__ = (
+        "key",
+        "start",
+        "header",
+        "index",
+        "obj",
+        "lines",
+        "multiline",
+        "error",
+    )
+
+    def __init__(self, key: str, start: int, header: str, index: int):
+        self.key = key
+        # position of the opening line in the body of the top-level object and the line itself at the parent level
+        self.start = start
+        self.header = header
+        # next index of unnamed objects
+        self.index = index
+        self.obj: Optional[Dict] = None
+        self.lines: Optional[list] = None
+        self.multiline: Optional[list] = None
+        # first error of a nested object, raised once the top-level object is complete
+        self.error: Optional[str] = None
+
+
+class SortedTmconfView(Mapping):
+    """
+    Read-only view of a parsed tmconf with keys and lists in sorted order, returned by `Parser.sorted_view`.
+
+    Keys are sorted on first iteration, nested objects are wrapped in a view and lists are sorted on access,
+    the parsed tmconf is not copied.
+    """
+
+    def __init__(self, obj: Mapping):
+        self._obj = obj
+        self._keys: Optional[list] = None
+
+    def __getitem__(self, key: str):
+        value = self._obj[key]
+        if isinstance(value, dict):
+            return SortedTmconfView(value)
+        if isinstance(value, list):
+            return sorted(value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            self._keys = sorted(self._obj)
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._obj)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._obj
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._obj)} keys)"
+
+
+class LazyTmconfDict(Mapping):
+    """
+    Read-only mapping of top-level tmconf objects, returned by `Parser.dict` when parsing lazily.
+
+    Keys, iteration, `len()` and `in` are served from the index of top-level objects,
+    each object is parsed on first access and memoised.
+    """
+
+    def __init__(self, parser: Parser, index: Dict, sort: bool = False):
+        self._parser = parser
+        self._index = dict(sorted(index.items())) if sort else index
+        self._sort = sort
+        self._objects: Dict = {}
+
+    def __getitem__(self, key: str):
+        try:
+            return self._objects[key]
+        except KeyError:
+            pass
+        obj = self._parser._parse_block(self._index[key])
+        if self._sort:
+            obj = self._parser._sort_dict({key: obj})[key]
+        self._objects[key] = obj
+        return obj
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._index)} objects, {len(self._objects)} parsed)"
+
+
+class ColumnarTmconf:
+    """
+    Parsed tmconf as columns, returned by `Parser.columnar`.
+
+    `names` and `objects` hold the name and parsed object of each top-level object,
+    the path is dictionary-encoded: `path_codes` holds the index of the path in `paths`.
+    Counting, grouping and filtering work on the codes instead of on the path strings.
+
+    Example:
+        >>> from tmconfpy import Parser
+        >>> columnar = Parser('example/test.tmconf', is_filepath=True).columnar
+        >>> columnar.count_by_path()["ltm profile imap"]
+        1
+        >>> columnar.filter(path="ltm profile imap").names
+        ['imap']
+    """
+
+    def __init__(self, paths: list, path_codes: array, names: list, objects: list):
+        self.paths = paths
+        self.path_codes = path_codes
+        self.names = names
+        self.objects = objects
+        self._codes = {path: code for code, path in enumerate(paths)}
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple]) -> "ColumnarTmconf":
+        """Return the columns of the top-level objects `items` (name, object)."""
+        paths: list = []
+        codes: Dict = {}
+        path_codes = array("i")
+        names = []
+        objects = []
+        for key, obj in items:
+            path, name = Parser._split_object_name(key)
+            code = codes.get(path)
+            if code is None:
+                code = codes[path] = len(paths)
+                paths.append(path)
+            path_codes.append(code)
+            names.append(name)
+            objects.append(obj)
+        return cls(paths, path_codes, names, objects)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> tabularTmconf:
+        return tabularTmconf(
+            self.paths[self.path_codes[index]], self.names[index], self.objects[index]
+        )
+
+    def __iter__(self) -> Iterator[tabularTmconf]:
+        return map(
+            tabularTmconf,
+            map(self.paths.__getitem__, self.path_codes),
+            self.names,
+            self.objects,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({len(self)} objects, {len(self.paths)} paths)"
+        )
+
+    def count_by_path(self) -> Dict[str, int]:
+        """Return the number of objects by path."""
+        return {
+            self.paths[code]: count for code, count in Counter(self.path_codes).items()
+        }
+
+    def group_by_path(self) -> Dict[str, list]:
+        """Return the indices of the objects by path."""
+        groups: Dict = {path: [] for path in self.paths}
+        for index, code in enumerate(self.path_codes):
+            groups[self.paths[code]].append(index)
+        return {path: indices for path, indices in groups.items() if indices}
+
+    def filter(
+        self, path: Optional[str] = None, name: Optional[str] = None
+    ) -> "ColumnarTmconf":
+        """Return the objects with the given `path` and/or `name`."""
+        mask: Iterable = [True] * len(self)
+        if path is not None:
+            code = self._codes.get(path, -1)
+            mask = map(code.__eq__, self.path_codes)
+        if name is not None:
+            mask = map(bool.__and__, mask, map(name.__eq__, self.names))
+        return self.take(compress(range(len(self)), mask))
+
+    def take(self, indices: Iterable[int]) -> "ColumnarTmconf":
+        """Return the objects at `indices`, which share `paths` with this instance."""
+        indices = list(indices)
+        return ColumnarTmconf(
+            self.paths,
+            array("i", map(self.path_codes.__getitem__, indices)),
+            list(map(self.names.__getitem__, indices)),
+            list(map(self.objects.__getitem__, indices)),
+        )
+
+    def to_pydict(self) -> Dict[str, list]:
+        """Return the columns path, name and object as lists."""
+        return {
+            "path": list(map(self.paths.__getitem__, self.path_codes)),
+            "name": list(self.names),
+            "object": list(self.objects),
+        }
+
+    def to_arrow(self):
+        """
+        Return the columns as `pyarrow.Table`, path as dictionary array and object as JSON string.
+
+        Requires pyarrow, use `to_pydict` without it.
+        """
+        try:
+            import pyarrow  # pylint: disable=import-outside-toplevel
+        except ModuleNotFoundError as error:
+            raise ModuleNotFoundError(
+                "Exporting to Arrow requires pyarrow, install it with: pip install pyarrow"
+            ) from error
+        return pyarrow.table(
+            {
+                "path": pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.array(self.path_codes, type=pyarrow.int32()),
+                    pyarrow.array(self.paths, type=pyarrow.string()),
+                ),
+                "name": pyarrow.array(self.names, type=pyarrow.string()),
+                "object": pyarrow.array(
+                    [json.dumps(obj) for obj in self.objects], type=pyarrow.string()
+                ),
+            }
+        )
+
+    def to_parquet(self, where, **kwargs) -> None:
+        """Write the columns to the Parquet file `where`, keyword arguments are passed to `pyarrow.parquet.write_table`. Requires pyarrow."""
+        table = self.to_arrow()
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+
+        pyarrow.parquet.write_table(table, where, **kwargs)